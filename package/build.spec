@@ -6,11 +6,11 @@ if is_win:
 
 elif is_darwin:
     icons = ['../src/icons/logo.icns']
-    datas = [('../src/circos', 'circos'), ('../src/icons/alogo.icns', '.')]
+    datas = [('../src/circos', 'circos'), ('../src/circosd.pl', '.'), ('../src/icons/alogo.icns', '.')]
 
 else:
     icons = ['../src/icons/logo.ico']
-    datas = [('../src/circos', 'circos')]
+    datas = [('../src/circos', 'circos'), ('../src/circosd.pl', '.')]
 
 a = Analysis(
     ['../src/main.py'],
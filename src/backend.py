@@ -1,3 +1,7 @@
+import os
+import glob
+import uuid
+
 import apsw
 from PySide6.QtCore import *
 #import threading
@@ -6,6 +10,7 @@ __all__ = [
 	'SqlTable',
 	'SqlQuery',
 	'SqlBase',
+	'JobJournal',
 	'KaryotypeTable',
 	'GenomeTable',
 	'SqlControl',
@@ -14,7 +19,7 @@ __all__ = [
 from utils import *
 
 class SqlTable:
-	types = {int: 'INTEGER', float: 'REAL', str: 'TEXT'}
+	types = {int: 'INTEGER', float: 'REAL', str: 'TEXT', bytes: 'BLOB'}
 
 	def __setattr__(cls, name, val):
 		super().__setattr__(name, val)
@@ -64,6 +69,62 @@ class DataTable(SqlTable):
 	type = str
 	meta = str
 
+class CatalogTable(SqlTable):
+	_index = False
+	name = str
+	type = str
+	rows = int
+	version = int
+	stats = str
+
+class BasecountTable(SqlTable):
+	_index = False
+	genome = int
+	chrom = str
+	symbol = str
+	block = int
+	length = int
+	counts = bytes
+
+class GeneindexTable(SqlTable):
+	_index = False
+	annotation = int
+	feature = str
+	attribute = str
+	gene = str
+	chrom = str
+	start = int
+	end = int
+
+#tables of job journal, not created in project
+class JobTable(SqlTable):
+	_index = True
+	worker = str
+	params = str
+	datas = str
+
+class CheckpointTable(SqlTable):
+	_index = True
+	chunk = str
+	marks = str
+	state = bytes
+
+class RendercacheTable(SqlTable):
+	_index = False
+	key = str
+	svg = str
+
+class OptionTable(SqlTable):
+	_index = False
+	name = str
+	value = str
+
+class WorkspaceTable(SqlTable):
+	_index = False
+	name = str
+	stamp = str
+	file = str
+
 class ColorTable(SqlTable):
 	_index = False
 	name = str
@@ -234,6 +295,7 @@ class SqlQuery:
 		self._creates = []
 		self._and_wheres = []
 		self._or_wheres = []
+		self._group_bys = []
 		self._order_bys = []
 		self._order_asc = True
 		self._limit = []
@@ -283,6 +345,10 @@ class SqlQuery:
 
 		return self
 
+	def groupby(self, *args):
+		self._group_bys.extend(args)
+		return self
+
 	def orderby(self, *args, asc=True):
 		self._order_bys.extend(args)
 		self._order_asc = asc
@@ -350,6 +416,9 @@ class SqlQuery:
 
 				self.__add(' OR '.join(self._or_wheres))
 
+		if self._group_bys:
+			self.__add("GROUP BY {}".format(','.join(self._group_bys)))
+
 		if self._order_bys:
 			if self._order_asc:
 				self.__add("ORDER BY {}".format(','.join(self._order_bys)))
@@ -384,16 +453,23 @@ class DataBackend:
 		if self.conn is not None:
 			self.conn.close()
 
+		self.file = file
 		self.conn = apsw.Connection(file)
 		self.create_tables()
 		self._optimize()
 
 	def reconnect(self, file):
 		_conn = self.conn
+		self.file = file
 		self.conn = apsw.Connection(file)
 		_conn.close()
+		self.create_tables()
 		self._optimize()
 
+	@property
+	def in_memory(self):
+		return self.file == ':memory:'
+
 	@property
 	def cursor(self):
 		#with self.lock:
@@ -431,6 +507,10 @@ class DataBackend:
 	def update_row(self, sql, *args):
 		self.query(sql, args)
 
+	def update_rows(self, sql, rows):
+		with self.conn:
+			self.cursor.executemany(str(sql), rows)
+
 	def delete_row(self, sql, *args):
 		self.query(sql, args)
 
@@ -517,6 +597,138 @@ class DataBackend:
 
 SqlBase = DataBackend()
 
+class JobJournal(DataBackend):
+	#each resumable job keeps a journal file in the jobs folder next to
+	#project, results and checkpoints are committed into the journal so
+	#that a running job never commits unsaved changes of project
+	def __init__(self, file):
+		self.connect(file)
+
+	def _optimize(self):
+		self.query("BEGIN")
+
+	def save(self):
+		self.commit()
+		self.begin()
+
+	def create_tables(self):
+		for model in (JobTable, CheckpointTable):
+			self.create_table(*model.table())
+
+	@staticmethod
+	def get_folder(project):
+		return '{}.jobs'.format(project)
+
+	@classmethod
+	def create(cls, project):
+		folder = cls.get_folder(project)
+		os.makedirs(folder, exist_ok=True)
+		return cls(os.path.join(folder, '{}.job'.format(uuid.uuid4().hex)))
+
+	@classmethod
+	def get_journals(cls, project):
+		folder = cls.get_folder(project)
+
+		if not os.path.isdir(folder):
+			return []
+
+		return sorted(glob.glob(os.path.join(folder, '*.job')), key=os.path.getmtime)
+
+	def remove(self):
+		self.conn.close()
+		self.conn = None
+
+		if os.path.exists(self.file):
+			os.remove(self.file)
+
+	def set_job(self, worker, params, datas):
+		sql = SqlQuery('job')\
+			.insert('worker', 'params', 'datas')
+
+		self.insert_row(sql, worker, params, dict_to_str(datas))
+
+	def get_job(self):
+		sql = SqlQuery('job')\
+			.select()\
+			.first()
+
+		res = self.get_dict(sql)
+
+		if res:
+			res.datas = str_to_dict(res.datas)
+
+		return res
+
+	def update_datas(self, datas):
+		sql = SqlQuery('job')\
+			.update('datas')
+
+		self.update_row(sql, dict_to_str(datas))
+
+	def add_checkpoint(self, chunk, marks, state=None):
+		#only the state of last checkpoint is needed to resume
+		sql = SqlQuery('checkpoint')\
+			.update('state')
+
+		self.update_row(sql, None)
+
+		sql = SqlQuery('checkpoint')\
+			.insert('chunk', 'marks', 'state')
+
+		self.insert_row(sql, chunk, dict_to_str(marks), state)
+
+	def get_checkpoints(self):
+		#return finished chunks, row marks and state of the last checkpoint
+		sql = SqlQuery('checkpoint')\
+			.select('chunk', 'marks', 'state')\
+			.orderby('id')
+
+		chunks = []
+		marks = {}
+		state = None
+		for chunk, mark, state in self.get_rows(sql):
+			chunks.append(chunk)
+			marks = str_to_dict(mark)
+
+		return chunks, marks, state
+
+	def get_last_rowid(self, table):
+		sql = SqlQuery(table)\
+			.select('MAX(id)')
+
+		return self.get_one(sql) or 0
+
+	def truncate_index_data(self, table, rowid):
+		sql = SqlQuery(table)\
+			.delete()\
+			.where('id>?')
+
+		self.delete_row(sql, rowid)
+
+	def create_index_table(self, type, index):
+		model = SqlControl._models.get(type)
+		self.create_table(*model.table(index))
+
+	def rename_index_table(self, type, index, new):
+		self.query("ALTER TABLE {0}_{1} RENAME TO {0}_{2}".format(type, index, new))
+
+	def add_index_data(self, type, index, rows):
+		model = SqlControl._models.get(type)
+		table, _ = model.table(index)
+		sql = SqlQuery(table)\
+			.insert(*model.fields())
+
+		self.insert_rows(sql, rows)
+
+	def get_index_data(self, type, index):
+		model = SqlControl._models.get(type)
+		table, _ = model.table(index)
+		sql = SqlQuery(table)\
+			.select(*model.fields())\
+			.orderby('id')
+
+		return self.get_rows(sql)
+
 class SqlControl:
 	_models = {
 		'genome': GenomeTable,
@@ -584,6 +796,414 @@ class SqlControl:
 
 		SqlBase.update_row(sql, mdata, did)
 
+	@staticmethod
+	def calc_data_stats(type, table, bins=10):
+		model = SqlControl._models.get(type)
+
+		sql = SqlQuery(table)\
+			.select('COUNT(1)')
+		rows = SqlBase.get_one(sql)
+
+		stats = {'fields': {}, 'chroms': [], 'features': []}
+
+		for field, ftype in zip(model.fields(), model.ftypes()):
+			if ftype not in [int, float]:
+				continue
+
+			#imported header lines and NA values are kept as text
+			numeric = "typeof({}) IN ('integer','real')".format(field)
+
+			sql = SqlQuery(table)\
+				.select(*[
+					"{}({})".format(func, field)
+					for func in ['MIN', 'MAX', 'AVG', 'SUM', 'COUNT']
+				])\
+				.where(numeric)
+			vmin, vmax, vmean, vsum, count = SqlBase.get_row(sql)
+
+			if not isinstance(vmin, (int, float)) or not isinstance(vmax, (int, float)):
+				continue
+
+			hist = [0] * bins
+			span = vmax - vmin
+
+			if span > 0:
+				sql = SqlQuery(table)\
+					.select("MIN(CAST(({0}-?)*{1}/? AS INTEGER),{2})".format(field, bins, bins-1), 'COUNT(1)')\
+					.where(numeric)\
+					.groupby('1')
+
+				for b, c in SqlBase.get_rows(sql, vmin, span):
+					if b is not None:
+						hist[b] = c
+			else:
+				hist[0] = count
+
+			stats['fields'][field] = {
+				'min': vmin,
+				'max': vmax,
+				'mean': vmean,
+				'sum': vsum,
+				'hist': hist
+			}
+
+		chroms = []
+		for field in ['chrom', 'chrid', 'chr1', 'chr2', 'contig']:
+			if field not in model.fields():
+				continue
+
+			sql = SqlQuery(table)\
+				.select("DISTINCT {}".format(field))
+
+			for chrom in SqlBase.get_column(sql):
+				if chrom not in chroms:
+					chroms.append(chrom)
+
+		stats['chroms'] = chroms
+
+		if 'feature' in model.fields():
+			sql = SqlQuery(table)\
+				.select("DISTINCT feature")
+			stats['features'] = SqlBase.get_column(sql)
+
+		return rows, stats
+
+	@staticmethod
+	def update_data_catalog(type, index, bins=10):
+		table = '{}_{}'.format(type, index)
+		model = SqlControl._models.get(type)
+
+		if model is None or not SqlBase.has_table(table):
+			return
+
+		rows, stats = SqlControl.calc_data_stats(type, table, bins)
+
+		sql = SqlQuery('catalog')\
+			.select('version')\
+			.where('name=?')
+		version = SqlBase.get_one(sql, table)
+
+		if version is None:
+			sql = SqlQuery('catalog')\
+				.insert('name', 'type', 'rows', 'version', 'stats')
+			SqlBase.insert_row(sql, table, type, rows,
+				SqlControl.next_data_version(), dict_to_str(stats))
+
+		else:
+			sql = SqlQuery('catalog')\
+				.update('rows', 'version', 'stats')\
+				.where('name=?')
+			SqlBase.update_row(sql, rows, SqlControl.next_data_version(),
+				dict_to_str(stats), table)
+
+	@staticmethod
+	def add_data_catalog(type, index):
+		#catalog without stats, they are computed on request
+		table = '{}_{}'.format(type, index)
+
+		if type not in SqlControl._models or not SqlBase.has_table(table):
+			return
+
+		sql = SqlQuery(table)\
+			.select('COUNT(1)')
+		rows = SqlBase.get_one(sql)
+
+		sql = SqlQuery('catalog')\
+			.insert('name', 'type', 'rows', 'version', 'stats')
+		SqlBase.insert_row(sql, table, type, rows, SqlControl.next_data_version(), None)
+
+	@staticmethod
+	def next_data_version():
+		#versions are unique across all datasets and never reused, so a
+		#table recreated with the id of a deleted one gets a new version
+		version = SqlControl.get_option('version')
+
+		if version is None:
+			sql = SqlQuery('catalog')\
+				.select('MAX(version)')
+			version = SqlBase.get_one(sql) or 0
+
+		version = int(version) + 1
+		SqlControl.set_option('version', str(version))
+		return version
+
+	@staticmethod
+	def get_data_catalog(table):
+		sql = SqlQuery('catalog')\
+			.select()\
+			.where('name=?')
+
+		res = SqlBase.get_dict(sql, table)
+
+		if not res:
+			return res
+
+		#stale stats are only recomputed on request by refresh_data_stats
+		res.stats = str_to_dict(res.stats) if res.stats else {'stale': True}
+
+		return res
+
+	@staticmethod
+	def refresh_data_stats(table, bins=10):
+		catalog = SqlControl.get_data_catalog(table)
+
+		if not catalog or not catalog.stats.get('stale'):
+			return catalog
+
+		if not SqlBase.has_table(table):
+			return catalog
+
+		#rows are unchanged, so the version is kept
+		catalog.rows, catalog.stats = SqlControl.calc_data_stats(catalog.type, table, bins)
+
+		sql = SqlQuery('catalog')\
+			.update('rows', 'stats')\
+			.where('name=?')
+		SqlBase.update_row(sql, catalog.rows, dict_to_str(catalog.stats), table)
+
+		return catalog
+
+	@staticmethod
+	def get_data_count(table):
+		sql = SqlQuery('catalog')\
+			.select('rows')\
+			.where('name=?')
+
+		res = SqlBase.get_one(sql, table)
+
+		if res is None:
+			sql = SqlQuery(table)\
+				.select('COUNT(1)')
+			res = SqlBase.get_one(sql)
+
+		return res
+
+	@staticmethod
+	def change_data_count(table, num):
+		sql = SqlQuery('catalog')\
+			.select('rows', 'version')\
+			.where('name=?')
+
+		res = SqlBase.get_row(sql, table)
+
+		if res:
+			sql = SqlQuery('catalog')\
+				.update('rows', 'version')\
+				.where('name=?')
+			SqlBase.update_row(sql, res[0]+num, SqlControl.next_data_version(), table)
+
+		#removed rows change the stats, they are kept until refreshed
+		if res and num:
+			SqlControl.mark_data_stale(table)
+
+	@staticmethod
+	def mark_data_stale(table):
+		sql = SqlQuery('catalog')\
+			.select('stats')\
+			.where('name=?')
+		stats = SqlBase.get_one(sql, table)
+
+		if not stats:
+			return
+
+		stats = str_to_dict(stats)
+
+		if stats.get('stale'):
+			return
+
+		stats['stale'] = True
+
+		sql = SqlQuery('catalog')\
+			.update('stats')\
+			.where('name=?')
+		SqlBase.update_row(sql, dict_to_str(stats), table)
+
+	@staticmethod
+	def touch_data_catalog(table):
+		SqlControl.change_data_count(table, 0)
+
+	@staticmethod
+	def remove_data_catalog(table):
+		sql = SqlQuery('catalog')\
+			.delete()\
+			.where('name=?')
+
+		SqlBase.delete_row(sql, table)
+
+	@staticmethod
+	def get_basecounts(genome, block):
+		sql = SqlQuery('basecount')\
+			.select('chrom', 'symbol', 'length', 'counts')\
+			.where('genome=?', 'block=?')
+
+		caches = {}
+		for chrom, symbol, length, counts in SqlBase.get_rows(sql, genome, block):
+			caches.setdefault(chrom, (length, {}))[1][symbol] = counts
+
+		return caches
+
+	@staticmethod
+	def add_basecounts(genome, chrom, block, length, counts):
+		#replace counts of a chromosome built before new symbols were added
+		sql = SqlQuery('basecount')\
+			.delete()\
+			.where('genome=?', 'chrom=?', 'block=?')
+
+		SqlBase.delete_row(sql, genome, chrom, block)
+
+		sql = SqlQuery('basecount')\
+			.insert('genome', 'chrom', 'symbol', 'block', 'length', 'counts')
+
+		rows = [
+			(genome, chrom, symbol, block, length, blob)
+			for symbol, blob in counts.items()
+		]
+		SqlBase.insert_rows(sql, rows)
+
+	@staticmethod
+	def remove_basecounts(genome):
+		sql = SqlQuery('basecount')\
+			.delete()\
+			.where('genome=?')
+
+		SqlBase.delete_row(sql, genome)
+
+	@staticmethod
+	def has_gene_index(annotation, feature, attribute):
+		sql = SqlQuery('geneindex')\
+			.select('1')\
+			.where('annotation=?', 'feature=?', 'attribute=?')\
+			.first()
+
+		return SqlBase.get_one(sql, annotation, feature, attribute) is not None
+
+	@staticmethod
+	def get_gene_index(annotation, feature, attribute):
+		sql = SqlQuery('geneindex')\
+			.select('gene', 'chrom', 'start', 'end')\
+			.where('annotation=?', 'feature=?', 'attribute=?', 'gene IS NOT NULL')
+
+		return list(SqlBase.get_rows(sql, annotation, feature, attribute))
+
+	@staticmethod
+	def add_gene_index(annotation, feature, attribute, genes):
+		SqlBase.query("CREATE INDEX IF NOT EXISTS geneindex_annotation ON geneindex (annotation)")
+
+		sql = SqlQuery('geneindex')\
+			.insert('annotation', 'feature', 'attribute', 'gene', 'chrom', 'start', 'end')
+
+		rows = [(annotation, feature, attribute, *gene) for gene in genes]
+
+		#empty marker row, annotation has no matched genes
+		if not rows:
+			rows.append((annotation, feature, attribute, None, None, None, None))
+
+		SqlBase.insert_rows(sql, rows)
+
+	@staticmethod
+	def remove_gene_index(annotation):
+		sql = SqlQuery('geneindex')\
+			.delete()\
+			.where('annotation=?')
+
+		SqlBase.delete_row(sql, annotation)
+
+	@staticmethod
+	def get_render_cache(key):
+		sql = SqlQuery('rendercache')\
+			.select('svg')\
+			.where('key=?')\
+			.first()
+
+		return SqlBase.get_one(sql, key)
+
+	@staticmethod
+	def add_render_cache(key, svg, keep=10):
+		sql = SqlQuery('rendercache')\
+			.insert('key', 'svg')
+		SqlBase.insert_row(sql, key, svg)
+
+		#only keep the latest rendered plots
+		sql = SqlQuery('rendercache')\
+			.delete()\
+			.where('id<=?')
+		SqlBase.delete_row(sql, SqlControl.get_last_rowid('rendercache') - keep)
+
+	@staticmethod
+	def get_option(name):
+		sql = SqlQuery('option')\
+			.select('value')\
+			.where('name=?')
+
+		return SqlBase.get_one(sql, name)
+
+	@staticmethod
+	def set_option(name, value):
+		sql = SqlQuery('option')\
+			.delete()\
+			.where('name=?')
+		SqlBase.delete_row(sql, name)
+
+		sql = SqlQuery('option')\
+			.insert('name', 'value')
+		SqlBase.insert_row(sql, name, value)
+
+	@staticmethod
+	def get_workspace_file(name):
+		sql = SqlQuery('workspace')\
+			.select('stamp', 'file')\
+			.where('name=?')
+
+		return SqlBase.get_row(sql, name)
+
+	@staticmethod
+	def set_workspace_file(name, stamp, file):
+		sql = SqlQuery('workspace')\
+			.delete()\
+			.where('name=?')
+		SqlBase.delete_row(sql, name)
+
+		sql = SqlQuery('workspace')\
+			.insert('name', 'stamp', 'file')
+		SqlBase.insert_row(sql, name, stamp, file)
+
+	@staticmethod
+	def remove_workspace_files(table):
+		#remove exported files made from table, names are tables joined
+		#by + with an optional @plot type suffix
+		sql = SqlQuery('workspace')\
+			.select('name', 'file')
+
+		removed = []
+		for name, file in list(SqlBase.get_rows(sql)):
+			if table in name.split('@')[0].split('+'):
+				removed.append((name, file))
+
+		sql = SqlQuery('workspace')\
+			.delete()\
+			.where('name=?')
+
+		for name, _ in removed:
+			SqlBase.delete_row(sql, name)
+
+		return [file for _, file in removed]
+
+	@staticmethod
+	def get_last_rowid(table):
+		sql = SqlQuery(table)\
+			.select('MAX(id)')
+
+		return SqlBase.get_one(sql) or 0
+
+	@staticmethod
+	def truncate_index_data(table, rowid=0):
+		#remove rows written after a checkpoint
+		sql = SqlQuery(table)\
+			.delete()\
+			.where('id>?')
+
+		SqlBase.delete_row(sql, rowid)
+
 	@staticmethod
 	def get_field_types(table):
 		model = SqlControl._models.get(table)
@@ -611,6 +1231,7 @@ class SqlControl:
 			.update('options')\
 			.where(filters)
 		SqlBase.update_row(sql, options)
+		SqlControl.touch_data_catalog(table)
 
 		sql = SqlQuery(table)\
 			.select("COUNT(1)")\
@@ -630,6 +1251,7 @@ class SqlControl:
 		sql = SqlQuery(table)\
 			.update('options')
 		SqlBase.update_row(sql, '')
+		SqlControl.touch_data_catalog(table)
 
 	@staticmethod
 	def add_custom_colors(colors):
@@ -657,6 +1279,7 @@ class SqlControl:
 			.where('id=?')
 
 		SqlBase.update_row(sql, name, kid)
+		SqlControl.touch_data_catalog(table)
 
 	@staticmethod
 	def update_karyotype_color(index, kid, color):
@@ -666,6 +1289,16 @@ class SqlControl:
 			.where('id=?')
 
 		SqlBase.update_row(sql, color, kid)
+		SqlControl.touch_data_catalog(table)
+
+	@staticmethod
+	def update_karyotype_colors(table, colors):
+		sql = SqlQuery(table)\
+			.update('color')\
+			.where('id=?')
+
+		SqlBase.update_rows(sql, colors)
+		SqlControl.touch_data_catalog(table)
 
 	@staticmethod
 	def get_data_by_id(did):
@@ -694,6 +1327,49 @@ class SqlControl:
 
 		return SqlBase.get_rows(sql)
 
+	@staticmethod
+	def get_circos_lines(type, index):
+		#let sqlite format each row as a space separated line
+		table = '{}_{}'.format(type, index)
+		fields = SqlBase.get_fields(table)
+		fields = ["IFNULL({},'')".format(f) for f in fields[1:]]
+		line = "{}||char(10)".format("||' '||".join(fields))
+
+		sql = SqlQuery(table)\
+			.select(line)
+
+		for row in SqlBase.get_rows(sql):
+			yield row[0]
+
+	@staticmethod
+	def get_sorted_content(type, index):
+		table = '{}_{}'.format(type, index)
+		fields = SqlBase.get_fields(table)
+		fields = fields[1:]
+
+		sql = SqlQuery(table)\
+			.select(*fields)\
+			.orderby('chrid', 'start')
+
+		return SqlBase.get_rows(sql)
+
+	@staticmethod
+	def get_data_column(type, index, field):
+		table = '{}_{}'.format(type, index)
+		sql = SqlQuery(table)\
+			.select(field)
+
+		return SqlBase.get_column(sql)
+
+	@staticmethod
+	def get_data_first(type, index, field):
+		table = '{}_{}'.format(type, index)
+		sql = SqlQuery(table)\
+			.select(field)\
+			.first()
+
+		return SqlBase.get_one(sql)
+
 	@staticmethod
 	def get_data_objects(type, index):
 		table = '{}_{}'.format(type, index)
@@ -706,9 +1382,28 @@ class SqlControl:
 
 		return SqlBase.get_dicts(sql)
 
+	@staticmethod
+	def get_karyotype_size(index):
+		table = 'karyotype_{}'.format(index)
+
+		if not SqlBase.has_table(table):
+			return 0, 0
+
+		sql = SqlQuery(table)\
+			.select('SUM(end)', 'COUNT(1)')\
+			.where('type=?')
+
+		size, num = SqlBase.get_row(sql, 'chr')
+		return size or 0, num
+
 	@staticmethod
 	def get_annotation_features(index):
 		table = '{}_{}'.format('annotation', index)
+		catalog = SqlControl.get_data_catalog(table)
+
+		if catalog and 'features' in catalog.stats:
+			return catalog.stats['features']
+
 		sql = SqlQuery(table)\
 			.select("DISTINCT feature")
 
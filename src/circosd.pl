@@ -0,0 +1,96 @@
+#!/usr/bin/env perl
+#long lived circos render server used by circhart
+#usage: perl circosd.pl <circos_dir>
+#
+#circos modules are loaded once at startup, each render job is run in a
+#forked child so that jobs never share the global state of circos.
+#protocol over stdin/stdout, one job per line:
+#  -> <job> <workdir>
+#  <- done <job> <status>
+#the child renders workdir/plot.conf into workdir/circos.svg and writes
+#its output to workdir/circos.out and workdir/circos.err
+
+use strict;
+use warnings;
+
+my $circos;
+
+BEGIN {
+	$circos = shift @ARGV or die "usage: circosd.pl <circos_dir>\n";
+	#circos locates its etc and fonts relative to the script path
+	$0 = "$circos/bin/circos";
+}
+
+use FindBin;
+use lib "$circos/bin";
+use lib "$circos/lib";
+use IO::Handle;
+use IO::Select;
+use POSIX qw(:sys_wait_h);
+use Circos;
+
+STDOUT->autoflush(1);
+print "ready\n";
+
+my %jobs;
+my $buffer = '';
+my $closed = 0;
+my $select = IO::Select->new(\*STDIN);
+
+sub render {
+	my ($job, $workdir) = @_;
+	my $pid = fork();
+
+	if (!defined $pid) {
+		print "done $job 255\n";
+		return;
+	}
+
+	if ($pid == 0) {
+		chdir $workdir or POSIX::_exit(2);
+		open STDOUT, '>', 'circos.out' or POSIX::_exit(3);
+		open STDERR, '>', 'circos.err' or POSIX::_exit(3);
+
+		@ARGV = ('-conf', 'plot.conf', '-nopng', '-file', 'circos.svg');
+		do "$circos/bin/circos";
+
+		if ($@) {
+			print STDERR $@;
+			POSIX::_exit(1);
+		}
+
+		STDOUT->flush();
+		STDERR->flush();
+		POSIX::_exit(0);
+	}
+
+	$jobs{$pid} = $job;
+}
+
+while (!$closed || %jobs) {
+	while ((my $pid = waitpid(-1, WNOHANG)) > 0) {
+		my $job = delete $jobs{$pid};
+		print "done $job ", $? >> 8, "\n" if defined $job;
+	}
+
+	if ($closed) {
+		select(undef, undef, undef, 0.05);
+		next;
+	}
+
+	next unless $select->can_read(0.05);
+
+	my $n = sysread(STDIN, $buffer, 65536, length($buffer));
+
+	#client went away, finish running jobs and quit
+	if (!$n) {
+		$closed = 1;
+		$select->remove(\*STDIN);
+		next;
+	}
+
+	while ($buffer =~ s/^(.*?)\n//) {
+		my ($job, $workdir) = split / /, $1, 2;
+		render($job, $workdir) if defined $workdir;
+	}
+}
@@ -0,0 +1,477 @@
+import bisect
+
+import numpy as np
+
+from config import CIRCOS_IMAGE_RADIUS
+
+__all__ = [
+	'make_genome_windows',
+	'match_symbol',
+	'count_window_bases',
+	'BASECOUNT_BLOCK',
+	'BASECOUNT_SYMBOLS',
+	'count_block_bases',
+	'count_window_blocks',
+	'pack_block_counts',
+	'unpack_block_counts',
+	'count_window_features',
+	'merge_intervals',
+	'find_base_runs',
+	'calc_window_coverage',
+	'calc_gc_content',
+	'calc_gc_skew',
+	'calc_at_skew',
+	'calc_repeat_fraction',
+	'COMPOSITION_METRICS',
+	'get_composition_symbols',
+	'calc_composition_metrics',
+	'make_window_rows',
+	'calc_track_pixels',
+	'calc_label_slot',
+	'calc_auto_window',
+	'thin_labels',
+	'calc_pixel_width',
+	'decimate_line',
+	'decimate_histogram',
+	'decimate_scatter',
+	'decimate_track_rows',
+	'make_window_bins',
+	'find_bins',
+	'split_bin_intervals',
+	'sum_window_bins',
+	'calc_weighted_median',
+	'calc_window_depth',
+]
+
+SOFTMASK_BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+
+def make_genome_windows(size, window, step):
+	#0-based starts and end-exclusive ends, stop at the first window reaching end
+	starts = np.arange(0, size, step, dtype=np.int64)
+	ends = np.minimum(starts + window, size)
+
+	idx = np.flatnonzero(ends == size)
+
+	if idx.size:
+		starts = starts[:idx[0]+1]
+		ends = ends[:idx[0]+1]
+
+	return starts, ends
+
+def match_symbol(arr, upper, symbol):
+	#bases are matched in both cases, symbol m marks soft-masked
+	#(lowercase) bases
+	if symbol == 'm':
+		return (arr >= 97) & np.isin(upper, SOFTMASK_BASES)
+
+	return upper == ord(symbol)
+
+def count_window_bases(seq, starts, ends, symbols='ACGT'):
+	#count symbols in all windows with prefix sums, one scan per symbol
+	arr = np.frombuffer(seq.encode(), dtype=np.uint8)
+	upper = arr & 0xDF
+	counts = {}
+
+	if not arr.size:
+		for s in symbols:
+			counts[s] = np.zeros(starts.size, dtype=np.int64)
+
+		return counts
+
+	#prefix sums are only needed at window boundaries
+	bounds = np.union1d(starts, ends)
+	bounds = np.union1d([0], bounds[bounds < arr.size])
+
+	sidx = np.searchsorted(bounds, starts)
+	eidx = np.searchsorted(bounds, ends)
+
+	for s in symbols:
+		segs = np.add.reduceat(match_symbol(arr, upper, s), bounds, dtype=np.int64)
+		prefix = np.concatenate(([0], np.cumsum(segs)))
+		counts[s] = prefix[eidx] - prefix[sidx]
+
+	return counts
+
+#genome base counts are cached in blocks of this size
+BASECOUNT_BLOCK = 1000
+BASECOUNT_SYMBOLS = 'ACGTm'
+
+def count_block_bases(seq, symbols=BASECOUNT_SYMBOLS, block=BASECOUNT_BLOCK):
+	#count symbols in consecutive fixed size blocks
+	arr = np.frombuffer(seq.encode(), dtype=np.uint8)
+	upper = arr & 0xDF
+	bounds = np.arange(0, arr.size, block)
+	counts = {}
+
+	for s in symbols:
+		if bounds.size:
+			counts[s] = np.add.reduceat(match_symbol(arr, upper, s), bounds, dtype=np.int64)
+		else:
+			counts[s] = np.zeros(0, dtype=np.int64)
+
+	return counts
+
+def count_window_blocks(blocks, length, starts, ends, symbols, block=BASECOUNT_BLOCK):
+	#count symbols in windows from block counts, return None if windows
+	#do not start and end on block boundaries or beyond sequence length
+	bounds = np.concatenate((starts, ends))
+
+	if not np.all((bounds % block == 0) | (bounds >= length)):
+		return None
+
+	nblock = -(-length // block)
+	sidx = np.where(starts >= length, nblock, starts // block)
+	eidx = np.where(ends >= length, nblock, ends // block)
+
+	counts = {}
+	for s in symbols:
+		prefix = np.concatenate(([0], np.cumsum(blocks[s], dtype=np.int64)))
+		counts[s] = prefix[eidx] - prefix[sidx]
+
+	return counts
+
+def pack_block_counts(counts):
+	return {s: c.astype('<u2').tobytes() for s, c in counts.items()}
+
+def unpack_block_counts(blobs):
+	return {s: np.frombuffer(b, dtype='<u2') for s, b in blobs.items()}
+
+def count_window_features(starts, ends, fstarts, fends):
+	#count features overlapping each window (start+1, end), use the same
+	#test as interval overlap query: fstart < end and fend > start+1
+	#window starts and ends are both ascending, so each feature
+	#overlaps a contiguous run of windows [lo, hi)
+	lo = np.searchsorted(ends, fstarts, 'right')
+	hi = np.searchsorted(starts + 1, fends, 'left')
+	hit = hi > lo
+
+	num = starts.size + 1
+	diff = np.bincount(lo[hit], minlength=num) - np.bincount(hi[hit], minlength=num)
+	return np.cumsum(diff[:-1])
+
+def merge_intervals(fstarts, fends):
+	#merge overlapping or adjacent half-open intervals
+	keep = fends > fstarts
+	fstarts = fstarts[keep]
+	fends = fends[keep]
+
+	if not fstarts.size:
+		return fstarts, fends
+
+	order = np.argsort(fstarts, kind='stable')
+	fstarts = fstarts[order]
+	fends = np.maximum.accumulate(fends[order])
+
+	#a new interval begins where start exceeds all previous ends
+	heads = np.flatnonzero(np.concatenate(([True], fstarts[1:] > fends[:-1])))
+	tails = np.concatenate((heads[1:] - 1, [fstarts.size - 1]))
+	return fstarts[heads], fends[tails]
+
+def find_base_runs(seq, symbols='Nn', minlen=1):
+	#0-based half-open runs of symbols not shorter than minlen
+	arr = np.frombuffer(seq.encode(), dtype=np.uint8)
+	hit = np.isin(arr, np.frombuffer(symbols.encode(), dtype=np.uint8))
+
+	edges = np.diff(np.concatenate(([0], hit.view(np.int8), [0])))
+	starts = np.flatnonzero(edges == 1)
+	ends = np.flatnonzero(edges == -1)
+
+	keep = ends - starts >= minlen
+	return starts[keep], ends[keep]
+
+def calc_window_coverage(starts, ends, fstarts, fends):
+	#fraction of each window covered by merged 0-based half-open features
+	mstarts, mends = merge_intervals(fstarts, fends)
+	cumlen = np.concatenate(([0], np.cumsum(mends - mstarts)))
+
+	def covered(pos):
+		#covered bases in [0, pos)
+		idx = np.searchsorted(mstarts, pos, 'right')
+		bases = cumlen[idx]
+
+		if mends.size:
+			over = np.where(idx > 0, mends[idx-1] - pos, 0)
+			bases = bases - np.maximum(over, 0)
+
+		return bases
+
+	sizes = ends - starts
+	values = np.zeros(sizes.size, dtype=np.float64)
+	np.divide(covered(ends) - covered(starts), sizes, out=values, where=sizes > 0)
+	return values
+
+def calc_gc_content(counts):
+	gc = counts['G'] + counts['C']
+	total = gc + counts['A'] + counts['T']
+	values = np.zeros(gc.size, dtype=np.float64)
+	np.divide(gc, total, out=values, where=gc > 0)
+	return values
+
+def calc_gc_skew(counts):
+	g = counts['G']
+	c = counts['C']
+	gc = g + c
+	values = np.zeros(gc.size, dtype=np.float64)
+	np.divide(g - c, gc, out=values, where=gc > 0)
+	return values
+
+def calc_at_skew(counts):
+	a = counts['A']
+	t = counts['T']
+	at = a + t
+	values = np.zeros(at.size, dtype=np.float64)
+	np.divide(a - t, at, out=values, where=at > 0)
+	return values
+
+def calc_repeat_fraction(counts):
+	masked = counts['m']
+	total = counts['A'] + counts['C'] + counts['G'] + counts['T']
+	values = np.zeros(total.size, dtype=np.float64)
+	np.divide(masked, total, out=values, where=total > 0)
+	return values
+
+#metric -> (label, counted symbols, function, cumulative along chromosome)
+COMPOSITION_METRICS = {
+	'gc': ('GC content', 'ACGT', calc_gc_content, False),
+	'gcskew': ('GC skew', 'GC', calc_gc_skew, False),
+	'atskew': ('AT skew', 'AT', calc_at_skew, False),
+	'cumgcskew': ('Cumulative GC skew', 'GC', calc_gc_skew, True),
+	'repeat': ('Repeat fraction (soft-masked)', 'ACGTm', calc_repeat_fraction, False),
+}
+
+def get_composition_symbols(metrics):
+	symbols = set()
+
+	for metric in metrics:
+		symbols.update(COMPOSITION_METRICS[metric][1])
+
+	return ''.join(sorted(symbols))
+
+def calc_composition_metrics(counts, metrics):
+	#cumulative metrics are returned per window and summed by caller
+	return {
+		metric: COMPOSITION_METRICS[metric][2](counts)
+		for metric in metrics
+	}
+
+def make_window_rows(chrid, starts, ends, values):
+	return [
+		(chrid, s+1, e, v, '')
+		for s, e, v in zip(starts.tolist(), ends.tolist(), values.tolist())
+	]
+
+def calc_track_pixels(chrom_num, radius, spacing=0.005):
+	#arc length in pixels of ideograms at track radius, ideogram gaps
+	#take spacing of the circumference for each chromosome
+	circle = 2 * np.pi * radius * CIRCOS_IMAGE_RADIUS
+	return circle * max(1 - spacing * chrom_num, 0.1)
+
+def calc_label_slot(genome_size, chrom_num, radius, size, padding=0.5):
+	#genomic span in bp taken by one label of size pixels at track radius
+	pixels = calc_track_pixels(chrom_num, radius)
+	return max(int(np.ceil(genome_size / pixels * size * (1 + padding))), 1)
+
+def calc_auto_window(genome_size, chrom_num, radius, density=2):
+	#window giving about density points per pixel of track arc,
+	#rounded to 1, 2 or 5 times a power of ten
+	window = genome_size / (calc_track_pixels(chrom_num, radius) * density)
+
+	if window <= 1:
+		return 1
+
+	base = 10 ** int(np.floor(np.log10(window)))
+
+	for n in (1, 2, 5, 10):
+		if window <= n * base * 1.5:
+			return int(n * base)
+
+	return int(10 * base)
+
+def thin_labels(mids, priorities, slot, pinned=None):
+	#greedy select labels by descending priority with pinned labels first,
+	#a label is kept only if no kept label lies within slot bp, return
+	#indexes of kept labels in original order
+	priorities = np.asarray(priorities, dtype=np.float64)
+
+	if pinned is None:
+		pinned = np.zeros(priorities.size, dtype=bool)
+
+	order = np.lexsort((-priorities, ~np.asarray(pinned, dtype=bool)))
+	placed = []
+	keep = []
+
+	for i in order.tolist():
+		pos = mids[i]
+		j = bisect.bisect_left(placed, pos)
+
+		if j < len(placed) and placed[j] - pos < slot:
+			continue
+
+		if j > 0 and pos - placed[j-1] < slot:
+			continue
+
+		placed.insert(j, pos)
+		keep.append(i)
+
+	keep.sort()
+	return keep
+
+def make_window_bins(size, window, step):
+	#bin edges at every window start and end, each window is made of a run
+	#of whole bins and the number of bins is bound by number of windows
+	starts, ends = make_genome_windows(size, window, step)
+	return np.unique(np.concatenate(([0, size], starts, ends)))
+
+def find_bins(edges, positions):
+	#index of bins containing 0-based positions
+	return np.searchsorted(edges, positions, 'right') - 1
+
+def split_bin_intervals(starts, ends, edges):
+	#split 0-based half-open intervals at bin edges, return bin index,
+	#piece length and source interval index of each piece
+	first = find_bins(edges, starts)
+	last = find_bins(edges, ends - 1)
+	nums = last - first + 1
+
+	idx = np.repeat(np.arange(starts.size), nums)
+	offsets = np.arange(idx.size) - np.repeat(np.cumsum(nums) - nums, nums)
+	bins = first[idx] + offsets
+
+	pstarts = np.maximum(starts[idx], edges[bins])
+	pends = np.minimum(ends[idx], edges[bins + 1])
+	return bins, pends - pstarts, idx
+
+def sum_window_bins(counts, starts, ends, edges):
+	#sum bin values in windows made of whole bins
+	sidx = np.searchsorted(edges, starts)
+	eidx = np.searchsorted(edges, ends)
+	prefix = np.concatenate(([0], np.cumsum(counts)))
+	return prefix[eidx] - prefix[sidx]
+
+def calc_weighted_median(hist):
+	#median of values weighted by number of bases, hist is {value: bases}
+	if not hist:
+		return 0
+
+	values = sorted(hist)
+	weights = np.cumsum([hist[v] for v in values])
+	i = np.searchsorted(weights, weights[-1] / 2, 'left')
+	return values[i]
+
+def calc_window_depth(size, window, step, edges, sums, covers, maxs, hists, stat):
+	#combine bin accumulators into window values, bases absent from
+	#input are taken as zero depth
+	starts, ends = make_genome_windows(size, window, step)
+	sidx = np.searchsorted(edges, starts)
+	eidx = np.searchsorted(edges, ends)
+	sizes = ends - starts
+
+	covered = sum_window_bins(covers, starts, ends, edges)
+
+	if stat == 'mean':
+		values = sum_window_bins(sums, starts, ends, edges) / sizes
+
+	elif stat == 'max':
+		idx = np.ravel(np.column_stack((sidx, eidx)))
+		values = np.maximum.reduceat(np.append(maxs, -np.inf), idx)[::2]
+		values = np.where(covered < sizes, np.maximum(values, 0), values)
+
+	else:
+		values = np.zeros(sizes.size, dtype=np.float64)
+
+		for i, (s, e) in enumerate(zip(sidx.tolist(), eidx.tolist())):
+			merged = {}
+
+			for h in hists[s:e]:
+				for v, n in h.items():
+					merged[v] = merged.get(v, 0) + n
+
+			zeros = int(sizes[i] - covered[i])
+
+			if zeros > 0:
+				merged[0] = merged.get(0, 0) + zeros
+
+			values[i] = calc_weighted_median(merged)
+
+	return starts, ends, values
+
+def calc_pixel_width(genome_size, chrom_num, radius, spacing=0.005):
+	#genomic span in bp covered by one pixel of track arc
+	pixels = calc_track_pixels(chrom_num, radius, spacing)
+	return max(int(genome_size / pixels), 1)
+
+def get_bucket_bounds(buckets):
+	#first and last index of each run of equal sorted buckets
+	bounds = np.flatnonzero(np.diff(buckets)) + 1
+	firsts = np.concatenate(([0], bounds))
+	lasts = np.concatenate((bounds, [buckets.size])) - 1
+	return firsts, lasts
+
+def decimate_line(starts, values, width):
+	#keep first, last, min and max point of each pixel bucket, points
+	#are sorted by start, return sorted indexes of kept points
+	buckets = starts // width
+	firsts, lasts = get_bucket_bounds(buckets)
+	order = np.lexsort((values, buckets))
+	keeps = np.concatenate((firsts, lasts, order[firsts], order[lasts]))
+	return np.unique(keeps)
+
+def decimate_histogram(starts, ends, values, width):
+	#merge bins of each pixel bucket into one bin with the value of
+	#largest magnitude, return indexes of kept values and merged bounds
+	buckets = starts // width
+	firsts, lasts = get_bucket_bounds(buckets)
+	order = np.lexsort((np.abs(values), buckets))
+	return order[lasts], starts[firsts], np.maximum.reduceat(ends, firsts)
+
+def decimate_scatter(starts, values, width, cap):
+	#sample points of each pixel bucket in proportion to its size to
+	#keep point density, about cap points per bucket on average, points
+	#are picked evenly by value rank including the min and max
+	total = starts.size
+	buckets = starts // width
+	firsts, lasts = get_bucket_bounds(buckets)
+	ratio = firsts.size * cap / total
+
+	if ratio >= 1:
+		return np.arange(total)
+
+	sizes = lasts - firsts + 1
+	keeps = np.ceil(sizes * ratio)
+	groups = np.repeat(np.arange(firsts.size), sizes)
+	ranks = np.arange(total) - firsts[groups]
+	slots = np.floor(ranks * keeps[groups] / sizes[groups])
+
+	selected = np.empty(total, dtype=bool)
+	selected[0] = True
+	selected[1:] = slots[1:] != slots[:-1]
+	selected[firsts] = True
+	selected[lasts] = True
+
+	order = np.lexsort((values, buckets))
+	return np.sort(order[selected])
+
+def decimate_track_rows(rows, ptype, width, cap=1):
+	#rows of one chromosome sorted by start with columns chrid, start,
+	#end, value and options, return rows at pixel resolution
+	if len(rows) < 2:
+		return rows
+
+	starts = np.array([r[1] for r in rows], dtype=np.int64)
+	values = np.array([r[3] for r in rows], dtype=np.float64)
+
+	if ptype == 'line':
+		return [rows[i] for i in decimate_line(starts, values, width)]
+
+	elif ptype == 'scatter':
+		return [rows[i] for i in decimate_scatter(starts, values, width, cap)]
+
+	elif ptype == 'histogram':
+		ends = np.array([r[2] for r in rows], dtype=np.int64)
+		peaks, starts, ends = decimate_histogram(starts, ends, values, width)
+
+		return [(rows[i][0], int(s), int(e), rows[i][3], rows[i][4])
+			for i, s, e in zip(peaks, starts, ends)]
+
+	return rows
+
@@ -19,7 +19,9 @@ __all__ = [
 	'APP_ORG_NAME',
 	'APP_ORG_DOMAIN',
 	'CIRCOS_COMMAND',
+	'CIRCOS_DAEMON',
 	'CIRCOS_PATH',
+	'CIRCOS_IMAGE_RADIUS',
 	'CIRCOS_PARAMS'
 ]
 
@@ -54,11 +56,17 @@ APP_ID = "{}.{}.{}.{}".format(APP_ORG_NAME, APP_NAME, APP_NAME, APP_VERSION)
 
 CIRCOS_PATH = ROOT_PATH / 'circos'
 
+#image radius in pixels from circos etc/image.conf
+CIRCOS_IMAGE_RADIUS = 1500
+
 if os.name == 'nt':
 	CIRCOS_COMMAND = str(CIRCOS_PATH / 'bin' / 'circos.exe')
 else:
 	CIRCOS_COMMAND = str(CIRCOS_PATH / 'bin' / 'circos')
 
+#render server script to keep circos modules loaded
+CIRCOS_DAEMON = ROOT_PATH / 'circosd.pl'
+
 file = QFile(':/plots.yml')
 file.open(QIODevice.ReadOnly | QIODevice.Text)
 stream = QTextStream(file)
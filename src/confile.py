@@ -1,7 +1,8 @@
 __all__ = ['CirchartCircosConfile']
 
 class Confile:
-	_blocks = []
+	def tag(self, name, attrs=None):
+		return Tag(self, name, attrs)
 
 	def option(self, key, value, unit=''):
 		self._blocks.append("{} = {}{}".format(key, value, unit))
@@ -10,26 +11,29 @@ class Confile:
 		self._blocks.append("<<include {}>>".format(attr))
 		self._blocks.append('')
 
+	def to_string(self):
+		return ''.join("{}\n".format(tag) for tag in self._blocks)
+
 	def save_to_file(self, cfile):
 		with open(cfile, 'w') as fw:
-			for tag in self._blocks:
-				print(tag, file=fw)
+			fw.write(self.to_string())
 
 class Tag:
-	def __init__(self, name, attrs=None):
+	def __init__(self, confile, name, attrs=None):
+		self.confile = confile
 		self.name = name
 		self.attrs = attrs
 
 	def __enter__(self):
 		if self.attrs:
-			Confile._blocks.append("<{} {}>".format(self.name, self.attrs))
+			self.confile._blocks.append("<{} {}>".format(self.name, self.attrs))
 		else:
-			Confile._blocks.append("<{}>".format(self.name))
-		Confile._blocks.append('')
+			self.confile._blocks.append("<{}>".format(self.name))
+		self.confile._blocks.append('')
 
 	def __exit__(self, *args):
-		Confile._blocks.append("</{}>".format(self.name))
-		Confile._blocks.append('')
+		self.confile._blocks.append("</{}>".format(self.name))
+		self.confile._blocks.append('')
 
 class CirchartCircosConfile(Confile):
 	def __init__(self, params):
@@ -51,17 +55,17 @@ class CirchartCircosConfile(Confile):
 		radius_params = params['radiuses']
 		karyotype_params = params['karyotypes']
 
-		with Tag('ideogram'):
+		with self.tag('ideogram'):
 			for k, v in main_params.items():
 				match k:
 					case 'spacing':
-						with Tag('spacing'):
+						with self.tag('spacing'):
 							self.option('default', v, 'r')
 
 							for ss in space_params.values():
 								s = ss['space']
 
-								with Tag('pairwise', s['pairwise']):
+								with self.tag('pairwise', s['pairwise']):
 									self.option('spacing', s['spacing'], 'r')
 
 					case 'radius':
@@ -127,12 +131,12 @@ class CirchartCircosConfile(Confile):
 		for k in ['show_ticks', 'show_tick_labels', 'chromosomes_units']:
 			self.option(k, main_params[k])
 
-		with Tag('ticks'):
+		with self.tag('ticks'):
 			for k in ['radius', 'label_multiplier', 'orientation']:
 				self.option(k, main_params[k])
 
 			for k, v in tick_params.items():
-				with Tag('tick'):
+				with self.tag('tick'):
 					for x, y in v['styles'].items():
 						match x:
 							case 'thickness' | 'size' | 'label_size' | 'label_offset':
@@ -157,22 +161,31 @@ class CirchartCircosConfile(Confile):
 
 
 	def parse_track(self, tracks, name='plot'):
-		with Tag('{}s'.format(name)):
+		with self.tag('{}s'.format(name)):
 			for track in tracks:
 				main_params = track['main']
 				rule_params = track['rules']
 				axes_params = track['axes']
 				bg_params = track['backgrounds']
 
-				with Tag(name):
+				with self.tag(name):
 					for k, v in main_params.items():
 						match k:
 							case 'data':
 								if isinstance(v, int):
-									self.option('file', 'data{}.txt'.format(v))
+									v = [v]
+
+								#decimated data is exported to separate file
+								if main_params.get('decimate') == 'yes' and \
+									main_params['type'] in ['line', 'scatter', 'histogram']:
+									self.option('file', 'data{}.{}.txt'.format('-'.join(map(str, v)), main_params['type']))
+
 								else:
 									self.option('file', 'data{}.txt'.format('-'.join(map(str, v))))
 
+							case 'decimate':
+								pass
+
 							case 'type':
 								if v == 'highlight':
 									if main_params['topmost'] == 'yes':
@@ -256,9 +269,9 @@ class CirchartCircosConfile(Confile):
 								self.option(k, v)
 
 					if rule_params:
-						with Tag('rules'):
+						with self.tag('rules'):
 							for k, v in rule_params.items():
-								with Tag('rule'):
+								with self.tag('rule'):
 									for c in v['main'].get('condition', []):
 										if c.startswith('var(chr'):
 											cl = c.split(' eq ')
@@ -282,9 +295,9 @@ class CirchartCircosConfile(Confile):
 											self.option(a, s)
 
 					if axes_params:
-						with Tag('axes'):
+						with self.tag('axes'):
 							for k, v in axes_params.items():
-								with Tag('axis'):
+								with self.tag('axis'):
 									for x, y in v['main'].items():
 										if x in ['spacing', 'position']:
 											self.option(x, y, 'r')
@@ -292,9 +305,9 @@ class CirchartCircosConfile(Confile):
 											self.option(x, y)
 
 					if bg_params:
-						with Tag('backgrounds'):
+						with self.tag('backgrounds'):
 							for k, v in bg_params.items():
-								with Tag('background'):
+								with self.tag('background'):
 									for x, y in v['main'].items():
 										if x in ['y0', 'y1']:
 											self.option(x, y, 'r')
@@ -303,7 +316,7 @@ class CirchartCircosConfile(Confile):
 
 
 	def parse(self):
-		Confile._blocks = []
+		self._blocks = []
 		self.custom_colors = []
 
 		#karyotype
@@ -349,14 +362,14 @@ class CirchartCircosConfile(Confile):
 		if highlight_tracks:
 			self.parse_track(highlight_tracks, 'highlight')
 
-		with Tag('image'):
+		with self.tag('image'):
 			self.include('etc/image.conf')
 
 		self.include('etc/colors_fonts_patterns.conf')
 		self.include('etc/housekeeping.conf')
 
 		if self.custom_colors or self.params['colors']:
-			with Tag('colors'):
+			with self.tag('colors'):
 				for i, c in enumerate(self.custom_colors):
 					self.option('cc{}'.format(i), c)
 				
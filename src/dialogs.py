@@ -8,6 +8,7 @@ from utils import *
 from config import *
 from widgets import *
 from backend import *
+from compute import *
 
 __all__ = [
 	'CirchartCircosDependencyDialog',
@@ -15,7 +16,11 @@ __all__ = [
 	'CirchartBandPrepareDialog',
 	'CirchartGCContentPrepareDialog',
 	'CirchartGCSkewPrepareDialog',
+	'CirchartCompositionPrepareDialog',
+	'CirchartGapPrepareDialog',
 	'CirchartDensityPrepareDialog',
+	'CirchartDepthPrepareDialog',
+	'CirchartVariantPrepareDialog',
 	'CirchartTextPrepareDialog',
 	'CirchartCreateCircosPlotDialog',
 	'CirchartCreateSnailPlotDialog',
@@ -272,14 +277,7 @@ class CirchartKaryotypePrepareDialog(CirchartBaseDialog):
 		if dlg.exec() == QDialog.Accepted:
 			#get chr colors from circos
 			color_file = CIRCOS_PATH / 'etc' / 'colors.ucsc.conf'
-
-			circos_colors = {}
-			with open(str(color_file)) as fh:
-				for line in fh:
-					if line.startswith('chr'):
-						cols = line.strip().split('=')
-						if ',' in cols[1]:
-							circos_colors[cols[0].strip()] = cols[1].strip()
+			circos_colors = get_circos_chrom_colors(str(color_file))
 
 			prefix = dlg.prefix_input.text().strip()
 
@@ -303,7 +301,7 @@ class CirchartKaryotypePrepareDialog(CirchartBaseDialog):
 
 						else:
 							temp_label = "chr{}".format(num)
-							color = circos_colors.get(temp_label, circos_colors['chrUn'])
+							color = circos_colors.get(temp_label, circos_colors['chrun'])
 
 					items.append(('chr', '-', chrid, label, 0, lenght, color))
 
@@ -311,6 +309,7 @@ class CirchartKaryotypePrepareDialog(CirchartBaseDialog):
 			index = SqlControl.add_data(kname, 'karyotype', '')
 			SqlControl.create_index_table('karyotype', index)
 			SqlControl.add_index_data('karyotype', index, items)
+			SqlControl.update_data_catalog('karyotype', index)
 			parent.data_tree.update_tree()
 
 class CirchartBandPrepareDialog(CirchartBaseDialog):
@@ -372,12 +371,14 @@ class CirchartGCContentPrepareDialog(CirchartBaseDialog):
 		self.select_genome = QComboBox(self)
 		self.select_karyotype = QComboBox(self)
 		self.window_size = CirchartGenomeWindowSize(self)
+		self.threads_spin = CirchartThreadsSpin(self)
 
 	def _init_layouts(self):
 		self.main_layout.addRow("Data name:", self.dataname_input)
 		self.main_layout.addRow("Select genome:", self.select_genome)
 		self.main_layout.addRow("Select karyotype:", self.select_karyotype)
 		self.main_layout.addRow(self.window_size)
+		self.main_layout.addRow("CPU threads:", self.threads_spin)
 
 	def _init_widgets(self):
 		gs = SqlControl.get_datas_by_type('genome')
@@ -388,6 +389,8 @@ class CirchartGCContentPrepareDialog(CirchartBaseDialog):
 		for k in ks:
 			self.select_karyotype.addItem(k.name, k.id)
 
+		self.window_size.bind_karyotype(self.select_karyotype)
+
 	def _valid_form(self):
 		dn = self.dataname_input.text().strip()
 		if not dn:
@@ -418,6 +421,7 @@ class CirchartGCContentPrepareDialog(CirchartBaseDialog):
 					'dataname': data_name,
 					'genome': genome,
 					'karyotype': karyotype,
+					'threads': dlg.threads_spin.value(),
 				}
 
 				params.update(window_size)
@@ -426,6 +430,102 @@ class CirchartGCContentPrepareDialog(CirchartBaseDialog):
 class CirchartGCSkewPrepareDialog(CirchartGCContentPrepareDialog):
 	_title = "Prepare GC Skew Data"
 
+class CirchartCompositionPrepareDialog(CirchartGCContentPrepareDialog):
+	_title = "Prepare Sequence Composition Data"
+
+	def _create_widgets(self):
+		super()._create_widgets()
+
+		self.metric_checks = {}
+		for metric, (label, *_) in COMPOSITION_METRICS.items():
+			self.metric_checks[metric] = QCheckBox(label, self)
+
+		self.metric_checks['gc'].setChecked(True)
+
+	def _init_layouts(self):
+		super()._init_layouts()
+
+		metric_layout = QGridLayout()
+		for i, check in enumerate(self.metric_checks.values()):
+			metric_layout.addWidget(check, i // 2, i % 2)
+
+		self.main_layout.insertRow(3, "Metrics:", metric_layout)
+
+	def get_metrics(self):
+		return [m for m, c in self.metric_checks.items() if c.isChecked()]
+
+	def _valid_form(self):
+		if not self.get_metrics():
+			return QMessageBox.critical(self, 'Error', "No metric selected")
+
+		super()._valid_form()
+
+	@classmethod
+	def prepare(cls, parent=None):
+		dlg = cls(parent)
+
+		if dlg.exec() == QDialog.Accepted:
+			genome = dlg.select_genome.currentData()
+			karyotype = dlg.select_karyotype.currentData()
+			window_size = dlg.window_size.get_values()
+			data_name = dlg.dataname_input.text()
+
+			if genome and karyotype:
+				params = {
+					'dataname': data_name,
+					'genome': genome,
+					'karyotype': karyotype,
+					'metrics': dlg.get_metrics(),
+					'threads': dlg.threads_spin.value(),
+				}
+
+				params.update(window_size)
+				return params
+
+class CirchartGapPrepareDialog(CirchartGCContentPrepareDialog):
+	_title = "Prepare Assembly Gap Data"
+
+	def _create_widgets(self):
+		super()._create_widgets()
+
+		self.minlen_spin = QSpinBox(self)
+		self.minlen_spin.setRange(1, 1000000)
+		self.minlen_spin.setValue(10)
+		self.minlen_spin.setSuffix(' bp')
+
+		self.select_mode = QComboBox(self)
+		self.select_mode.addItem("Gap regions (loci data)", 'loci')
+		self.select_mode.addItem("Gap fraction per window (plot data)", 'fraction')
+		self.select_mode.currentIndexChanged.connect(self._on_mode_changed)
+
+	def _init_layouts(self):
+		super()._init_layouts()
+
+		self.main_layout.insertRow(3, "Min N-run length:", self.minlen_spin)
+		self.main_layout.insertRow(4, "Output:", self.select_mode)
+		self.main_layout.setRowVisible(self.window_size, False)
+
+	def _on_mode_changed(self, index):
+		self.main_layout.setRowVisible(self.window_size, index == 1)
+		self.adjustSize()
+
+	@classmethod
+	def prepare(cls, parent=None):
+		dlg = cls(parent)
+
+		if dlg.exec() == QDialog.Accepted:
+			params = {
+				'dataname': dlg.dataname_input.text().strip(),
+				'genome': dlg.select_genome.currentData(),
+				'karyotype': dlg.select_karyotype.currentData(),
+				'minlen': dlg.minlen_spin.value(),
+				'mode': dlg.select_mode.currentData(),
+				'threads': dlg.threads_spin.value(),
+			}
+
+			params.update(dlg.window_size.get_values())
+			return params
+
 class CirchartDensityPrepareDialog(CirchartBaseDialog):
 	_title = "Prepare Density Data"
 	_wsize = QSize(450, 100)
@@ -443,7 +543,19 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 		self.filter_check = QCheckBox("Filter records by attribute values", self)
 		self.filter_check.toggled.connect(self._on_filter_checked)
 		self.filter_match = CirchartAttributeFilters(self)
+
+		self.track_list = QListWidget(self)
+		self.track_list.setMaximumHeight(80)
+		self.track_add = QPushButton("Add track", self)
+		self.track_add.clicked.connect(self._on_add_track)
+		self.track_del = QPushButton("Remove track", self)
+		self.track_del.clicked.connect(self._on_del_track)
+
 		self.window_size = CirchartGenomeWindowSize(self)
+		self.select_mode = QComboBox(self)
+		self.select_mode.addItem("Feature count per window", 'count')
+		self.select_mode.addItem("Fraction of window covered", 'coverage')
+		self.threads_spin = CirchartThreadsSpin(self)
 
 		self.select_annotation.currentIndexChanged.connect(self._on_annotation_changed)
 		self.select_datatype.currentIndexChanged.connect(self._on_datatype_changed)
@@ -459,6 +571,8 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 		for k in ks:
 			self.select_karyotype.addItem(k.name, k.id)
 
+		self.window_size.bind_karyotype(self.select_karyotype)
+
 		for desc, fmt in formats:
 			self.select_datatype.addItem(desc, fmt)
 
@@ -470,7 +584,25 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 		self.main_layout.addRow("Select feature:", self.select_feature)
 		self.main_layout.addRow(self.filter_check)
 		self.main_layout.addRow(self.filter_match)
+
+		track_btns = QHBoxLayout()
+		track_btns.setContentsMargins(0, 0, 0, 0)
+		track_btns.addWidget(self.track_add)
+		track_btns.addWidget(self.track_del)
+		track_btns.addStretch(1)
+
+		track_layout = QVBoxLayout()
+		track_layout.setContentsMargins(0, 0, 0, 0)
+		track_layout.addWidget(QLabel("Feature tracks (each track is saved as a plot data):", self))
+		track_layout.addLayout(track_btns)
+		track_layout.addWidget(self.track_list)
+
+		self.track_widget = QWidget(self)
+		self.track_widget.setLayout(track_layout)
+		self.main_layout.addRow(self.track_widget)
 		self.main_layout.addRow(self.window_size)
+		self.main_layout.addRow("Density mode:", self.select_mode)
+		self.main_layout.addRow("CPU threads:", self.threads_spin)
 
 		self.main_layout.setRowVisible(self.filter_match, False)
 
@@ -482,10 +614,13 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 		if index == 0:
 			self.main_layout.setRowVisible(self.select_feature, True)
 			self.main_layout.setRowVisible(self.filter_check, True)
+			self.main_layout.setRowVisible(self.track_widget, True)
 		else:
 			self.main_layout.setRowVisible(self.select_feature, False)
 			self.main_layout.setRowVisible(self.filter_check, False)
+			self.main_layout.setRowVisible(self.track_widget, False)
 			self.filter_check.setCheckState(Qt.Unchecked)
+			self.track_list.clear()
 		
 		self.adjustSize()
 
@@ -507,6 +642,7 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 					self.attributes[a.id] = meta['attributes']
 
 			annot_id = self.select_annotation.currentData()
+			self.track_list.clear()
 			self.select_feature.clear()
 			self.select_feature.addItems(self.features[annot_id])
 			self.filter_match.set_attrs(self.attributes[annot_id])
@@ -524,19 +660,63 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 		if not di:
 			return QMessageBox.critical(self, 'Error', "No source data selected")
 
-		if self.select_datatype.currentIndex() == 0:
-			fi = self.select_feature.currentText().strip()
+		if self.select_datatype.currentIndex() == 0 and not self.track_list.count():
+			if not self._valid_track():
+				return
 
-			if not fi:
-				return QMessageBox.critical(self, 'Error', "No feature selected or input")
+		self.accept()
 
-			if self.filter_check.isChecked():
-				fs = self.filter_match.get_filters()
+	def _valid_track(self):
+		fi = self.select_feature.currentText().strip()
 
-				if not fs or not any(fs.values()):
-					return QMessageBox.critical(self, 'Error', "No filter input")
+		if not fi:
+			return QMessageBox.critical(self, 'Error', "No feature selected or input")
 
-		self.accept()
+		if self.filter_check.isChecked():
+			fs = self.filter_match.get_filters()
+
+			if not fs or not any(fs.values()):
+				return QMessageBox.critical(self, 'Error', "No filter input")
+
+		return True
+
+	def get_current_track(self):
+		return {
+			'feature': self.select_feature.currentText().strip(),
+			'attrcheck': self.filter_check.isChecked(),
+			'attrfilter': self.filter_match.get_filters(),
+		}
+
+	def _on_add_track(self):
+		if not self._valid_track():
+			return
+
+		track = self.get_current_track()
+		label = track['feature']
+
+		if track['attrcheck']:
+			label = "{} ({})".format(label, '; '.join(
+				"{}={}".format(k, ','.join(sorted(v)))
+				for k, v in track['attrfilter'].items() if v
+			))
+
+		item = QListWidgetItem(label, self.track_list)
+		item.setData(Qt.UserRole, track)
+
+	def _on_del_track(self):
+		row = self.track_list.currentRow()
+
+		if row >= 0:
+			self.track_list.takeItem(row)
+
+	def get_tracks(self):
+		if self.track_list.count():
+			return [
+				self.track_list.item(i).data(Qt.UserRole)
+				for i in range(self.track_list.count())
+			]
+
+		return [self.get_current_track()]
 
 	@classmethod
 	def prepare(cls, parent=None):
@@ -546,25 +726,207 @@ class CirchartDensityPrepareDialog(CirchartBaseDialog):
 			annotation_id = dlg.select_annotation.currentData()
 			karyotype_id = dlg.select_karyotype.currentData()
 			window_size = dlg.window_size.get_values()
-			feature = dlg.select_feature.currentText().strip()
-			attrcheck = dlg.filter_check.isChecked()
-			attrfilter = dlg.filter_match.get_filters()
+			tracks = dlg.get_tracks()
 			dataname = dlg.dataname_input.text().strip()
 			datatype = dlg.select_datatype.currentData()
 
 			params = {
 				'annotation': annotation_id,
 				'karyotype': karyotype_id,
-				'feature': feature,
-				'attrcheck': attrcheck,
-				'attrfilter': attrfilter,
+				'tracks': tracks,
 				'dataname': dataname,
-				'datatype': datatype
+				'datatype': datatype,
+				'mode': dlg.select_mode.currentData(),
+				'threads': dlg.threads_spin.value()
 			}
 
 			params.update(window_size)
 			return params
 
+class CirchartVariantPrepareDialog(CirchartBaseDialog):
+	_title = "Prepare Variant Data"
+	_wsize = QSize(400, 100)
+
+	def _create_widgets(self):
+		self.dataname_input = QLineEdit(self)
+		self.select_karyotype = QComboBox(self)
+		self.select_variants = QComboBox(self)
+		self.window_size = CirchartGenomeWindowSize(self)
+
+		self.metric_checks = {
+			'snp': QCheckBox("SNP density", self),
+			'indel': QCheckBox("Indel density", self),
+			'titv': QCheckBox("Ti/Tv ratio", self),
+			'het': QCheckBox("Heterozygosity", self),
+		}
+		self.metric_checks['snp'].setChecked(True)
+		self.metric_checks['het'].toggled.connect(self._on_het_checked)
+
+		self.sample_list = QListWidget(self)
+		self.select_variants.currentIndexChanged.connect(self._on_variants_changed)
+
+	def _init_layouts(self):
+		metric_layout = QGridLayout()
+		for i, check in enumerate(self.metric_checks.values()):
+			metric_layout.addWidget(check, i // 2, i % 2)
+
+		self.main_layout.addRow("Data name:", self.dataname_input)
+		self.main_layout.addRow("Select karyotype:", self.select_karyotype)
+		self.main_layout.addRow("Select variations:", self.select_variants)
+		self.main_layout.addRow("Metrics:", metric_layout)
+		self.main_layout.addRow("Samples:", self.sample_list)
+		self.main_layout.addRow(self.window_size)
+
+		self.main_layout.setRowVisible(self.sample_list, False)
+
+	def _init_widgets(self):
+		self.vcf_paths = {}
+
+		ks = SqlControl.get_datas_by_type('karyotype')
+		for k in ks:
+			self.select_karyotype.addItem(k.name, k.id)
+
+		self.window_size.bind_karyotype(self.select_karyotype)
+
+		vs = SqlControl.get_datas_by_type('variants')
+		for v in vs:
+			self.vcf_paths[v.id] = str_to_dict(v.meta)['path']
+			self.select_variants.addItem(v.name, v.id)
+
+	def _on_het_checked(self, flag):
+		self.main_layout.setRowVisible(self.sample_list, flag)
+		self.adjustSize()
+
+	def _on_variants_changed(self, index):
+		self.sample_list.clear()
+		vi = self.select_variants.currentData()
+
+		if vi is None:
+			return
+
+		for i, sample in enumerate(get_vcf_samples(self.vcf_paths[vi])):
+			item = QListWidgetItem(sample, self.sample_list)
+			item.setData(Qt.UserRole, i)
+			item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+			item.setCheckState(Qt.Checked)
+
+	def get_metrics(self):
+		return [m for m, c in self.metric_checks.items() if c.isChecked()]
+
+	def get_samples(self):
+		samples = []
+
+		for i in range(self.sample_list.count()):
+			item = self.sample_list.item(i)
+
+			if item.checkState() == Qt.Checked:
+				samples.append(item.data(Qt.UserRole))
+
+		return samples
+
+	def _valid_form(self):
+		dn = self.dataname_input.text().strip()
+		if not dn:
+			return QMessageBox.critical(self, 'Error', "No data name input")
+
+		ki = self.select_karyotype.currentData()
+		if not ki:
+			return QMessageBox.critical(self, 'Error', "No karyotype selected")
+
+		vi = self.select_variants.currentData()
+		if not vi:
+			return QMessageBox.critical(self, 'Error', "No variations selected")
+
+		metrics = self.get_metrics()
+		if not metrics:
+			return QMessageBox.critical(self, 'Error', "No metric selected")
+
+		if 'het' in metrics and not self.get_samples():
+			return QMessageBox.critical(self, 'Error', "No sample selected for heterozygosity")
+
+		self.accept()
+
+	@classmethod
+	def prepare(cls, parent=None):
+		dlg = cls(parent)
+
+		if dlg.exec() == QDialog.Accepted:
+			params = {
+				'dataname': dlg.dataname_input.text().strip(),
+				'karyotype': dlg.select_karyotype.currentData(),
+				'variants': dlg.select_variants.currentData(),
+				'metrics': dlg.get_metrics(),
+				'samples': dlg.get_samples(),
+			}
+
+			params.update(dlg.window_size.get_values())
+			return params
+
+class CirchartDepthPrepareDialog(CirchartBaseDialog):
+	_title = "Prepare Depth Data"
+	_wsize = QSize(400, 100)
+
+	def _create_widgets(self):
+		self.dataname_input = QLineEdit(self)
+		self.select_karyotype = QComboBox(self)
+		self.depth_file = CirchartBrowseWidget(self)
+		self.format_select = QComboBox(self)
+		self.stat_select = QComboBox(self)
+		self.window_size = CirchartGenomeWindowSize(self)
+
+	def _init_layouts(self):
+		self.main_layout.addRow("Data name:", self.dataname_input)
+		self.main_layout.addRow("Select karyotype:", self.select_karyotype)
+		self.main_layout.addRow("Depth file:", self.depth_file)
+		self.main_layout.addRow("File format:", self.format_select)
+		self.main_layout.addRow("Window value:", self.stat_select)
+		self.main_layout.addRow(self.window_size)
+
+	def _init_widgets(self):
+		ks = SqlControl.get_datas_by_type('karyotype')
+		for k in ks:
+			self.select_karyotype.addItem(k.name, k.id)
+
+		self.window_size.bind_karyotype(self.select_karyotype)
+
+		self.format_select.addItem("bedGraph (chrom, start, end, value)", 'bedgraph')
+		self.format_select.addItem("Per-base depth (chrom, pos, depth)", 'depth')
+
+		self.stat_select.addItem("Mean depth", 'mean')
+		self.stat_select.addItem("Median depth", 'median')
+		self.stat_select.addItem("Max depth", 'max')
+
+	def _valid_form(self):
+		dn = self.dataname_input.text().strip()
+		if not dn:
+			return QMessageBox.critical(self, 'Error', "No data name input")
+
+		ki = self.select_karyotype.currentData()
+		if not ki:
+			return QMessageBox.critical(self, 'Error', "No karyotype selected")
+
+		df = self.depth_file.get_path()
+		if not df:
+			return QMessageBox.critical(self, 'Error', "No depth file selected")
+
+		self.accept()
+
+	@classmethod
+	def prepare(cls, parent=None):
+		dlg = cls(parent)
+
+		if dlg.exec() == QDialog.Accepted:
+			params = {
+				'dataname': dlg.dataname_input.text().strip(),
+				'karyotype': dlg.select_karyotype.currentData(),
+				'depthfile': dlg.depth_file.get_path(),
+				'depthformat': dlg.format_select.currentData(),
+				'stat': dlg.stat_select.currentData(),
+			}
+
+			params.update(dlg.window_size.get_values())
+			return params
+
 class CirchartTextPrepareDialog(CirchartBaseDialog):
 	_title = "Prepare Text Data"
 	_wsize = QSize(450, 100)
@@ -582,6 +944,21 @@ class CirchartTextPrepareDialog(CirchartBaseDialog):
 		self.filter_check.toggled.connect(self._on_filter_checked)
 		self.annot_select.currentIndexChanged.connect(self._on_annotation_changed)
 
+		self.thin_check = QCheckBox("Thin labels to avoid overlaps on the track", self)
+		self.thin_check.toggled.connect(self._on_thin_checked)
+		self.rankby_select = QComboBox(self)
+		self.whitelist_input = QLineEdit(self)
+		self.whitelist_input.setPlaceholderText("comma separated labels always kept first")
+		self.radius_spin = QDoubleSpinBox(self)
+		self.radius_spin.setRange(0.01, 2)
+		self.radius_spin.setSingleStep(0.05)
+		self.radius_spin.setDecimals(2)
+		self.radius_spin.setValue(0.9)
+		self.fontsize_spin = QSpinBox(self)
+		self.fontsize_spin.setRange(1, 100)
+		self.fontsize_spin.setValue(12)
+		self.fontsize_spin.setSuffix(' px')
+
 	def _init_widgets(self):
 		self.features = {}
 		self.attributes = {}
@@ -598,6 +975,9 @@ class CirchartTextPrepareDialog(CirchartBaseDialog):
 
 			self.annot_select.addItem(a.name, a.id)
 
+		self.rankby_select.addItem("Feature length", 'length')
+		self.rankby_select.addItem("Score column", 'score')
+
 	def _init_layouts(self):
 		self.main_layout.addRow("Data name:", self.dataname_input)
 		self.main_layout.addRow("Select karyotype:", self.select_karyotype)
@@ -606,13 +986,26 @@ class CirchartTextPrepareDialog(CirchartBaseDialog):
 		self.main_layout.addRow("Select attribute:", self.attr_select)
 		self.main_layout.addRow(self.filter_check)
 		self.main_layout.addRow(self.filter_match)
+		self.main_layout.addRow(self.thin_check)
+		self.main_layout.addRow("Rank labels by:", self.rankby_select)
+		self.main_layout.addRow("Whitelist:", self.whitelist_input)
+		self.main_layout.addRow("Track radius:", self.radius_spin)
+		self.main_layout.addRow("Label size:", self.fontsize_spin)
 
 		self.main_layout.setRowVisible(self.filter_match, False)
+		self._on_thin_checked(False)
 
 	def _on_filter_checked(self, flag):
 		self.main_layout.setRowVisible(self.filter_match, flag)
 		self.adjustSize()
 
+	def _on_thin_checked(self, flag):
+		for w in [self.rankby_select, self.whitelist_input,
+			self.radius_spin, self.fontsize_spin]:
+			self.main_layout.setRowVisible(w, flag)
+
+		self.adjustSize()
+
 	def _on_annotation_changed(self, index):
 		aid = self.annot_select.currentData()
 		
@@ -664,6 +1057,8 @@ class CirchartTextPrepareDialog(CirchartBaseDialog):
 			attribute = dlg.attr_select.currentText().strip()
 			attrcheck = dlg.filter_check.isChecked()
 			attrfilter = dlg.filter_match.get_filters()
+			whitelist = dlg.whitelist_input.text().split(',')
+			whitelist = [w.strip() for w in whitelist if w.strip()]
 
 			params = {
 				'annotation': annotation_id,
@@ -672,6 +1067,11 @@ class CirchartTextPrepareDialog(CirchartBaseDialog):
 				'attrcheck': attrcheck,
 				'attribute': attribute,
 				'attrfilter': attrfilter,
+				'thin': dlg.thin_check.isChecked(),
+				'rankby': dlg.rankby_select.currentData(),
+				'whitelist': whitelist,
+				'radius': dlg.radius_spin.value(),
+				'fontsize': dlg.fontsize_spin.value(),
 				'dataname': dataname
 			}
 
@@ -692,6 +1092,28 @@ class CirchartLinkPrepareDialog(CirchartBaseDialog):
 		self.species_spin.setRange(1, 10)
 		self.query_karyotype = QComboBox(self)
 		self.subject_karyotype = QComboBox(self)
+		self.threads_spin = CirchartThreadsSpin(self)
+
+		self.link_filter = QComboBox(self)
+		self.link_filter.addItem("Keep all hits", 'all')
+		self.link_filter.addItem("Keep top N hits per chromosome pair", 'top')
+		self.link_filter.addItem("Aggregate hits into window ribbons", 'ribbon')
+
+		self.topn_spin = QSpinBox(self)
+		self.topn_spin.setRange(1, 1000000)
+		self.topn_spin.setValue(1000)
+
+		self.rankby_select = QComboBox(self)
+		self.rankby_select.addItem("Bit score", 'bitscore')
+		self.rankby_select.addItem("Identity", 'identity')
+		self.rankby_select.addItem("Alignment length", 'length')
+
+		self.ribbon_spin = QSpinBox(self)
+		self.ribbon_spin.setRange(1, 1000000)
+		self.ribbon_spin.setValue(100)
+		self.ribbon_spin.setSuffix(" KB")
+
+		self.collapse_check = QCheckBox("Collapse anchors of each collinear block into one link", self)
 
 	def _init_layouts(self):
 		self.subs_layout = QVBoxLayout()
@@ -703,9 +1125,16 @@ class CirchartLinkPrepareDialog(CirchartBaseDialog):
 		self.main_layout.addRow("Subject karyotype:", self.subject_karyotype)
 		self.main_layout.addRow("Species number:", self.species_spin)
 		self.main_layout.addRow(self.subs_layout)
+		self.main_layout.addRow("CPU threads:", self.threads_spin)
+		self.main_layout.addRow("Link filter:", self.link_filter)
+		self.main_layout.addRow("Top N:", self.topn_spin)
+		self.main_layout.addRow("Rank by:", self.rankby_select)
+		self.main_layout.addRow("Ribbon window:", self.ribbon_spin)
+		self.main_layout.addRow(self.collapse_check)
 
 	def _init_widgets(self):
 		self.source_type.currentIndexChanged.connect(self._on_type_changed)
+		self.link_filter.currentIndexChanged.connect(self._on_filter_changed)
 		self.species_spin.valueChanged.connect(self._on_species_changed)
 
 		synteny_types = {
@@ -740,6 +1169,8 @@ class CirchartLinkPrepareDialog(CirchartBaseDialog):
 			self.main_layout.setRowVisible(6, False)
 			self.clear_mapping()
 
+		self._on_filter_changed(self.link_filter.currentIndex())
+
 		self.source_data.clear()
 		stype = self.source_type.currentData()
 		ds = SqlControl.get_datas_by_type(stype)
@@ -749,6 +1180,18 @@ class CirchartLinkPrepareDialog(CirchartBaseDialog):
 
 		self.adjustSize()
 
+	def _on_filter_changed(self, index):
+		#hits can only be filtered for blast or mummer
+		alignment = self.source_type.currentData() in ['blast', 'mummer']
+		linkfilter = self.link_filter.currentData()
+
+		self.main_layout.setRowVisible(self.link_filter, alignment)
+		self.main_layout.setRowVisible(self.topn_spin, alignment and linkfilter == 'top')
+		self.main_layout.setRowVisible(self.rankby_select, alignment and linkfilter == 'top')
+		self.main_layout.setRowVisible(self.ribbon_spin, alignment and linkfilter == 'ribbon')
+		self.main_layout.setRowVisible(self.collapse_check, self.source_type.currentData() == 'mcscanx')
+		self.adjustSize()
+
 	def add_mapping(self, title, label=False):
 		mapwdg = CirchartSpeciesMappingWidget(title, self, label)
 		self.subs_layout.addWidget(mapwdg)
@@ -784,6 +1227,12 @@ class CirchartLinkPrepareDialog(CirchartBaseDialog):
 		data['queryk'] = self.query_karyotype.currentData()
 		data['subjectk'] = self.subject_karyotype.currentData()
 		data['dataname'] = self.dataname_input.text().strip()
+		data['threads'] = self.threads_spin.value()
+		data['linkfilter'] = self.link_filter.currentData()
+		data['topn'] = self.topn_spin.value()
+		data['rankby'] = self.rankby_select.currentData()
+		data['ribbon'] = self.ribbon_spin.value() * 1000
+		data['collapse'] = self.collapse_check.isChecked()
 		return data
 
 	def _valid_form(self):
@@ -874,6 +1323,9 @@ class CirchartReplaceChridDialog(CirchartBaseDialog):
 			for k in ks:
 				SqlControl.update_data_chrid(self.table, k.label, k.name)
 
+		dtype, index = self.table.rsplit('_', 1)
+		SqlControl.update_data_catalog(dtype, index)
+
 	@classmethod
 	def replace(cls, parent, table):
 		dlg = cls(parent, table)
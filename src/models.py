@@ -1,9 +1,8 @@
-import random
-
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
+from utils import *
 from config import *
 from backend import *
 
@@ -29,6 +28,10 @@ class CirchartBaseTableModel(QAbstractTableModel):
 	_fields = []
 	_table = None
 
+	#sorted id arrays keyed by (table, field, asc, version)
+	_sorted_ids = {}
+	_sorted_max = 8
+
 	def __init__(self, parent=None, checkable=False, sortable=False):
 		super().__init__(parent)
 		self.checkable = checkable
@@ -149,7 +152,7 @@ class CirchartBaseTableModel(QAbstractTableModel):
 		if parent.isValid():
 			return
 
-		ids = SqlBase.get_column(self.read_sql)
+		ids = self.read_ids()
 		fetch_count = len(ids)
 		fetch_end = self.read_count+fetch_count-1
 		self.beginInsertRows(QModelIndex(), self.read_count, fetch_end)
@@ -169,12 +172,6 @@ class CirchartBaseTableModel(QAbstractTableModel):
 	def set_filter(self, **filters):
 		pass
 
-	@property
-	def count_sql(self):
-		return SqlQuery(self._table)\
-			.select('COUNT(1)')\
-			.first()
-
 	@property
 	def delete_sql(self):
 		return SqlQuery(self._table)\
@@ -190,10 +187,57 @@ class CirchartBaseTableModel(QAbstractTableModel):
 			.limit(fetch_count)\
 			.offset(self.read_count)
 
+		return sql
+
+	def get_sorted_ids(self):
+		sql = SqlQuery(self._table)\
+			.select('id')\
+			.orderby(self.order_by, asc=self.order_asc)
+
+		catalog = SqlControl.get_data_catalog(self._table)
+
+		#dataset tables from old projects have no catalog yet
+		if not catalog and self._table.count('_'):
+			dtype, index = self._table.rsplit('_', 1)
+
+			if index.isdigit():
+				SqlControl.add_data_catalog(dtype, int(index))
+				catalog = SqlControl.get_data_catalog(self._table)
+
+		#without version stamp the ids can not be cached
+		if not catalog:
+			return SqlBase.get_column(sql)
+
+		key = (self._table, self.order_by, self.order_asc, catalog.version)
+
+		if key not in self._sorted_ids:
+			if len(self._sorted_ids) >= self._sorted_max:
+				self._sorted_ids.clear()
+
+			#drop ids sorted before the table was changed
+			for k in list(self._sorted_ids):
+				if k[0] == self._table and k[3] != catalog.version:
+					self._sorted_ids.pop(k)
+
+			self._sorted_ids[key] = SqlBase.get_column(sql)
+
+		return self._sorted_ids[key]
+
+	def clear_sorted_ids(self):
+		self.clear_table_ids(self._table)
+
+	@classmethod
+	def clear_table_ids(cls, table):
+		for key in list(cls._sorted_ids):
+			if key[0] == table:
+				cls._sorted_ids.pop(key)
+
+	def read_ids(self):
 		if self.order_by:
-			sql = sql.orderby(self.order_by, asc=self.order_asc)
+			ids = self.get_sorted_ids()
+			return ids[self.read_count:self.read_count+self.read_size]
 
-		return sql
+		return SqlBase.get_column(self.read_sql)
 
 	@property
 	def get_sql(self):
@@ -244,6 +288,8 @@ class CirchartBaseTableModel(QAbstractTableModel):
 		row = index.row()
 		self.beginRemoveRows(parent, row, row)
 		SqlBase.delete_row(self.delete_sql, self.displays[row])
+		SqlControl.change_data_count(self._table, -1)
+		self.clear_sorted_ids()
 		self.displays.pop(row)
 		self.total_count -= 1
 		self.read_count -= 1
@@ -254,8 +300,8 @@ class CirchartBaseTableModel(QAbstractTableModel):
 		self.beginResetModel()
 		self.read_count = 0
 		self.selected = []
-		self.total_count = SqlBase.get_one(self.count_sql)
-		self.displays = SqlBase.get_column(self.read_sql)
+		self.total_count = SqlControl.get_data_count(self._table)
+		self.displays = self.read_ids()
 		self.read_count = len(self.displays)
 		self.cache_data = {}
 		self.endResetModel()
@@ -427,6 +473,8 @@ class CirchartKaryotypeTableModel(CirchartDataTableModel):
 			.where('id=?')
 
 		SqlBase.update_row(sql, name, kid)
+		SqlControl.touch_data_catalog(self._table)
+		self.clear_sorted_ids()
 
 	def update_color(self, index, color):
 		kid = self.get_id(index)
@@ -437,6 +485,8 @@ class CirchartKaryotypeTableModel(CirchartDataTableModel):
 			.where('id=?')
 
 		SqlBase.update_row(sql, color, kid)
+		SqlControl.touch_data_catalog(self._table)
+		self.clear_sorted_ids()
 
 	def update_single_color(self, color):
 		r, g, b, _ = color.toTuple()
@@ -444,70 +494,39 @@ class CirchartKaryotypeTableModel(CirchartDataTableModel):
 		sql = SqlQuery(self._table)\
 			.update('color')
 		SqlBase.update_row(sql, color)
+		SqlControl.touch_data_catalog(self._table)
+		self.clear_sorted_ids()
 
 		sindex = self.createIndex(0, 7)
 		eindex = self.createIndex(self.total_count-1, 7)
 		self.dataChanged.emit(sindex, eindex)
 
-	def update_random_color(self):
-		colors = []
-
-		for i in range(self.total_count):
-			r = random.randint(0, 255)
-			g = random.randint(0, 255)
-			b = random.randint(0, 255)
-			colors.append('{},{},{}'.format(r, g, b))
-
+	def update_palette_color(self, palette):
 		sql = SqlQuery(self._table)\
-			.update('color')\
-			.where('rowid=?')
+			.select('id', 'chrid', 'label')\
+			.orderby('id')
 
-		for i, c in enumerate(colors, 1):
-			SqlBase.update_row(sql, c, i)
+		rows = list(SqlBase.get_rows(sql))
+		colors = palette(rows)
+		SqlControl.update_karyotype_colors(self._table, colors)
+		self.clear_sorted_ids()
+		self.cache_data = {}
 
 		sindex = self.createIndex(0, 7)
-		eindex = self.createIndex(self.total_count-1, 7)
+		eindex = self.createIndex(self.rowCount()-1, 7)
 		self.dataChanged.emit(sindex, eindex)
 
+	def update_random_color(self):
+		self.update_palette_color(make_random_colors)
+
 	def update_default_color(self):
 		#get chr colors from circos
 		color_file = CIRCOS_PATH / 'etc' / 'colors.ucsc.conf'
+		circos_colors = get_circos_chrom_colors(str(color_file))
 
-		circos_colors = {}
-		with open(str(color_file)) as fh:
-			for line in fh:
-				if line.startswith('chr'):
-					cols = line.strip().split('=')
-					if ',' in cols[1]:
-						circos_colors[cols[0].strip().lower()] = cols[1].strip()
-
-		sql = SqlQuery(self._table)\
-			.update('color')\
-			.where('rowid=?')
-
-		for i in range(self.total_count):
-			name = self.createIndex(i, 3).data(Qt.DisplayRole)
-			label = self.createIndex(i, 4).data(Qt.DisplayRole)
-
-			if label.lower() in circos_colors:
-				color = circos_colors[label.lower()]
-
-			elif name.lower() in circos_colors:
-				color = circos_colors[name.lower()]
-
-			else:
-				temp = 'chr{}'.format(i+1)
-
-				if temp in circos_colors:
-					color = circos_colors[temp]
-				else:
-					color = circos_colors['chrun']
-
-			SqlBase.update_row(sql, color, i+1)
-
-		sindex = self.createIndex(0, 7)
-		eindex = self.createIndex(self.total_count-1, 7)
-		self.dataChanged.emit(sindex, eindex)
+		self.update_palette_color(
+			lambda rows: make_default_colors(rows, circos_colors)
+		)
 
 class CirchartDataTreeModel(CirchartBaseTableModel):
 	_table = 'data'
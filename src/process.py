@@ -2,17 +2,24 @@ import os
 import csv
 import gzip
 import time
+import heapq
+import atexit
+import pickle
+import threading
+import functools
 import traceback
+import subprocess
 import multiprocessing
 
-import pygros
 import pyfastx
+import numpy as np
 from blobtk import plot as snail_plot
 
 from PySide6.QtCore import *
 
 from config import *
 from utils import *
+from compute import *
 
 __all__ = [
 	'CirchartImportFastaProcess',
@@ -23,30 +30,60 @@ __all__ = [
 	'CirchartImportVariationsProcess',
 	'CirchartImportRegionsProcess',
 	'CirchartBandPrepareProcess',
-	'CirchartGCContentPrepareProcess',
+	'CirchartCompositionPrepareProcess',
 	'CirchartDensityPrepareProcess',
+	'CirchartDepthPrepareProcess',
+	'CirchartVariantPrepareProcess',
+	'CirchartGapPrepareProcess',
 	'CirchartCircosPlotProcess',
+	'CirchartCircosDaemon',
 	'CirchartSnailPlotProcess',
 	'CirchartImportMcscanxProcess',
 	'CirchartImportTableProcess',
 	'CirchartLinkPrepareProcess',
 	'CirchartTextPrepareProcess',
-	'CirchartGCSkewPrepareProcess',
 	'CirchartDataExtractProcess',
 ]
 
 class CirchartBaseProcess(multiprocessing.Process):
+	#jobs counting records save a checkpoint about every this number of records
+	checkpoint_rows = 100000
+
 	def __init__(self, queue, params):
 		super().__init__()
 		self.queue = queue
 		self.params = AttrDict(params)
 
+		#chunks finished before the job was interrupted
+		self.finished = set(self.params.get('checkpoints') or [])
+
 	def send(self, action, message=None):
 		self.queue.put({
 			'action': action,
 			'message': message
 		})
 
+	def is_finished(self, chunk):
+		return chunk in self.finished
+
+	def get_saved(self):
+		#records done before the last checkpoint of jobs counting records
+		return max([int(c) for c in self.finished] or [0])
+
+	def get_state(self):
+		#state needed to continue after the last checkpoint
+		state = self.params.get('state')
+
+		if state is not None:
+			return pickle.loads(state)
+
+	def checkpoint(self, chunk, state=None):
+		#all results of chunk must be sent before its checkpoint
+		if state is not None:
+			state = pickle.dumps(state)
+
+		self.send('checkpoint', (chunk, state))
+
 	def prerun(self):
 		pass
 
@@ -72,12 +109,161 @@ class CirchartBaseProcess(multiprocessing.Process):
 		finally:
 			self.send('finished')
 
+	def imap_tasks(self, func, tasks, initializer=None, initargs=()):
+		#run tasks in a process pool and yield results in task order
+		threads = min(self.params.get('threads') or 1, len(tasks))
+
+		if not tasks:
+			return
+
+		#run initializer in parent first, files like fasta index are
+		#then built once instead of by all pool processes at the same time
+		if initializer is not None:
+			initializer(*initargs)
+
+		if threads > 1:
+			if initializer is not None:
+				initargs = (initializer, initargs)
+				initializer = _init_pool_process
+				func = functools.partial(_run_pool_task, func)
+
+			with multiprocessing.Pool(threads, initializer, initargs) as pool:
+				yield from pool.imap(func, tasks)
+
+		else:
+			yield from map(func, tasks)
+
+#error raised by initializer in a pool process
+_pool_error = None
+
+def _init_pool_process(initializer, initargs):
+	global _pool_error
+
+	#pool respawns processes with failed initializer forever,
+	#keep the error and raise it from tasks to stop the job
+	try:
+		initializer(*initargs)
+	except:
+		_pool_error = traceback.format_exc()
+
+def _run_pool_task(func, task):
+	if _pool_error is not None:
+		raise RuntimeError("pool process initialization failed\n{}".format(_pool_error))
+
+	return func(task)
+
+#genome fasta opened once in each pool process
+_pool_fasta = None
+
+def _open_pool_fasta(genome):
+	global _pool_fasta
+	#keep raw case, soft-masked bases are counted separately
+	_pool_fasta = pyfastx.Fasta(genome, uppercase=False)
+
+def _split_genome_windows(size, window, step, chunk):
+	#split windows of a chromosome into chunks spanning about chunk bp
+	starts, ends = make_genome_windows(size, window, step)
+	idx = np.searchsorted(starts, np.arange(chunk, size, chunk))
+	return zip(np.split(starts, idx), np.split(ends, idx))
+
+def _basecount_task(chrom):
+	seq = _pool_fasta[chrom].seq
+	return chrom, len(seq), count_block_bases(seq)
+
+def _composition_window_task(task):
+	chrom, chrid, starts, ends, metrics = task
+
+	if not starts.size:
+		return chrid, starts, ends, {}
+
+	seq = _pool_fasta[chrom]
+	offset = int(starts[0])
+	stop = min(int(ends.max()), len(seq))
+	seq = seq[offset:stop].seq if stop > offset else ''
+
+	symbols = get_composition_symbols(metrics)
+	counts = count_window_bases(seq, starts-offset, ends-offset, symbols)
+	return chrid, starts, ends, calc_composition_metrics(counts, metrics)
+
+def _density_window_task(task):
+	chrid, size, window, step, fstarts, fends, mode = task
+	starts, ends = make_genome_windows(size, window, step)
+	fstarts = np.array(fstarts, dtype=np.int64)
+	fends = np.array(fends, dtype=np.int64)
+
+	if mode == 'coverage':
+		values = calc_window_coverage(starts, ends, fstarts, fends)
+	else:
+		values = count_window_features(starts, ends, fstarts, fends)
+
+	return make_window_rows(chrid, starts, ends, values)
+
+def _gap_task(task):
+	chrom, chrid, size, minlen, window, step = task
+
+	if chrom not in _pool_fasta:
+		return []
+
+	seq = _pool_fasta[chrom].seq[:size]
+	starts, ends = find_base_runs(seq, 'Nn', minlen)
+
+	#window is None for gap regions
+	if window is None:
+		return [(chrid, s+1, e, '') for s, e in zip(starts.tolist(), ends.tolist())]
+
+	wstarts, wends = make_genome_windows(size, window, step)
+	values = calc_window_coverage(wstarts, wends, starts, ends)
+	return make_window_rows(chrid, wstarts, wends, values)
+
+def _gene_index_task(task):
+	annotation, annoformat, feature, attribute = task
+
+	if annoformat == 'gtf':
+		split_attrs = lambda x: x.split('"')
+	else:
+		split_attrs = lambda x: x.split('=')
+
+	if annotation.endswith('.gz'):
+		fp = gzip.open(annotation, 'rt')
+	else:
+		fp = open(annotation)
+
+	genes = []
+	with fp:
+		for line in fp:
+			if line[0] == '#':
+				continue
+
+			line = line.strip()
+
+			if not line:
+				continue
+
+			cols = line.split('\t')
+
+			if cols[2] != feature:
+				continue
+
+			for attr in cols[8].split(';'):
+				if attr.strip().startswith(attribute):
+					gene = split_attrs(attr)[1].strip().strip('"')
+					genes.append((gene, cols[0], int(cols[3]), int(cols[4])))
+
+	return genes
+
 class CirchartImportFastaProcess(CirchartBaseProcess):
+	#a checkpoint is saved after about this number of bases
+	checkpoint_bases = 100000000
+
 	def do(self):
 		fa = pyfastx.Fasta(self.params.path, full_index=True)
 
+		#sequences imported before the last checkpoint are skipped
+		bases = 0
 		rows = []
-		for seq in fa:
+
+		for i in range(self.get_saved(), len(fa)):
+			seq = fa[i]
 			comp = seq.composition
 			gc = 0
 			ns = 0
@@ -91,11 +277,16 @@ class CirchartImportFastaProcess(CirchartBaseProcess):
 
 			gc = round(gc / len(seq), 4)
 			rows.append((seq.name, len(seq), gc, ns))
+			bases += len(seq)
 
-			if len(rows) == 200:
+			if len(rows) == 200 or bases >= self.checkpoint_bases:
 				self.send('result', rows)
 				rows = []
 
+			if bases >= self.checkpoint_bases:
+				self.checkpoint(str(i+1))
+				bases = 0
+
 		if rows:
 			self.send('result', rows)
 
@@ -192,8 +383,14 @@ class CirchartImportBandsProcess(CirchartBaseProcess):
 		rows = []
 		ignore = 0
 
+		#lines read before the last checkpoint are skipped
+		saved = last = self.get_saved()
+
 		with open(self.params.path) as fh:
-			for line in fh:
+			for num, line in enumerate(fh, 1):
+				if num <= saved:
+					continue
+
 				line = line.strip()
 
 				if not line:
@@ -214,6 +411,10 @@ class CirchartImportBandsProcess(CirchartBaseProcess):
 					self.send('result', rows)
 					rows = []
 
+					if num - last >= self.checkpoint_rows:
+						self.checkpoint(str(num))
+						last = num
+
 		if rows:
 			self.send('result', rows)
 
@@ -301,10 +502,16 @@ class CirchartImportDataProcess(CirchartBaseProcess):
 
 			alphas = {'a1': 0.83, 'a2': 0.67, 'a3': 0.5, 'a4': 0.33, 'a5': 0.17}
 
+			#records read before the last checkpoint are skipped
+			saved = last = self.get_saved()
+
 			with open(self.params.path) as fh:
 				reader = self.file_reader(fh)
 
-				for row in reader:
+				for num, row in enumerate(reader, 1):
+					if num <= saved:
+						continue
+
 					if len(row) < self.params.column:
 						ignore += 1
 						continue
@@ -338,6 +545,10 @@ class CirchartImportDataProcess(CirchartBaseProcess):
 						self.send('result', rows)
 						rows = []
 
+						if num - last >= self.checkpoint_rows:
+							self.checkpoint(str(num))
+							last = num
+
 			if rows:
 				self.send('result', rows)
 
@@ -345,61 +556,75 @@ class CirchartImportDataProcess(CirchartBaseProcess):
 				self.send('warning', "Ignored {} lines due to missing columns".format(ignore))
 
 class CirchartImportLinkDataProcess(CirchartImportDataProcess):
-	def do(self):
-		rows = []
+	def iter_links(self, reader):
 		mappings = {}
-		ignore = 0
 
-		with open(self.params.path) as fh:
-			reader = self.file_reader(fh)
+		for row in reader:
+			if len(row) < self.params.column:
+				self.ignore += 1
+				continue
 
-			for row in reader:
-				if len(row) < self.params.column:
-					ignore += 1
-					continue
+			elif 4 <= len(row) < 6:
+				if row[0] not in mappings:
+					mappings[row[0]] = row[1:4]
+					mappings[row[0]].append('')
+					mappings[row[0]].append('')
+					mappings[row[0]].append('')
 
-				elif 4 <= len(row) < 6:
-					if row[0] not in mappings:
-						mappings[row[0]] = row[1:4]
-						mappings[row[0]].append('')
-						mappings[row[0]].append('')
+					if len(row) > 4:
+						mappings[row[0]].append(row[4])
+					else:
 						mappings[row[0]].append('')
 
-						if len(row) > 4:
-							mappings[row[0]].append(row[4])
-						else:
-							mappings[row[0]].append('')
+				else:
+					mappings[row[0]][3] = row[1]
+					mappings[row[0]][4] = row[2]
+					mappings[row[0]][5] = row[3]
 
-					else:
-						mappings[row[0]][3] = row[1]
-						mappings[row[0]][4] = row[2]
-						mappings[row[0]][5] = row[3]
+					if len(row) > 4 and not mappings[row[0]][6]:
+						mappings[row[0]][6] = row[4]
+
+					yield mappings[row[0]]
 
-						if len(row) > 4 and not mappings[row[0]][6]:
-							mappings[row[0]][6] = row[4]
+			else:
+				res = row[:7]
 
-						rows.append(mappings[row[0]])
+				if len(res) < 7:
+					res.append('')
 
-						if len(rows) == 200:
-							self.send('result', rows)
-							rows = []
+				yield res
 
-				else:
-					res = row[:7]
+	def do(self):
+		rows = []
+		self.ignore = 0
 
-					if len(res) < 7:
-						res.append('')
+		#links are paired in the same order on every run, rows already
+		#saved before the last checkpoint are skipped
+		saved = last = self.get_saved()
+		count = 0
 
-					rows.append(res)
-					if len(rows) == 200:
-						self.send('result', rows)
-						rows = []
+		with open(self.params.path) as fh:
+			for row in self.iter_links(self.file_reader(fh)):
+				count += 1
+
+				if count <= saved:
+					continue
+
+				rows.append(row)
+
+				if len(rows) == 200:
+					self.send('result', rows)
+					rows = []
+
+					if count - last >= self.checkpoint_rows:
+						self.checkpoint(str(count))
+						last = count
 
 		if rows:
 			self.send('result', rows)
 
-		if ignore > 0:
-			self.send('warning', "Ignored {} lines due to missing columns".format(ignore))
+		if self.ignore > 0:
+			self.send('warning', "Ignored {} lines due to missing columns".format(self.ignore))
 
 class CirchartImportMcscanxProcess(CirchartBaseProcess):
 	def do(self):
@@ -486,158 +711,177 @@ class CirchartBandPrepareProcess(CirchartBaseProcess):
 		if rows:
 			self.send('result', rows)
 
-class CirchartGCContentPrepareProcess(CirchartBaseProcess):
-	def _calc_gc(self, seq, i, j):
-		a = seq.count('A', i, j)
-		t = seq.count('T', i, j)
-		g = seq.count('G', i, j)
-		c = seq.count('C', i, j)
+class CirchartCompositionPrepareProcess(CirchartBaseProcess):
+	#very large chromosomes are split into chunks of this size
+	chunk_size = 10000000
 
-		if g or c:
-			gc = (g + c) / (a + t + g + c)
-		else:
-			gc = 0
+	def count_from_genome(self, chroms):
+		tasks = []
+		for chrom in chroms:
+			chrid, size = self.params.axes[chrom]
+			chunks = _split_genome_windows(size, self.params.window,
+				self.params.step, self.chunk_size)
 
-		return gc
+			for starts, ends in chunks:
+				tasks.append((chrom, chrid, starts, ends, self.params.metrics))
 
-	def do(self):
-		fa = pyfastx.Fasta(self.params.genome, uppercase=True)
-		wsize = self.params.window
-		step = self.params.step
+		return self.imap_tasks(_composition_window_task, tasks,
+			_open_pool_fasta, (self.params.genome,))
+
+	def count_from_cache(self):
+		metrics = self.params.metrics
+		symbols = get_composition_symbols(metrics)
+
+		caches = {}
+		for chrom, (length, blobs) in (self.params.get('basecounts') or {}).items():
+			if all(s in blobs for s in BASECOUNT_SYMBOLS):
+				caches[chrom] = (length, unpack_block_counts(blobs))
+
+		#count blocks for chromosomes not cached yet and send them back
+		missing = [chrom for chrom in self.params.axes if chrom not in caches]
+		results = self.imap_tasks(_basecount_task, missing,
+			_open_pool_fasta, (self.params.genome,))
+
+		for chrom, length, blocks in results:
+			self.send('cache', (chrom, length, pack_block_counts(blocks)))
+			caches[chrom] = (length, blocks)
+
+		#chromosomes whose windows are not aligned to blocks
+		unaligned = []
 
 		for chrom in self.params.axes:
 			chrid, size = self.params.axes[chrom]
-			seq = fa[chrom].seq
-			rows = []
+			starts, ends = make_genome_windows(size, self.params.window, self.params.step)
+			length, blocks = caches[chrom]
+			counts = count_window_blocks(blocks, length, starts, ends, symbols)
 
-			for i in range(0, size, step):
-				j = i + wsize
+			if counts is None:
+				unaligned.append(chrom)
+			else:
+				yield chrid, starts, ends, calc_composition_metrics(counts, metrics)
 
-				if j > size:
-					j = size
+		#count them from genome in one pool pass
+		yield from self.count_from_genome(unaligned)
 
-				gc = self._calc_gc(seq, i, j)
-				rows.append((chrid, i+1, j, gc, ''))
+	def do(self):
+		metrics = self.params.metrics
 
-				if j == size:
-					break
+		self.params.axes = {
+			chrom: (chrid, size)
+			for chrom, (chrid, size) in self.params.axes.items()
+			if not self.is_finished(str(chrid))
+		}
 
-			self.send('result', rows)
+		#block cache only serves windows aligned to blocks
+		if self.params.window % BASECOUNT_BLOCK or self.params.step % BASECOUNT_BLOCK:
+			results = self.count_from_genome(self.params.axes)
+		else:
+			results = self.count_from_cache()
+
+		#running totals of cumulative metrics carried across chunks
+		offsets = {}
+		current = None
+
+		for chrid, starts, ends, values in results:
+			if chrid != current:
+				if current is not None:
+					self.checkpoint(str(current))
+
+				current = chrid
+
+			if not starts.size:
+				continue
 
-class CirchartGCSkewPrepareProcess(CirchartGCContentPrepareProcess):
-	def _calc_gc(self, seq, i, j):
-		g = seq.count('G', i, j)
-		c = seq.count('C', i, j)
+			for metric in metrics:
+				vals = values[metric]
 
-		if g or c:
-			gc = (g - c) / (g + c)
+				if COMPOSITION_METRICS[metric][3]:
+					vals = np.cumsum(vals) + offsets.get((chrid, metric), 0)
+					offsets[(chrid, metric)] = vals[-1]
 
+				rows = make_window_rows(chrid, starts, ends, vals)
+				self.send('result', (metric, rows))
+
+		if current is not None:
+			self.checkpoint(str(current))
+
+class CirchartGapPrepareProcess(CirchartBaseProcess):
+	def do(self):
+		if self.params.mode == 'fraction':
+			window = self.params.window
+			step = self.params.step
 		else:
-			gc = 0
+			window = step = None
 
-		return gc
+		tasks = []
+		for chrom, (chrid, size) in self.params.axes.items():
+			if not self.is_finished(str(chrid)):
+				tasks.append((chrom, chrid, size, self.params.minlen, window, step))
 
-class CirchartDensityPrepareProcess(CirchartBaseProcess):
-	def parse_gtf(self, cols):
-		if cols[2].lower() != self.params.feature.lower():
-			return
+		results = self.imap_tasks(_gap_task, tasks,
+			_open_pool_fasta, (self.params.genome,))
+
+		for task, rows in zip(tasks, results):
+			if rows:
+				self.send('result', rows)
+
+			self.checkpoint(str(task[1]))
 
+class CirchartDensityPrepareProcess(CirchartBaseProcess):
+	def parse_gtf_attrs(self, field):
 		attrs = {}
-		for attr in cols[8].strip(';').split(';'):
+		for attr in field.strip(';').split(';'):
 			k, v = attr.strip('"').split('"')
 			attrs[k.strip().lower()] = v.strip().lower()
 
-		for an, avs in self.params.attrfilter.items():
-			av = attrs.get(an, None)
-
-			if av not in avs:
-				return
-
-		start = int(cols[3])
-		end = int(cols[4])
-		return start, end
-
-	def parse_gff(self, cols):
-		if cols[2].lower() != self.params.feature.lower():
-			return
+		return attrs
 
+	def parse_gff_attrs(self, field):
 		attrs = {}
-		for attr in cols[8].strip(';').split(';'):
+		for attr in field.strip(';').split(';'):
 			k, v = attr.split('=')
 			attrs[k.strip().lower()] = v.strip().lower()
 
-		for an, avs in self.params.attrfilter.items():
+		return attrs
+
+	def match_attrs(self, attrs, attrfilter):
+		for an, avs in attrfilter.items():
 			av = attrs.get(an, None)
 
 			if av not in avs:
-				return
+				return False
 
-		start = int(cols[3])
-		end = int(cols[4])
-		return start, end
+		return True
 
 	def parse_gxf(self, cols):
-		if cols[2].lower() != self.params.feature.lower():
-			return
-
 		start = int(cols[3])
 		end = int(cols[4])
 		return start, end
 
-	def parse_vcf(self):
+	def parse_vcf(self, cols):
 		pos = int(cols[1])
 		return pos, pos
 
-	def parse_bed(self):
+	def parse_bed(self, cols):
 		start = int(cols[1])
 		end = int(cols[2])
 		return start, end
 
 	def do(self):
-		wsize = self.params.window
-		step = self.params.step
-
-		interval_mapping = {}
-		location_mapping = {}
-		counts_mapping = {}
-		
-		for chrom in self.params.axes:
-			ranges = pygros.Ranges()
-			locus = []
-			counts = []
-
-			chrid, size = self.params.axes[chrom]
-
-			for i in range(0, size, step):
-				j = i + wsize
-				i += 1
-
-				if j > size:
-					j = size
-
-				index = len(locus)
-				locus.append([chrid, i, j])
-				counts.append(0)
-				ranges.add(chrom, i, j, index)
-
-				if j == size:
-					break
-
-			ranges.index()
-			interval_mapping[chrom] = ranges
-			location_mapping[chrom] = locus
-			counts_mapping[chrom] = counts
+		tracks = self.params.tracks
 
 		if self.params.datatype == 'gxf':
-			if self.params.attrcheck:
-				if self.params.annotformat == 'gff':
-					parse_func = self.parse_gff
-
-				elif self.params.annotformat == 'gtf':
-					parse_func = self.parse_gtf
+			parse_func = self.parse_gxf
 
+			if self.params.annotformat == 'gtf':
+				parse_attrs = self.parse_gtf_attrs
 			else:
-				parse_func = self.parse_gxf
+				parse_attrs = self.parse_gff_attrs
+
+			#track indexes for each feature type
+			features = {}
+			for i, track in enumerate(tracks):
+				features.setdefault(track['feature'].lower(), []).append(i)
 
 		elif self.params.datatype == 'vcf':
 			parse_func = self.parse_vcf
@@ -650,6 +894,9 @@ class CirchartDensityPrepareProcess(CirchartBaseProcess):
 		else:
 			fp = open(self.params.annotfile)
 
+		fstarts = [{chrom: [] for chrom in self.params.axes} for _ in tracks]
+		fends = [{chrom: [] for chrom in self.params.axes} for _ in tracks]
+
 		with fp:
 			for line in fp:
 				if line[0] == '#':
@@ -666,72 +913,384 @@ class CirchartDensityPrepareProcess(CirchartBaseProcess):
 				if chrom not in self.params.axes:
 					continue
 
+				if self.params.datatype == 'gxf':
+					indexes = features.get(cols[2].lower())
+
+					if not indexes:
+						continue
+
+				else:
+					indexes = [0]
+
 				locus = parse_func(cols)
 				if locus is None:
 					continue
 
-				ilist = interval_mapping[chrom].overlap(chrom, locus[0], locus[1])
+				attrs = None
+				for i in indexes:
+					if tracks[i]['attrcheck']:
+						if attrs is None:
+							attrs = parse_attrs(cols[8])
 
-				for _, _, index in ilist:
-					counts_mapping[chrom][index] += 1
+						if not self.match_attrs(attrs, tracks[i]['attrfilter']):
+							continue
 
-		for chrom, locus in location_mapping.items():
-			counts = counts_mapping[chrom]
-			rows = []
+					fstarts[i][chrom].append(locus[0])
+					fends[i][chrom].append(locus[1])
 
-			for idx, loci in enumerate(locus):
-				loci.append(counts[idx])
-				loci.append('')
-				rows.append(loci)
+		mode = self.params.get('mode', 'count')
 
-			self.send('result', rows)
+		keys = []
+		tasks = []
+		for i in range(len(tracks)):
+			for chrom in self.params.axes:
+				chrid, size = self.params.axes[chrom]
+				starts = fstarts[i].pop(chrom)
 
-class CirchartLinkPrepareProcess(CirchartBaseProcess):
-	def get_gene_mappings(self):
-		gene_mappings = {}
+				if self.is_finished('{}:{}'.format(i, chrid)):
+					continue
+
+				#coverage works on 0-based half-open intervals, bed
+				#starts are already 0-based, others are 1-based
+				if mode == 'coverage' and self.params.datatype != 'bed':
+					starts = [start - 1 for start in starts]
+
+				keys.append(i)
+				tasks.append((chrid, size, self.params.window, self.params.step,
+					starts, fends[i].pop(chrom), mode))
+
+		results = self.imap_tasks(_density_window_task, tasks)
+
+		for key, task, rows in zip(keys, tasks, results):
+			self.send('result', (key, rows))
+			self.checkpoint('{}:{}'.format(key, task[0]))
+
+class CirchartVariantPrepareProcess(CirchartBaseProcess):
+	chunk_size = 100000
+	checkpoint_rows = 1000000
+	transitions = {('A', 'G'), ('G', 'A'), ('C', 'T'), ('T', 'C')}
+
+	def prerun(self):
+		#counters are kept in bins between window boundaries
+		self.samples = self.params.get('samples', [])
+		self.counters = ['snp', 'indel', 'ts', 'tv']
+
+		for s in self.samples:
+			self.counters.append(('het', s))
+			self.counters.append(('called', s))
+
+		#bins of records read before the last checkpoint
+		self.bins = self.get_state() or {}
+		self.pending = {}
+		self.count = 0
+
+	def get_bins(self, chrom):
+		if chrom not in self.bins:
+			_, size = self.params.axes[chrom]
+			edges = make_window_bins(size, self.params.window, self.params.step)
+
+			self.bins[chrom] = {
+				c: np.zeros(edges.size - 1, dtype=np.int64)
+				for c in self.counters
+			}
+			self.bins[chrom]['edges'] = edges
+
+		return self.bins[chrom]
+
+	def add_count(self, chrom, counter, pos):
+		if chrom not in self.pending:
+			self.pending[chrom] = {c: [] for c in self.counters}
+
+		self.pending[chrom][counter].append(pos)
+
+	def flush_counts(self):
+		for chrom, counters in self.pending.items():
+			acc = self.get_bins(chrom)
+
+			for c, positions in counters.items():
+				if positions:
+					bins = find_bins(acc['edges'], positions)
+					acc[c] += np.bincount(bins, minlength=acc[c].size)
+
+		self.pending = {}
+		self.count = 0
+
+	def parse_record(self, chrom, cols):
+		pos = int(cols[1])
+		_, size = self.params.axes[chrom]
+
+		if pos > size:
+			return
+
+		#0-based position
+		start = pos - 1
+		ref = cols[3].upper()
+		alts = [a for a in cols[4].upper().split(',') if a not in ('.', '*') and a[0] != '<']
+
+		if not alts:
+			return
 
-		for k in self.params:
-			if not k.startswith('sp'):
+		if len(ref) == 1 and all(len(a) == 1 for a in alts):
+			self.add_count(chrom, 'snp', start)
+
+			for a in alts:
+				if (ref, a) in self.transitions:
+					self.add_count(chrom, 'ts', start)
+				else:
+					self.add_count(chrom, 'tv', start)
+
+		elif any(len(a) != len(ref) for a in alts):
+			self.add_count(chrom, 'indel', start)
+
+		if self.samples and len(cols) > 9:
+			fmts = cols[8].split(':')
+
+			if 'GT' not in fmts:
+				return
+
+			gi = fmts.index('GT')
+
+			for s in self.samples:
+				fields = cols[9+s].split(':')
+
+				if gi >= len(fields):
+					continue
+
+				alleles = fields[gi].replace('|', '/').split('/')
+
+				if '.' in alleles:
+					continue
+
+				self.add_count(chrom, ('called', s), start)
+
+				if len(set(alleles)) > 1:
+					self.add_count(chrom, ('het', s), start)
+
+	def do(self):
+		if self.params.vcffile.endswith('.gz'):
+			fp = gzip.open(self.params.vcffile, 'rt')
+		else:
+			fp = open(self.params.vcffile)
+
+		#lines read before the last checkpoint are skipped
+		saved = last = self.get_saved()
+
+		with fp:
+			for num, line in enumerate(fp, 1):
+				if num <= saved:
+					continue
+
+				if line[0] == '#':
+					continue
+
+				cols = line.rstrip().split('\t')
+
+				if len(cols) < 5 or cols[0] not in self.params.axes:
+					continue
+
+				self.parse_record(cols[0], cols)
+				self.count += 1
+
+				if self.count >= self.chunk_size:
+					self.flush_counts()
+
+				if num - last >= self.checkpoint_rows:
+					self.flush_counts()
+					self.checkpoint(str(num), self.bins)
+					last = num
+
+		self.flush_counts()
+
+		#heterozygosity is saved for each selected sample
+		keys = [m for m in self.params.metrics if m != 'het']
+		keys.extend(('het', s) for s in self.samples)
+
+		for chrom, (chrid, size) in self.params.axes.items():
+			acc = self.get_bins(chrom)
+			starts, ends = make_genome_windows(size, self.params.window, self.params.step)
+
+			def total(counter):
+				return sum_window_bins(acc[counter], starts, ends, acc['edges'])
+
+			for key in keys:
+				if key in ('snp', 'indel'):
+					values = total(key)
+
+				elif key == 'titv':
+					ts = total('ts')
+					tv = total('tv')
+					values = np.zeros(ts.size, dtype=np.float64)
+					np.divide(ts, tv, out=values, where=tv > 0)
+
+				else:
+					het = total(key)
+					called = total(('called', key[1]))
+					values = np.zeros(het.size, dtype=np.float64)
+					np.divide(het, called, out=values, where=called > 0)
+
+				rows = make_window_rows(chrid, starts, ends, values)
+
+				if rows:
+					self.send('result', (key, rows))
+
+class CirchartDepthPrepareProcess(CirchartBaseProcess):
+	chunk_size = 1000000
+	checkpoint_rows = 10000000
+
+	def prerun(self):
+		#windows are made of whole bins, bins keep running accumulators
+		#of records read before the last checkpoint
+		self.bins = self.get_state() or {}
+		self.pending = {}
+		self.count = 0
+
+	def get_bins(self, chrom):
+		if chrom not in self.bins:
+			_, size = self.params.axes[chrom]
+			edges = make_window_bins(size, self.params.window, self.params.step)
+			num = edges.size - 1
+
+			self.bins[chrom] = {
+				'edges': edges,
+				'sums': np.zeros(num, dtype=np.float64),
+				'covers': np.zeros(num, dtype=np.int64),
+				'maxs': np.full(num, -np.inf, dtype=np.float64),
+				'hists': [{} for _ in range(num)] if self.params.stat == 'median' else None
+			}
+
+		return self.bins[chrom]
+
+	def parse_bedgraph(self, cols):
+		return int(cols[1]), int(cols[2]), float(cols[3])
+
+	def parse_depth(self, cols):
+		#samtools depth, 1-based position and depth of first sample
+		pos = int(cols[1])
+		return pos - 1, pos, float(cols[2])
+
+	def add_record(self, chrom, start, end, value):
+		if chrom not in self.pending:
+			self.pending[chrom] = ([], [], [])
+
+		starts, ends, values = self.pending[chrom]
+		starts.append(start)
+		ends.append(end)
+		values.append(value)
+		self.count += 1
+
+		if self.count >= self.chunk_size:
+			self.flush_records()
+
+	def flush_records(self):
+		for chrom, (starts, ends, values) in self.pending.items():
+			_, size = self.params.axes[chrom]
+			starts = np.array(starts, dtype=np.int64)
+			ends = np.minimum(np.array(ends, dtype=np.int64), size)
+			values = np.array(values, dtype=np.float64)
+
+			keep = ends > starts
+			starts = starts[keep]
+			ends = ends[keep]
+			values = values[keep]
+
+			if not starts.size:
 				continue
 
-			sp = self.params[k]
+			acc = self.get_bins(chrom)
+			bins, lens, idx = split_bin_intervals(starts, ends, acc['edges'])
+			vals = values[idx]
 
-			if sp['annoformat'] == 'gtf':
-				split_attrs = lambda x: x.split('"')
-			else:
-				split_attrs = lambda x: x.split('=')
+			np.add.at(acc['sums'], bins, vals * lens)
+			np.add.at(acc['covers'], bins, lens)
+			np.maximum.at(acc['maxs'], bins, vals)
 
-			if sp['annotation'].endswith('.gz'):
-				fp = gzip.open(sp['annotation'], 'rt')
-			else:
-				fp = open(sp['annotation'])
+			if acc['hists'] is not None:
+				keys, inverse = np.unique(np.column_stack((bins, vals)),
+					axis=0, return_inverse=True)
+				bases = np.bincount(inverse.ravel(), weights=lens)
 
-			with fp:
-				for line in fp:
-					if line[0] == '#':
-						continue
+				for (b, v), n in zip(keys.tolist(), bases.tolist()):
+					h = acc['hists'][int(b)]
+					h[v] = h.get(v, 0) + int(n)
 
-					line = line.strip()
+		self.pending = {}
+		self.count = 0
 
-					if not line:
-						continue
+	def do(self):
+		if self.params.depthformat == 'depth':
+			parse_func = self.parse_depth
+		else:
+			parse_func = self.parse_bedgraph
 
-					cols = line.strip().split('\t')
+		if self.params.depthfile.endswith('.gz'):
+			fp = gzip.open(self.params.depthfile, 'rt')
+		else:
+			fp = open(self.params.depthfile)
 
-					if cols[2] != sp['feature']:
-						continue
+		#lines read before the last checkpoint are skipped
+		saved = last = self.get_saved()
 
-					if cols[0] not in sp['karyotype']:
-						continue
+		with fp:
+			for num, line in enumerate(fp, 1):
+				if num <= saved:
+					continue
+
+				if line[0] == '#' or line.startswith(('track', 'browser')):
+					continue
+
+				cols = line.split()
+
+				if len(cols) < 3 or cols[0] not in self.params.axes:
+					continue
+
+				self.add_record(cols[0], *parse_func(cols))
+
+				if num - last >= self.checkpoint_rows:
+					self.flush_records()
+					self.checkpoint(str(num), self.bins)
+					last = num
 
-					chrid = sp['karyotype'][cols[0]]
-					start = cols[3]
-					end = cols[4]
+		self.flush_records()
 
-					for attr in cols[8].split(';'):
-						if attr.strip().startswith(sp['attribute']):
-							val = split_attrs(attr)[1].strip().strip('"')
-							gene_mappings[val] = (chrid, start, end)
+		for chrom, (chrid, size) in self.params.axes.items():
+			acc = self.get_bins(chrom)
+			starts, ends, values = calc_window_depth(size, self.params.window,
+				self.params.step, acc['edges'], acc['sums'], acc['covers'],
+				acc['maxs'], acc['hists'], self.params.stat)
+
+			rows = make_window_rows(chrid, starts, ends, values)
+
+			if rows:
+				self.send('result', rows)
+
+class CirchartLinkPrepareProcess(CirchartBaseProcess):
+	def get_gene_mappings(self):
+		species = [k for k in self.params if k.startswith('sp')]
+
+		#parse annotations of species without gene index in parallel
+		missing = {}
+		for k in species:
+			sp = self.params[k]
+
+			if sp['genes'] is None:
+				task = (sp['annotation'], sp['annoformat'], sp['feature'], sp['attribute'])
+				missing.setdefault(task, []).append(k)
+
+		tasks = list(missing)
+		for task, genes in zip(tasks, self.imap_tasks(_gene_index_task, tasks)):
+			keys = missing[task]
+			self.send('cache', (keys[0], genes))
+
+			for k in keys:
+				self.params[k]['genes'] = genes
+
+		gene_mappings = {}
+		for k in species:
+			sp = self.params[k]
+
+			for gene, chrom, start, end in sp['genes']:
+				if chrom in sp['karyotype']:
+					gene_mappings[gene] = (sp['karyotype'][chrom], start, end)
 
 		return gene_mappings
 
@@ -767,30 +1326,177 @@ class CirchartLinkPrepareProcess(CirchartBaseProcess):
 
 		return [rseqid, rstart, rend, qseqid, qstart, qend, '']
 
+	def score_blast(self, cols):
+		match self.params.rankby:
+			case 'identity':
+				return float(cols[2])
+
+			case 'length':
+				return int(cols[3])
+
+			case _:
+				return float(cols[11])
+
+	def score_mummer(self, cols):
+		identity = float(cols[6])
+		length = int(cols[4])
+
+		match self.params.rankby:
+			case 'identity':
+				return identity
+
+			case 'length':
+				return length
+
+			#no bit score in coords file, use matched bases
+			case _:
+				return identity * length
+
+	def split_mcscanx(self, cols):
+		#anchor ids wider than the padding are glued, e.g. 12-100:
+		if cols[0].endswith(':'):
+			return cols[0].split('-')[0], cols[1:3]
+		else:
+			return cols[0].rstrip('-'), cols[2:4]
+
 	def parse_mcscanx(self, cols, mappings={}):
-		tests = [col in mappings for col in [cols[2], cols[3]]]
+		_, genes = self.split_mcscanx(cols)
+		tests = [col in mappings for col in genes]
 
-		if not all(tests):
+		if len(genes) < 2 or not all(tests):
 			return
 
 		row = []
-		row.extend(mappings[cols[2]])
-		row.extend(mappings[cols[3]])
+		row.extend(mappings[genes[0]])
+		row.extend(mappings[genes[1]])
 		row.append('')
 		return row
 
-	def parse_jcvi(self, mappings={}):
+	def parse_jcvi(self, cols, mappings={}):
 		tests = [col in mappings for col in [cols[0], cols[1], cols[2], cols[3]]]
 
 		if not all(tests):
 			return
 
-		sg1 = gene_mappings[cols[0]]
-		eg1 = gene_mappings[cols[1]]
-		sg2 = gene_mappings[cols[2]]
-		eg2 = gene_mappings[cols[3]]
+		sg1 = mappings[cols[0]]
+		eg1 = mappings[cols[1]]
+		sg2 = mappings[cols[2]]
+		eg2 = mappings[cols[3]]
+
+		#twist inverted blocks
+		if len(cols) > 5 and cols[5] == '-':
+			return [sg1[0], sg1[1], eg1[2], sg2[0], eg2[2], sg2[1], '']
 
-		return [sg1[0], sg1[1], eg1[2], sg2[0], sg2[1], sg2[2], '']
+		return [sg1[0], sg1[1], eg1[2], sg2[0], sg2[1], eg2[2], '']
+
+	def iter_links(self, parse_func, mappings):
+		with open(self.params.dsynteny) as fh:
+			for line in fh:
+				if line[0] == '#':
+					continue
+
+				cols = line.strip().split()
+				row = parse_func(cols, mappings)
+
+				if row is None:
+					continue
+
+				yield row, cols
+
+	def top_links(self, links, score_func):
+		#keep the best N hits per chromosome pair with bounded heaps
+		topn = self.params.topn
+		heaps = {}
+
+		for i, (row, cols) in enumerate(links):
+			heap = heaps.setdefault((row[0], row[3]), [])
+			item = (score_func(cols), -i, row)
+
+			if len(heap) < topn:
+				heapq.heappush(heap, item)
+			else:
+				heapq.heappushpop(heap, item)
+
+		for heap in heaps.values():
+			for _, _, row in sorted(heap, reverse=True):
+				yield row
+
+	def ribbon_links(self, links):
+		#merge hits falling into the same window pair into one ribbon
+		window = self.params.ribbon
+		ribbons = {}
+
+		for row, _ in links:
+			chr1, s1, e1, chr2, s2, e2 = row[:6]
+			strand = -1 if (s1 > e1) == (s2 > e2) else 1
+			s1, e1 = sorted((s1, e1))
+			s2, e2 = sorted((s2, e2))
+
+			key = (chr1, (s1 - 1) // window, chr2, (s2 - 1) // window)
+			ribbon = ribbons.get(key)
+
+			if ribbon is None:
+				ribbons[key] = [s1, e1, s2, e2, 1, strand]
+			else:
+				ribbon[0] = min(ribbon[0], s1)
+				ribbon[1] = max(ribbon[1], e1)
+				ribbon[2] = min(ribbon[2], s2)
+				ribbon[3] = max(ribbon[3], e2)
+				ribbon[4] += 1
+				ribbon[5] += strand
+
+		for (chr1, _, chr2, _), (s1, e1, s2, e2, count, strand) in ribbons.items():
+			#twist ribbons made mostly of inverted hits
+			if strand > 0:
+				s2, e2 = e2, s2
+
+			yield [chr1, s1, e1, chr2, s2, e2, "count={}".format(count)]
+
+	def block_links(self, mappings):
+		#collapse anchors of each collinear block into one ribbon
+		blocks = {}
+		strands = {}
+
+		with open(self.params.dsynteny) as fh:
+			for line in fh:
+				if line.startswith('## Alignment'):
+					cols = line.split()
+					strands[cols[2].rstrip(':')] = cols[-1]
+					continue
+
+				if line[0] == '#':
+					continue
+
+				cols = line.strip().split()
+
+				if not cols:
+					continue
+
+				row = self.parse_mcscanx(cols, mappings)
+
+				if row is None:
+					continue
+
+				bid, _ = self.split_mcscanx(cols)
+				chr1, s1, e1, chr2, s2, e2 = row[:6]
+
+				#anchors of a block lie on the same chromosome pair
+				key = (bid, chr1, chr2)
+				block = blocks.get(key)
+
+				if block is None:
+					blocks[key] = [s1, e1, s2, e2]
+				else:
+					block[0] = min(block[0], s1)
+					block[1] = max(block[1], e1)
+					block[2] = min(block[2], s2)
+					block[3] = max(block[3], e2)
+
+		for (bid, chr1, chr2), (s1, e1, s2, e2) in blocks.items():
+			if strands.get(bid) == 'minus':
+				s2, e2 = e2, s2
+
+			yield [chr1, s1, e1, chr2, s2, e2, '']
 
 	def do(self):
 		if self.params.datatype in ['mcscanx', 'jcvi']:
@@ -800,9 +1506,11 @@ class CirchartLinkPrepareProcess(CirchartBaseProcess):
 
 		if self.params.datatype == 'blast':
 			parse_func = self.parse_blast
+			score_func = self.score_blast
 
 		elif self.params.datatype == 'mummer':
 			parse_func = self.parse_mummer
+			score_func = self.score_mummer
 
 		elif self.params.datatype == 'mcscanx':
 			parse_func = self.parse_mcscanx
@@ -810,23 +1518,44 @@ class CirchartLinkPrepareProcess(CirchartBaseProcess):
 		elif self.params.datatype == 'jcvi':
 			parse_func = self.parse_jcvi
 
+		links = self.iter_links(parse_func, mappings)
+		linkfilter = self.params.get('linkfilter', 'all')
+
+		if self.params.datatype == 'mcscanx' and self.params.get('collapse'):
+			links = self.block_links(mappings)
+
+		elif self.params.datatype not in ['blast', 'mummer']:
+			links = (row for row, _ in links)
+
+		elif linkfilter == 'top':
+			links = self.top_links(links, score_func)
+
+		elif linkfilter == 'ribbon':
+			links = self.ribbon_links(links)
+
+		else:
+			links = (row for row, _ in links)
+
+		#links are generated in the same order on every run, rows already
+		#saved before the last checkpoint are skipped
+		saved = self.get_saved()
+		count = 0
 		rows = []
-		with open(self.params.dsynteny) as fh:
-			for line in fh:
-				if line[0] == '#':
-					continuea
 
-				cols = line.strip().split()
-				row = parse_func(cols, mappings)
+		for row in links:
+			count += 1
 
-				if row is None:
-					continue
+			if count <= saved:
+				continue
 
-				rows.append(row)
+			rows.append(row)
 
-				if len(rows) == 200:
-					self.send('result', rows)
-					rows = []
+			if len(rows) == 200:
+				self.send('result', rows)
+				rows = []
+
+				if count % self.checkpoint_rows == 0:
+					self.checkpoint(str(count))
 
 		if rows:
 			self.send('result', rows)
@@ -888,6 +1617,7 @@ class CirchartTextPrepareProcess(CirchartBaseProcess):
 	def do(self):
 		rows = []
 		attr = self.params.attribute.lower()
+		thin = self.params.get('thin', False)
 
 		if self.params.annotformat == 'gff':
 			parse_func = self.parse_gff
@@ -903,8 +1633,15 @@ class CirchartTextPrepareProcess(CirchartBaseProcess):
 		else:
 			fp = open(self.params.annotfile)
 
+		#lines read before the last checkpoint are skipped, thinned labels
+		#are only sent at the end and never checkpointed
+		saved = last = self.get_saved()
+
 		with fp:
-			for line in fp:
+			for num, line in enumerate(fp, 1):
+				if num <= saved:
+					continue
+
 				if line[0] == '#':
 					continue
 
@@ -928,14 +1665,64 @@ class CirchartTextPrepareProcess(CirchartBaseProcess):
 				row = [chrid]
 				row.extend(loci)
 				row.append('')
+
+				if thin:
+					row.append(self.label_priority(cols, loci))
+
 				rows.append(row)
 
-				if len(rows) == 200:
+				if not thin and len(rows) == 200:
 					self.send('result', rows)
 					rows = []
 
-		if rows:
-			self.send('result', rows)
+					if num - last >= self.checkpoint_rows:
+						self.checkpoint(str(num))
+						last = num
+
+		if thin:
+			rows = self.thin_rows(rows)
+
+		for i in range(0, len(rows), 200):
+			self.send('result', rows[i:i+200])
+
+	def label_priority(self, cols, loci):
+		start, end, _ = loci
+
+		if self.params.rankby == 'score':
+			#score is the 6th column in gff/gtf and 5th column in bed
+			idx = 4 if self.params.annotformat not in ('gff', 'gtf') else 5
+
+			try:
+				return float(cols[idx])
+			except (IndexError, ValueError):
+				return 0
+
+		return end - start
+
+	def thin_rows(self, rows):
+		#keep labels that fit in one label slot along the track circle,
+		#whitelisted labels are placed before others, this only thins
+		#labels, kept labels keep feature coordinates and are laid out
+		#by circos snuggling
+		genome = sum(size for _, size in self.params.axes.values())
+		slot = calc_label_slot(genome, len(self.params.axes),
+			self.params.radius, self.params.fontsize)
+		whitelist = set(self.params.whitelist)
+
+		chroms = {}
+		for row in rows:
+			chroms.setdefault(row[0], []).append(row)
+
+		kept = []
+		for chrid, items in chroms.items():
+			mids = [(r[1] + r[2]) // 2 for r in items]
+			priorities = [r[5] for r in items]
+			pinned = [r[3] in whitelist for r in items]
+
+			for i in thin_labels(mids, priorities, slot, pinned):
+				kept.append(items[i][:5])
+
+		return kept
 
 class CirchartDataExtractProcess(CirchartBaseProcess):
 	def format_plot_data(self, rows):
@@ -1045,6 +1832,107 @@ class CirchartCircosPlotProcess(QProcess):
 		self.setArguments(['-conf', 'plot.conf', '-nopng', '-file', 'circos.svg'])
 		self.setWorkingDirectory(workdir)
 
+class CirchartCircosDaemon:
+	#long lived circos server shared by all plot workers, render returns
+	#None when the server is not usable and one-shot circos is needed
+	process = None
+	disabled = False
+	lock = threading.Lock()
+	waits = {}
+	counter = 0
+
+	@classmethod
+	def usable(cls):
+		if cls.disabled or os.name == 'nt':
+			return False
+
+		settings = QSettings()
+
+		if not settings.value('Circos/daemon', True, type=bool):
+			return False
+
+		return CIRCOS_DAEMON.is_file() and os.path.isfile(CIRCOS_COMMAND)
+
+	@classmethod
+	def start(cls):
+		try:
+			cls.process = subprocess.Popen(
+				['perl', str(CIRCOS_DAEMON), str(CIRCOS_PATH)],
+				stdin = subprocess.PIPE,
+				stdout = subprocess.PIPE,
+				text = True,
+				bufsize = 1
+			)
+		except OSError:
+			cls.disabled = True
+			return False
+
+		#wait for modules to be loaded
+		if cls.process.stdout.readline().strip() != 'ready':
+			cls.process.wait()
+			cls.process = None
+			cls.disabled = True
+			return False
+
+		reader = threading.Thread(target=cls.receive, args=(cls.process,), daemon=True)
+		reader.start()
+		return True
+
+	@classmethod
+	def receive(cls, process):
+		for line in process.stdout:
+			cols = line.split()
+
+			if len(cols) == 3 and cols[0] == 'done':
+				with cls.lock:
+					wait = cls.waits.pop(cols[1], None)
+
+				if wait:
+					wait[1] = int(cols[2])
+					wait[0].set()
+
+		#server died, release pending jobs to fall back
+		with cls.lock:
+			if cls.process is process:
+				cls.process = None
+
+			prefix = '{}:'.format(process.pid)
+
+			for job in [k for k in cls.waits if k.startswith(prefix)]:
+				cls.waits.pop(job)[0].set()
+
+	@classmethod
+	def render(cls, workdir):
+		if not cls.usable():
+			return None
+
+		with cls.lock:
+			if cls.process is None and not cls.start():
+				return None
+
+			cls.counter += 1
+			job = "{}:{}".format(cls.process.pid, cls.counter)
+			wait = cls.waits[job] = [threading.Event(), None]
+
+			try:
+				cls.process.stdin.write("{} {}\n".format(job, workdir))
+				cls.process.stdin.flush()
+			except OSError:
+				cls.waits.pop(job)
+				return None
+
+		wait[0].wait()
+		return wait[1]
+
+	@classmethod
+	def stop(cls):
+		with cls.lock:
+			if cls.process is not None:
+				cls.process.stdin.close()
+				cls.process = None
+
+atexit.register(CirchartCircosDaemon.stop)
+
 class CirchartSnailPlotProcess(CirchartBaseProcess):
 	def do(self):
 		outfile = os.path.join(self.params.workdir, 'snail.svg')
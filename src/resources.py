@@ -1,270 +1,265 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.3
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x0a-\
-\x00\
-\x00Prx\xda\xed\x5cK\x93\xe3\xb6\x11\xbe\xebW\xb0\
-<\x87I\xaa4[\xa4v\xc7\x9b\xcc-\xce\x96O\xa9\
-\xcaa\x9dK.*\x88\x84$\xd4@\x04\x03\x80\xa3\xd1\
-\x1e\xf2\xdb\xd3\x00_ \x00R|\x88\xb3kg\xec\x92\
-=\x84\xd0\xdd\x1f\x1a\xdd\x8dF\x03\xe2\x01\xa7\x98#\xfa\
-\xb4\x0a\x82\x07\xf8\x04A\x8aN\xf8)\xc8(\x93[\x92\
-\xe8\x16y\xc9\xa0\x85c\x94\xb0\x94^|\x1dU\x8f\x81\
-]\xd5\x9f\xd7\xbb>#~a\x16\xd7#I\x12\x9c\xae\
-V$\xc1\xec\xc0\xd1IC.\xfb\x8b#;\x1b]w\
-\x8cQ\xfd\x98\xe0=\xca\xa9|\x0a\xee/X\xdc[B\
-D\x86b\x92\x1et\x0bE;L\x9f\x82/E\xff\xd6\
-W\x05\xcb=eH\xeag\x8e\xd2\x03~\xd2\x7f*\x00\
-a\xfdWT\x8a\x8c\xc9\x09\x14\x1a<\xeaG!q\xf6\
-\x14\x84\x1f\xc20j#RM\x8f\x16\x22\x8e\x12\x92\x8b\
-e\xa5\xfe\xd5\x92)\x8f$~N\xb10\xc5\x92\xf4\x9a\
-\xd00\x0c\xdb\x8c?\x86\x16\xdf=\xa1t\xfc\x94H\xce\
-\x9e\xf1v\x12\xa6\x8d\x85(\xf2\xf3\x8e\x19e\xdc\xe0\xdb\
-<7JZ\xc3\xbf65X\xd8v\x87\xd2\xc4\xc4t\
-\xe0,\xcf\xacQ\xa5\xec\xde\xa3\x09\x87\xb4[\x1fA\x90\
-!\x8eSi\xc949\xaa\xb6\xad\x04M\x08\xdd5\xbe\
-\x8c\xd1\xd3\xa35\xd8\x11\x22\xe7LOd[\xcc\x04\xc1\
-\x03\xe6n\xf3\xf8\xb8.?#\xf8'H\x22\x93\xef\x91\
-\x91\x18\x17\xc3\x13,\xe7q\xd9\xaf\xee\xe6\xe5\x0a\xd40\
-\xa9\x92\x80\xe7\xfd\xf4\xb7$\x09\xe2\x5cHv\xd2\x84\x81\
-\xa2\x84\xaf\x9b\xc0\xa6\xac\x02\xff\xb4Z\xa9H\x83\x85\x13\
-~\x11\xe1g\x22\xb0\x19\x9bvX\x9e1\x04@\x13&\
-g'\xd1\x13\xd5z\xa7&j,\x22t\x5cgU\x84\
-\x22\x17\x99\x96\xe9\xa8\xea\x06q\xec\xb1\x1d\xc7>\xb6\xe3\
-\x98\x1d\xc6V+\xad\x15\x07\x9e\x9e\x10\xfdU\xbf\xaf\xb9\
-^\xaa\x89\xb6\x0e\xf2\xba\xc1\xed\xbbg\xfcT\x8e\xca\xd2\
-Em5\xf5\xe8\x1aH\xd5\xa2\xd5\xc12\x1d\xc8\xb0\x1c\
-J\xfd\xbcc4\xa9\x1f\x88D\x94\xc4\xad\xef\x8c\xa6Z\
-\x0b\x0d\x0f\x17I\x0c\xf6\x8d\xf9\xe8\x00^\x10\x0b\xf2\x0d\
-\x8f\x0b\xdd\x96\x01~\xfa\x8b\x1f\xd4\xb4\xd8]\x10\x83\xcf\
-\x22J1\x9d8\xa6\x18\x09<lj\xf2,+5\xa7\
-g\x9e\x9d\xe1i%!d\xfa\xadU\x7f3\xc4Z!\
-\x12\xe0\x17\x15\x09\xc2.6\x85\xe5\x0f]f:\xb8i\
-\x0fg\x82\x9d\xb0\xd8\xe6)\x91\xbe(_\xf8e\x9d\x05\
-\xf4\xe6\x09\xc5?V\x801\x1a;`t{b\x1d\x11\
-\x7f\x83!\xb7\x9a\xfd\x9c\x8a\xf9;\xe5*4S\xd22\
-jXW,\xedD\xf8\xe1\xe7^\xf50N\xc05\x90\
-$,\x1df\x0e,o\xbc\x94\xa4\xbd\xf384t\xf7\
-xNd\x0a\xb0S\xa0\x11\xfe\xd3\xc9\xa3o\xf1oV\
-\xe1a\xb9@\x87\x88\xd9\xe1#\xeag\xef[#\xbaS\
-\xb9N>\xd3b\x9d\x93\x07m<\x89P\x83\xaeW6\
-\xdb\xef\x05\x96\xb3\xa4GS\xa4;+_%\xb7t\xcc\
-\x7f\xa8\xffUk\xb9\x98\x9b\x8e^\x85#\xf2\xfd\x9e\xbc\
-z\xdc\xfa\x1a\x9b\x15\xe4\xd0eX\x161\x92\xb0\xe0\x15\
-\x08\x1fJt\x05\xfb:\xeb\xf3\xa5\x87M\x82\xa8\xb6\xb7\
-u\xd7jc\xca\xc3\x16\xa5\x0aV\xa8\xca\x03\xealQ\
-\x1e1h\x10\xf6\xe1e0\x0b\xd8^\xb7)\x8e\x81\x86\
-\xe8A\xc5\xa3\x81\x9c!\xfe\x8c\xe3|\xa0\x97\xec\xe8\x19\
-p{\xbc\xe5\x93\x1ajLxL\xb1\xd1\xc0q,a\
-\xbe[m\x92\x13\xbbI\xfc'\x87\x092\x19q&\x84\
-=\x06qD\x90.\x03p\x8dK%\xd1\x90\x97*\x13\
-\xd4#)\xe7M\x8f\xa8k,\x8d\x8f\xda\xf6j\xd9\xa5\
-i\x99\xa6\xb7\xb8\xfeb\xe2\x03\xe6\x95^\xb5\xb85\xb0\
-\x0f2\xf2Z\xad\xc4mDM\xccu\xa3\xb0)\xe71\
-\x5c\x97\x1f[ \xd9+\x0d$\xebFbp\x86-&\
-l\x10`n(I\x02\xb5\xe1\xd0\x80\x880\x98\xb7a\
-8;\xaa^4\xcd\xaa0\x00\xc7\x11\xbd`\xc0\xa0\x0c\
-\x8f\x92\x14\x0f\x85\xd2^X\xe6\xcf\xd4\x00\xbc\xf7\xa2\x06\
-\xd9 \xd7Xk0\xfd\x93i'\x03\x03\x1d\xa6I\x09\
-\xca\xa4\x00\x9e\x14\x8a\x9bE\x9fv\xa4\xf8\x1d\xc6\xa09\
-v\xa9\xe7\xb3\xcb\xd8nme\x91W\xfa\x99$\xf2\xb8\
-\xac\xbd\x80\x95\xca\xba\x0e\xfan4\x8b\x1a\xcdB\x11j\
-\x9c\xed\xe82\xe2\xc0!\xdaU0K\xb3;\x88i\x8a\
-]\xe7\x80\xf1\xab\xc4i\xb2\xdd\x91\xb6\x99\xd6\xbbI_\
-\x96\xec\xca\x80\xf0J\xf1^\xea\xf5\x88\x93\xc3Q\xc2Z\
-\x99`\x11\xc0\xa2_J\xc0\x89Z\xcfU\xf7\x13I\x1e\
-2\x06\xba\xac\xea\x5cE\x1cV\xa4\xea\xeb\x14\x03\xfd\x0e\
-\xcc\x16\xf6GA\x05\xeb!X\xca\xb9\x84\x04\x0b\xc3\xc9\
-\x0c\xd7\x920\xc0w\xd7\xfa\x03\xb8\x96\xf8\x83:\xd0\xc2\
-\x1et\xc4H\x9eP\xf6\xbe8\xbdI\x96;'\xb7\xb7\
-\xd7\x0a\x8bW\x8c(\xdeRv\xd8\xee\xaa\x02\xa8[\xd4\
-\x1f\x0c\xdb\xaa\xe7\x1b\xf5\xfe\x8d\xdf\x83\x07E\xa1J\x97\
-e\xf5\xa1l\x83FI\xe8\x9c\x9c\x9a\xb2\x98\xfc\xff\xc5\
-p{\xe79\xcb\xb6\xa2\xcf\xeb\xf2\xf3\xd6\xb1\xbf-\x8a\
-\xa2\x0b\xe6\xe2\xb65\x00\x9f\x84-{\xc1\x1c\x1c\xe3<\
-&~\x1e!\xa8\x9bU\x10F)\xca\x84\xd9t\xe0%\
-\xc7\xb6\xcc\x13\xe2\x07k\x85\x19\xe1\x94W}\xf2\xa3\x13\
-l>\x84\x1b\x0f\x8c\x0c%IU\xb7\x9e\xaf\xdd\x8fo\
-\xb1k\x0b\x97\xda\x9c\x19\xe7f\xe6r\xa8\xd2\xc1\xf7l\
-\xb2\xe3\xb0s\xa0\xa2\xdbG\x9e\xd6\xa1\xa7s\xec\xe99\
-\xf8\xf4\x81\xb8eips\x8b\xc4yI\xd7\xf2I\xe0\
-\xcb\x8b(\xca\xef$}n\xbbos\xe4\xe2\xcb\x86\xad\
-\xd4T\x91/\xb6Kh\x9f\x13\xd4@\x1f\x5c\x04\x83s\
-\xaah\x1d\x85?\xaf?\x7f\x1a%\xa1\xb0\xc84?4\
-u\xf2A\xaa\xb2\x16\x85\xd7\x8a\xc76!\xb0\x93Mc\
-\xbc\x90\xbe\x5c\xc0\xd6\xc4\x970\x04:e\xf4v66\
-\x15\x86d\x14sG\x1d\xc3W\xcc\xab9k\xf8a\xf3\
-\xd8\xb5\xaa\x8e\x05\xcb\xf1\x1e\xb6\xaccv\x8fc%h\
-\x83V\xf9\x0ad\x1b[\x89\x85|;a\xde\x89\x98n\
-\x10\x9b^P\xf0e\xcc`\xf1\x8b%\xe3\xef\xbb\x81e\
-\x0b\xe13\x16?]\xd3>\x1c\xa9\xaas,3M\xd5\
-\xcd\xe1i%\x19\xa6\x8cI\x14\x8ae\x82\xa84\xb1R\
-t\x8d[\x15cv\xaa\xce\x04\xdaM\x8b\x19/e\x16\
-\xf5\x1a9\xd2xN0\xab\xaf.\xf0\xc5Lj\x80\xbc\
-\xd1\x866\xa6nm\xec=\xd7\xe1\x87O\xb6|M\xe3\
-*]\xd0*m\x9c}\xc69B\xea\x8e\xf1\x04\xf3u\
-\x90ptN\xd5\xe1\xa2\xbd\x9d\x0d\x88\x08\xaa\xeb\x19\xdf\
-\xe7\xc4\xb3\x80\xd8:\xcc\xdc\x07(\xbd\xac{uX\x05\
-\x08\x96\x9d\xd8\x98E\xa1=\xc6o\x13\x07U\x0f\xab\xac\
-\xe6\xfc;\xf8\x823y\xbcZ\xe0\xfd\xf6\x90\xa8~\xce\
-\xc8\xd6*\xf8\x83\xbe\xa9J@\x0a\x0b\xd6J\x01\xff<\
-\x83^\x8eM\xcf\xa2\xae\xaa\xa7\xb3<\x90}\x9e\x13\x87\
-\x80\xbc#\x0e\xcd)\xa6\xb7\x8cQ\xc9\xd0\x95\xed\xefq\
-\xd0\xd9\xd8\xf9\x004\xc6-\xbd\xc9y\xd7\xa8B\xc5'\
-_\xec*b\x9d\x13\xbe!\xa0\x9dH\x8a\xcc&5\x96\
-\xceaD\x9d\xe3P\x95\x1c\x10\xc5s\xbc\xd4\xc0:A\
-m~,P;\xfc\x8d`\xbe\x9d5\xef\x13\xaa\xc6\x8e\
-\xbf\xf4\xce\xfb\x91\xf0\xa4\x0a\x0fAqx\xa2n\x88\xa8\
-U\x5c\x85\x01\xdd\xe9\x17=\x90 \xce\xf9\x8b\xcf\xb0c\
-n'\xce\xcb\x8e\xef\xc3\xe35eo\xb3\x9c\x13yY\
-\xca\xd7<\x90>\xfb0q\xb2\xdbY\x85\xb41\xbb\xd8\
-Akw\x99\xae\xfc\xb7%\xcb\xb8X\xb9Y\x97\x1f\xdb\
-*\xce\x8c?\xeb,\xad\x84\x19\x5c\xea\xf8]\xed!\x0c\
-\x9e\x93\x16o/\xb6\xd9Aw\x0e\xf0=E\x9d\xaby\
-\xbf&\x9b;\xe3\x06\x14Dip\x81\xc5\xae\x14(\x82\
-<\x95g\x02\x86\x93\x0c\x05\xd4\x95\x22\x8c\x0cX7\xcb\
-\x19\x8a\xba\xcc\x8a\xe7\x14_\xbb\x13\x0aA#!n\xa5\
-\xd8j-\xe1\xec\x11m\x8e\xce \x5c\x08c(\xf5_\
-\x15\xe7\x17Dsl\xb4\x16\x9c\xd3\xfc\xb43\xcb\xca\x0e\
-\xd9=K\xef\x1d\xaa\xe6\xc7:\xb6\x09_\xac\x02\x93\xd9\
-\xe2A\x0dz\xe0&\xea\xd6\x1d\xd1\xfa\xd9,\xa6\x96\x07\
-\x19\xcc,\x85{|\xdahn\x1c\xaa\xe76\xdc\xefI\
-\xef\x8b(\xdeV^Kk\xbdw\xc2\xdeUg\xa9\xce\
-\xd9\x98v\x19c\xcfm\xa0\xe5\x94\xfa\xc6\x0e=D\x0f\
-=w:\xde\x8dK\xeb\xaf\xe7\xce\xc1w\xb3\x14?Q\
-+T\xd7\x83V\x8doi^C\xac\xae\xeb\xe8\xf4\xad\
-MN\xe1\xf8\x81\xa3\x99q\x9c\xd9S\xbcXNi0\
-\xd4\xc8?~\xdcO\xb5\x19O\x05\x01\x99\xcbh|P\
-\xd0t\x9b\xf1t8M\xa2IT\x13dU\x9b\xd4\xc8\
-\xef\x9d\xd7\x097c\x09\xd5\xd7\xd1\x14\xa2\xd1\x928~\
-q\x05\x19\xbb\x90\x0e\x9a\xcd\x15\x9a\xc0!\x22\xe9\xcbX\
-9D\xdd\xdb\x00\xcb\x9b@\xc7\xd1\x04\xbaIQ\xdbK\
-TM|\x0f\xdd\xded;T\x98d\xa3I\xccw\x14\
-8t\xe2\x0a\xc0.y\xa2\x17c\xf7\xd0\xfa\xe8\x8a\x13\
-\x9a~U\xbe]\xea\xde\xb4}k\xfd\x1a\xae)-\xe9\
-\xdb,\x9e\x92\x9a\xd3\xde\xae\xfe\xe8\x1f\xe3\xb5j\x96M\
-\xcbf\xb5B\xaf\xee\x0b\x1en\xf1\xea\x1b\xcf\xcb\x1bZ\
-o\xb70\xb5\xbc\x90\x8c!\xaf\x0a\xf9\x14\xae\xcb\xcf\x8d\
-\xde\x89\xe3\xbcEc\x07\x1b\x07U\xf5J\x13G\xcf\x97\
-p\xc9\xe1_\xa2\x1fH\xb9+\x91\x22\xa2_1u\xa7\
-\xb8\xdc\xd5\xa6\x86\x0f'\x9c\xea\x17\x0c\xdc\xb5\xd5|g\
-@\xbdk\xb0\xde\xb5\xdf*P\xb4\xb4^*P\xb2\xaa\
-\x7f\x9bYH\x00\x809\xfcW\xfdfTC\xa9~-\
-\xda\x86\xa3/\xced(5\xe1T\xaa\xbb3\x94\x13\x0e\
-\x06\x18\xba\x88@\x88r\xb1t\x10\x98\x18\xed\xf7\xc5\x15\
-\xb7\x9b\x01\xf2\xc1)\xc5\x04\x14\xa7\x07yt\x91\x1d\x9a\
-w\x849\xf7\xd3\x8c\xf7\x84y\xde\xe9\xe5\xed^\xbf\x02\
-l(A\xfd\x22\xb0\x01\x04\x80\x95Y\xec\xab\x17\x87\x05\
-\x9a[\xd7\x91\x9e\xc0\x1ed\xd5\x0f\xc9\x0d+\xd3\x9a\xe9\
-\xba\xe4Vdwb\xd2\x05\x03\xc5\xa0L\x0f\x05\xb8\x01\
-8\x1f\xd2?\xe3\xcd -Q\xf7R\x0fX5\xb7g\
-\xc69\x08\xc8E\xcc\xe6\xa3\xd0lFa\x01\xdb\x01\xcd\
-'\x053\xa5j\xcd\xe2\xc9w\x93\xaf\xc0\xa8\x0a|\xc0\
-\xc6\xabm\xdf\x98\xb4\x07\xb7\x17\xdb\xdf\x98D4\xf8\xe5\
-__\xff\xfeO1\xf9\xb0\xd9{_\x91\xa8\x1f\xaa\xc7\
-,\xbbt\xb0-\x01|\xd5\xfd\x1eT\xc7\x12F\xf0\xa7\
-\xaf\x7f\x9e%:\xc93Jb\xd4\x14\xd1;D\x7f\xa9\
-\xfb\xd5\x92\xbf\xcc\x93\xbc\xe7H\xc7\xcak\x92\x7f\xad\xfb\
-\xd5\x92\x7f\x1d#y\xf5?\x1c`\x05\x18\
-\x00\x00\x05\xbf\
-\x00\
-\x00\x19\x83x\xda\xadXKo\xdb8\x10>'\xbfB\
-@\x0em\x02\xab~$v\x1a\xf9\xd48\xddv\x81\x0d\
-\xd0l\x8b\xed\x99\x92h\x9b\x88,\x0a\x14\x958\xbb\xc8\
-\x7f\xdf!EJ\x14E\xda\x8e[\x13H q^\x9c\
-\xc77C=\xdc\xe3\xbc\xbaE,\xf8\xef\xf4$F\xc9\
-\xe3\x8a\xd1*O\xa3\xe0l)\x7f\xf3\xd3\xd7\xd3\xd3\x07\
-E\x13E\x84\xe3\x8d\xa0,P\x9a\x92|\x15\x05\xd3b\
-\x1b\x8cG\xc5\xd6A\x17\x958\xc3\x09\xc7iOtz\
-#\x96\x8b\xa5`\xb8,\x1d\x1cq\x9aN\x97\x06\x87\xd7\
-\xda\x93\x98\xb2\x14\xb3(\x18\x83a%\xcdH\x1a\x9c!\
-,\xd6\xdc\xb0\xfa\x126G\xad4P\x9e\xd0\x5c\xc8\xdc\
- \xb6\x22y\x98\xe1%\x8f\xd4\xb9N\xd6\x98\xac\xd6\xf0\
-8\xa9\x1f\x9fI\xca\xd7\xfa\xc9\x90`{\xe6\x0at\x5c\
-\x8d\xc4\x9f\xc6E'e\x81\x12\xb99\x9e\xf6\xb9\xfd\xfe\
-\xd2\xa7?IhF\xe1lq\x06\xbb&{\x89\x0b\xc4\
-\x10\xa72\x8a\xda\xde\xb1T\xd9u\xfcL\xac\xb9>g\
-\x1d\xbe\xae#\xf2\x94$Z\x92:\x8br\x87m\xb2\xa6\
-\x8c\xa2\x9c\xe6!\xde&YU\x92'\x1c%k\x9c<\
-\xd6\xa7 \x1b\xb4\xc2QP\xb1\xec}4\x14>.\x87\
-r\xf7C\xf9\xb4:\xb7}i9\xba\xd5\xc4\xc4\xeb\x10\
-1F\x9f=B7\x92\xe4P\xa9?(\xcd\x5c\x19\x8f\
-c\xb1\x9a\x1c\x0a9-:y\x94`\xb1\xda\xfd\x98r\
-N7\x1d\x92t*\x96\x19\xe9Ki\x84Y/\x1d#\
-\xac\xd8\xb9\xa3\xa5\x0eT\x07\xd4\x08\x9d!\xa9\x02Sd\
-\x06+\xdb\x18JIU:\xa9\xa25}\xc2\x0emX\
-\xac\x1e\xb1\x8a\xe6\xa0\xf3\xd2[\xa6\xd7b\xf5dD\x1b\
-\x88c\x18\xb76\x1a<\x9c\xa1\x1c\x9c\xc5p\xce\x8d\x93\
-\xce\x1cf\xd7R\x5ci\xf0N\xe7\x81\xdc\x14i\xf0\xee\
-\xbcf\xffV\x95\xeb[\xa7\xde\x161TQ\x9d]^\
-_\x8d\xa7c7\x84$\x13\xb1l\x08\x19O\xea\x12\xf3\
-\xb8\xbcU\xeeq\xf9\xf2Z\xacV\x82\xb6\x04\xdd\xa04\
-\x9e\xf6\x84(\xaf\x0f:/\x8dj\xd3\xec\xa3\xd9l\x99\
-\x8e\xad\xdag\xab\x18\xbd\x9f\x0d\xc6\xe3\xf1`2\xba\x19\
-\x04\xa3\x0f\xa3\xab\xf3\xbej\xcd+T\xdf\x11\x94\xd1U\
-\xdfj$\x96\x0a\x0f\xc3\xf8'IW\x98\xb7\xb9\xe7t\
-\x9c \xfe\x8a\x11l\xffC\xf0\xb3\xc8\xfa\x84\x93]Q\
-Qv\x95\xfc%\x83(\x03\xc2\xec)<U+\x1e=\
-\x10\x00F\xfe\xa59GY\xb4!i\x9aa\xa3V\x14\
-\xda\xb7\xc2\xf0L,#\xb2\x0d\xa0\xda\x14B\xddw\x8e\
-xUj@qC\x07\xfe(\xd6|\x8f'\x85\xc9\xa6\
-\x1f\xebS\xcb]\x14g;\xb6\xbf0T\xacIR\xfa\
-)\xc0H\x91&\xfdX\xb5$w4y4\xf6\x0dC\
-[\x9a{D\xf2\x9f\x80\xfc\xf4\xd9\x02\xae\x0eD\x1d\xd0\
-\x81\xbc\xc2\xeaR\x19\xf8v}\xc8\x83Fb)g\xe1\
--\xff\x9c\x12.\x0a%\x03)\xfayO\x8a\xdau|\
-\xa9\xeb\xf8/\x92c%oA71\xbd\xa5\xdbcD\
-\xd9\x83\x84\xa3\xbb6\xefT\xc65P\xa2\xf5FQ\xca\
-h\x11\x82Sd\xe9\x94U\x0c\xb8\xc7\x19\xcdB\xc8o\
-\xd9\x16\xc4s\x8d\xa5\xc6fAK\x22\xcb H`\x0f\
-\x90H\xca\xb7\xf1\xd6\xca\x09O\x0a\x18\xa6\x80\x15o\xc0\
-\xe3\x1e\xb8\x0f/Z\x7f>|\x8aKh\x05\x09\xff\x13\
-&!\x95\xc6\x01\xfc\xb4I\x93\xc6\xc9)b`\x15z\
-\x99\xcb\xfdzf\x82\xa3\x85\xad\xb5\x1a\xcc2q\xc8\x9a\
-\xf4\xf5b\xd8\xd5'g\xbdm\xa8MR\xc3\x81\xa0z\
-\xf8^\x90\x1cH\x06\xa2\x22*(;\xf5,X\x86\x17\
-V\x80\xe4\x1c\x07\x5c\xbf\x9a\x0c\xaf\xad\xde\xa6\x00:\xda\
-\x8d\x0e\xe2\xef\x15\x9a6\xaa\x0a\xd5m{b\xda-O\
-\xfe\xd4\xe2}\xe9\x03\xb8\xe6\xcb\x9d^\xb2\xb8P\xa8g\
-\x85\xe7\xb46\x81\xa7\xde\xf4\xe1\xdd\xb0j\x80q\x1d\xaf\
-~i;\xf4\xb5]\xd6k\x92\x07\x84\x8eh\xb1\x8dp\
-YK\xbe\x98\x19\x9bGE\xad\xee\x97\xbf%p\x86)\
-\xbe\xd0\xf5H~)x\xb5\xed{\xe3g*\xf5F\xd0\
-A\xf4;c\x08\x09\x22\x01\xcf\x99:\x0dN\xee\xc4l\
-\x17\x88\x16p\xaf\xeaa\xe8\xc8\xed\x01\x8f\xfe.R\xbf\
-\xd9\x82\x0d\xc9\x0d\x13\x9a\xee\xde\xd8\xf0\x05\x9cW\xf8\xbb\
-\x22\x9e\x885\xdf}7\xf9A\x0a7\xbb\xba\xec\xda\xcc\
-v\xf2\x86\xdd\xbb\xb1\x1e\x86\x9f\xd7p\xb5v]\xc0\x86\
-\x17AR\x95\xa2,\x9e\xe5\xccS\x06\x00\xe3\x0b\xc2\x92\
-5b|!\x86j9s\x1d:\xdcj\xce\xcf\x9b\x82\
-\xbf\xe8Yn\xd0\x7f\xfdVy\x9f\x92\x04\xe8\xa0\x8a\xeb\
-\xa1V0r\x18gB\x04\xcd\x0d\xe2&f\x87\xb95\
-\xc8vge\xd5\xa8\xac\x97\xca\x89\xba\xc0\xb5\xb6o0\
-em0\x0c\x08p\xf6neh\xf72\x9c\xfa\x18\xa2\
-\xa8@9\xb6\x0bJ\x07\xc0\x9e-<s\xb2\xfc\xed\x9c\
-\xf4\x9b\xb6\xaa\xbe\xd5H\x11\xe1X\x85\xd5m\x18G1\
-\xcc\x07\xd2{\xd2qp\x93\xe4\xday\x1e\xa6@\xcc\xdc\
-\xf2\x82\xcem_\xf4Q\xea\x80\x0bJs\xb2\xee\xd8\xd7\
-\xf9<P\x9fE^*\x0f2\xcb\xfb\xc5\xa8\xebt\x87\
-9\x16A\xff\x06d\xc5\xc1q\x03R\x14\x07\xd9\xb9$\
-\xac\xe4]k\xfb\x19kW\x91\xeb.\xd2\x00\xb0qu\
-\xea\xa9oj\xe6\x08\xde{\x94\x03\xfe\xb1\xfe\x0d\xc9{\
-sk0\x03\xfe\xd3r!tH\xe48\xbc\xc6%O\
-c\xc1\xc0\xf3^\xb7[\xcf\xae\xd9\xcf\x0e\xc5Pu\xb2\
-\x06\x1bG\xfb\xa0g\x7fU\xba\xf8\x17us9^@\
-m\x80\xfb#\xca\x81\x0d\xbb\x1d\x93}\xc7\xb3\xbe\x15y\
-Qv\xe7\xf5\xe8\x00\xe1\xeec\xbcE\x80gt\xe9U\
-\xd1bM\xb2\xb4-\x86\xbdq\xed\xc6C\xfe\xfa9\xd3\
-t}\x8f\x16Q\xf7u\xe5\xb6\xed\xc0\x1e'\x1bV\xd9\
-\x80\x8f)\x99;\xc4\xd1\x1f$\x13X\x03M\xb5S\x14\
-\xd5&ow\xf6\xdd\xd3a\xb2\x09\x9by\xe6\xa3}\xb4\
-\xbf\xe1\xcc(kj\xcc-Lu\xc4\x86\xe9\x16\xa6\xac\
-R\xf7y\xfb\x03\xa4\x13\xf5\xfe\x07\x8c\x06|v\
+\x00\x00\x09\xe4\
+(\
+\xb5/\xfd`:Q\xd5N\x00\xeaF\xb8\x0b'0M\
+\xa3\x03\x00\x83\x1e\xfd\x8a$o\xc4\xfc\xc4\x88\xa4]R\
+T\xc9^\xfa\x93\xe6\x08\xba\xf4\x8fx\x00O\x0ckc\
+=\x18\x22\xc0\x12\xb3\x00\xa8\x00\xb1\x00\xb9\x94\x99\xfd\x83\
+\x9a\x9b\x05\x824$\x90\xc5!\xeeEt<2\xe8\xe9\
+\xe8\xbcc\x8e \x000A\xfc\xdeTZ+\x01\x80\xa4\
+`\xf9\xca\xac\xba\xb1\xa3J~\xeeo%\x89\x04\x22\x11\
+)\xdf\xeb_\xfcb\x1f[\xe0e\x8d\xdbY{\xcc\x22\
+Q\x92fe\xb5 \x16\xc8\xe0~\xd5l\x94\x06EQ\
+6\x1d\x97\xa1\xf2y\x04\xder]'\x16E!\xa0$\
+\x05\xc3\xf7DR\xe8A\xa9\x16E\x81\xce^\xff\xb16\
+\x0c\x92B\x919u6\xd51_p\x8c\x16\x92\xe2\xb5\
+]\x83K\x99\x19\x07?\x0e];\x8c+\x11dq\xad\
+|8\xeacD\xba\xbc\x0e\x9bE\xbfr\xf1\xac,)\
+\x10\xbaM)%\x84!%D\xa1\xd7\xb8\xe8\x04\xfd\x0d\
+j\xf2\x85Mf\xb1\x16\xff\x81\x9b\xcc{>\xcf\xaf\xe5\
+\x9b\x1bdRSv\xec\x84\xca\xa0\xf3u\xf0z_\xc0\
+M\xddK\xd8\xb8\xc7s\xed\xa5\x95\xca\x9e\x90I\xaa\xe9\
+H\xc9Bo\xa9\xc9DI\xb8\xe2#Y\xdaL\x09z\
+Cv\xee\xdc\xd8\xd7(\xf8e\xbf\xb3\xf7\x0a\x1bUu\
+\xaa\x87E\xea|\xe3\xa5S\xc3\xa9q7\x13>\x7f\xdd\
+\xf8\x7f\xca\xaf\x1fyd\xd34w\x07\xcb\xa37\x0d/\
+\xcb~\xe3\xe5\xfc\xfb\xc5l.\xc0\x80K\xbf\xa7\xb2|\
+mP\x84\xcfm\x0bG\x88\x9d\x95\x062T>\x824\
+:\xb8\x91\xb1\x86~JQ\xf5\xfa\xd8\x01\x07|Ho\
+\xfcE\xa5R\xef\x03\xab\xf3Y4\xe6\x032\x08l\xbd\
+\xf2Yn\x13j|\x07\xc6\xa3\xf2q\xa4MgS\x95\
+\xfb\x93\xc5\xf0\xf0<C\x06i\xc2\x03C\x8c\x93h/\
+5\x8f\x9e<S\x93i\x1d\xd7+%\x8d\xab\x99A\x95\
+\xea\x0e\x04\x94\xe4\x81\xdf\xa0_&\x9d\x9d\xf5q\x9a_\
+\xe1.\xabw\xfc\x05;\xddl\xb0\x13\x88F\xe5G\xb5\
+\xf7\x9ek\xf1@u\x9c\xb6\x0e\x06\x92\x02\xca\x92,\x9b\
+\x8dP\x1a\x9c\xcd\xb5\x8e!\x1a6\x9d>\xc8\xc1\xed8\
+;\xc5\x95\x8f\x83\xb5il\xf0Bi\x8cN\x13\x03K\
+*V\xcdG0\x0b\x87u\x81z\x8a\x1d\xf4\x87\xfe\xc0\
+_\xf8\xeelvc\x06\xf77\x991\xac\x84\x16b_\
+r\x5c\xe9\xe9\x1f'\x03H\x83\x06\xd7\x0d\x03\x06\x0b\xff\
+T*kk\x00\x04\x01\x89\x01B\xc4X\xa1:\x9b\x0f\
+\x16@\x90\xa0 \xe9=Gp\x0e75\xadE\x075\
+\xb1\xf2\x86\xce\xfd\xa2jd\xeb\xf0}3%\x7fGO\
+\xcf;\x8b\x9a\x96r\xd3\x9cJ\xca\x1e\xfbm\x01\xfc\x17\
+!\x07\x19\x02h\xde:\xb2DJ\xb4\xb6q;\x0cu\
+L\xa28<\x0eA\x10\x0f\xce\xdf\x5c\xf7\xa3\x1a\xbf\xb1\
+\x99\x10\x0dl\xc4\xb2\xacE\xc4\xf2}\xef\x08\x5c\xb8\xff\
+/Z^hd\xa0\xb6z\x0d\x7fG\xbd&\xd7\xb2B\
+m\x8d,|O\xc7oK\xde\x8d\xa3\xa4z\xa7\x8dc\
+\x94\x18\xcd\x8e\x04Qa\x99a\xb2\x0dD\x9f\xdd\xd8\x22\
+A\xe0\x1d\x1b\x1b\xddTR\xe0-\x05\x82\xe7\xa8\x22u\
+\xc5\x18*\x9a\xa4$i\x0e\x82(\x08\x02\x82LX\xd3\
+Z\xe2\x0e2@8\x88f \x8a\xa1\x10\x04I\x101\
+\x88\x18B\x94\x80\x10B\x08!\x88\x90\x91\x1a\xaaq\x1b\
+\x01\xf1\xeb\xe8\xee\xe6\x97\x0a\xd7\xb0\xf5\xa7h-\xfe\xe4\
+\xb3\xe5\x93\x0a\xb7f\xf5Y\x9bP\xc1\xb5@\x9c\x0b0\
+\xc1\x13\xa23@\xe1\xce\x17\x9f}\xcd\xd6\xe2\x5cw\x22\
+zc\x1a\x9cn\xfa\x01!\x1f\x08\xc5~\x9e\xe07\x03\
+\xf2v\xc6\xf8j\xc7]\xb9JD6\x142p\xd0\xf0\
+\x10\x11\xba\xe1w\x1c,\x99;\xbfuto\xbdz\xa2\
+\x19\x08\x9cF\x7f$~)\x0c\x10I\x8c\xf4\xb9L>\
+r\xb3\x9fM+\xf3M\xc3\x94\xd4\xbc7\xb9\xc1NC\
+U#\x199\x88\xf2\x0aH>\x9ehT\x016\xa2$\
+\xe9\x18H\x5c\xe3|\x08\x1eo<#%\x91\xd02\xe2\
+\x08\xd6\xfew\x86$\xa1,\x8b<\xb2\xcd\xdc\x1c\xcfR\
+\x94\x10\xa1\x15\x13\xf9\xf2\xb8*HGj\xfcx\xba\xdd\
+\xd4\xf0\x07\x11\xe8kB\x04X\xcfL\x81m\xfd\xda\xe7\
+\x8f(\xb4\x95\xbe\x11m\xdb\x91n\xfb\xa2l\x9d\xb6\xb4\
+\x88f\x90\x10\x07\x0d\x8d1\xa2q\x82uPT;\xb7\
+\xc4\x09`\x80\xa0\xdc\xa9\xd5\x08\x04z\xc9RN\x97\xdc\
+\x5c\xccw\xa4\x9dV\xa5i\xcf\xe6\xbd\xd5i\x08\xf3Y\
+\xeb\x93F\xb7\x91\xec\xa7\x8ejZ)a\xce5\x9bm\
+9\xfc\xe8a6\xcd\xed\xdeaQc\xd7\xf1ER\x96\
+\x9ekU\xd0\xaeH\x22U\x8b\xb5\xcd\xb6u\xf0\xb8\x9d\
+\x90v\x99\xe4e \xb4\xa5P}\xf9\x8b\x15\xd7\xd5g\
+\xb8\xad\x03\xc5\xa0\x940\x5c\x93uz\x00\xe6\xfe\x1dp\
+\x94\x80\xa1\xa84\x03t\x89\xa6[T\xda&}z\x88\
+\x1c\xd4$\x88\x90\x11`\xd0\xb5\xb4\x187\xbfE\xc8;\
+\xc0*\x06\x98\xb4\xb9\x0e\xc7/,\xfb\xd4\x85\x0a\xac\x8e\
+\x11\x84\x1fR\x0e\xa7\xddY\xc4\x87\xb5WC(\xe7\xee\
++b\xc1\x87\x0e\xdb\x1e{\x10\xe2\xa8\xa6\xd2\xfd\xd7%\
+tke\xc6=T\xbd\x9c\xd1\xdf\x17QYBn\xae\
+2\x92\x89\xa1\x1a\xb3c\xaf\xccc\xe9\x95f\xbd\xae\x80\
+\xbd\xb5n0\xd3n\xa7\x0c\xf6Y]I^\x8a\xba\xc5\
+\x12\xc1\xf5\xbd\xdel\x86\x88\xd6\x0d@\xb4(2Ag\
+\x94rqh\xe9\xe0\xe8\xff-\x10\xcb\x83\xd1\xcb:\xef\
+\xfc\xf1\x22?\x99\x0b|\xc1\xb5\xd5#BUB\x9b\x1a\
+Z3\xb8\xda\x8fL\xb2\x18\xf2\x16\x92\x85v\xfe\xceP\
+\x93l_N\xe9\xb2\xd0\xe5%\xa3\x04g3\xd1\x98B\
+\xfc\xdc\x02\xd3\x8d\x8a(p\x11\xab|X\xa0\x5c\x9dD\
+(\x7f\x96\x1a\x84\x9d\x1c\xfb\xa8\xb5\xdf\xc9/\xd4\x18o\
+\xb8\xb8\xf2\xf4\xcb\xe7\xe5Hy\xe4\x99\xbbL\xa6p\x86\
+\xdeQ\x83_\x9a\x9c\x15ji/\xa3\x19\x1c,\x12#\
+1\x0e9|c\xb7\xa9\xf3\x11\x92QC\x1d$(\x80\
+\xf5\xc7\x10\xbbd\xa4\xab\xad\x927\xb5\x22`\x906\xc7\
+\x17\xc0\xc9\xba\xb8\xba\xbeh\x90WAt\x00i\xdf'\
+\xf6p\xce\x99`h1\x09\x92\xf6#\xa5\xc2\xf4\xb8\xc9\
+\x9b~{\xbdh\x92\xb4\xf7\xe5\xe8Y\xf2\xea\x13\xe2\xf9\
+\xc8]fP\xfa?\x1f\xc1\x86;\xd9\xcc\xf3Li%\
+~\xbc\x08\x07\x90U\xb3\xc1\xda\xddEW!L\xe6k\
+\xe2\x0c2\x82wX|\x89\xc0\x86\x8b\xb5P\x0a\x9be\
+8H\x81\xe3?\xaa\xe7s\x1d\xf6ogo\x00[\x02\
+\x9e\x12G\xe7 \x82\xdb\x02\x022d.\x05\x07\xa3\x00\
+\xaa\xc0\x1a\xb3\x88(\x0a\xa4Rz\xac!(\x05\xc6\xc3\
+d\x1d\x8cL\xa6[]_\xcd!H\xc4=Ty&\
+J\xf3\xac\x22\x0c\xbfA\xbb\x19\x95\x99;x\x900\xd4\
+\xc1\xb9hT\x0aU,\x8f\xedU\x8c\xc2\x9a\xf4e\x81\
+\xf3\x09\xec\xb4\x98-4=E`\xc48>+\xfe\xb2\
+^\xf2,Z73\xae\x9c\xc2\xbd\xa63y\xe6\x9c4\
+/*\x04\x83\xd8)\x0a;\x0a\xb0\x0f\xbe\xfe9[\x17\
+\xd7\xd1|\x10%o\x09\x9dI\x9c\x1bh4/h\xfb\
+\x9e!\xddG#\x0a\xa3\x8a\x02(\xaa\x0d\xc8cf\xc4\
+\xbc\x11\xdeC\xa2\x1d\x9a\xae\xe92\x1fk\xa8\x13,\x89\
+ #]n\x19\xf6\x9f\x91\xf5\x9c\x7fa+\x027\xc9\
+\xfau\xcc!\xf7E\x1d\xa7J\x92\x9c\xe9\xa0&\xf2\xa6\
+\xc5\xa1\xdf\xcd\x8d\xcdT\xa4\x03\x82fw\xc5l\xd8'\
+f\x8f\x15\xec\xda\xb6bI\xc7=\xc0\xf9\xad\xb3Z\xd8\
+\xdd\x0e\xa9\xdc\xf9\x90\x86\xa7}\xd8\xc7\xa4\xb1\xa6m\xfc\
+\xa51\x95\xd6^\xbf4\x10\x0a\xcc\xbe\xba\xeb\xd7\xfa\x06\
+\xfd\x8f\x06\xfe\xfa\xf2G\x87\xbf\x9f\x94>\xd7q\xa5\x0b\
+\x92\x0e\xea*\xe6\x10\xcc\xcca\xbd\xfaO\xba\xf6Tg\
+\xd5`\xd0R\xb2cb\xc5\xf9\xb2h:o(\x17\x1d\
+0\x15Bc\xd3C\xccD\xb2\xf6\x91\xa5\x98\x03\x19\x8d\
+\x0c\xa1\x8c\xa3Y#\x96[\x11L\x84@\xd5\x8b\xcb\xe8\
+\xb4\xd3v'\x0eh\xcf\xf3\xde\xdb.S\x15\x8f\xce\xdd\
+\x03\x19\xa8KG\x12\x03\x8b\x16 K\xd3\x0d\x01\xe5B\
+?\x80\xbc\x97\xf9\x1e\xb1A\xbd\xd4,\xcc[\xc5Y\xce\
+d\x1cT\x22\x1f\xb1\x16.\x19\xca\x22\x07\x11\x87\x15\x92\
+\x06\xbfA(BZ\x1d\x81\xfe\xaf=\xb5\xda\x13{\x0f\
+\xd31^\xf9\x93]\xb7\xb2\xc1x\x14\x99\xd9\x89\x99\xac\
+\xd3oSiV\x8a\xd3/=q\xd5`\xd7\xd3$\x95\
+\x86\xec\x91\xb6m\xfa\x9a'\x19\xf8\xa9\xa3\x0ef\xc4\xd0\
+\x1a\x15\xaf\xb9GU\xdd\x07\x91\x82\xfd\xfet!\xf4\x17\
+\xa3K\x9a\x01c\xea*\xcc\xe7\x0d\x12h>\x88Q\x0e\
+\x82\xba\xc7\xacd\x1b\xcdi\xbfc\x15w\xfb\xf9F\x89\
+h=?\xe8b\x0c\xc6{\xe9\xc4\x9a\x95\xb2\x22Z\xed\
+\xf8H0\x97\x92\x12\xe7y\xb6\x5c\x94q~\xfb\x97~\
+o<\x84C\x01\xbc~\xf3P\x8e!\xc1\x97\xe7\x1fr\
+\xef\xb0\x17i9\xe7\xf2\x89\x01\x8b\x15\x16\xc2\x1c\xe6\xa8\
+4d\x13\x07\xe0\x8c\x94\x87'\x87\x0eN\x92LH\xee\
+i\x11\xdf\x8a\xf2t\x823\x10\x8d%\xf8\xe7\x22J\x1f\
+\xd2c\x86\xcd\x1c\xbe5\x04P\xab\xb0o\xae\xa8I\xe3\
+\xb6\x14\x96{\x8e\xdf\x93d\xe3\xd7M\x00\xf8\xcd\x90[\
+zw\xf9uD\xc7\xd5\xd4\xef\xc7:(\xfc\x88\xdf\x80\
+x6\x1bQ(V\xda\xdd\xdf\xcb\xed\x99\x1f\xf3\xba\x02\
+n\xf1\xdb/\xbf\xb1\x09\xc9\x14\xfb\x06\x00\xee=q-\
+5\xd0\x1f^\x09\xeb\x06\xe7\xf3\xc7Y\xb8\x05\xa3\xd3m\
+Q\x97X\xcb\xc3U\xd9rb\x1d\x9d\xa3\x14=\x5c\xc5\
+\xdb\xa6\x02\xf5\xd4\xf0\xacR\x0f\xbc\x0d\xb9\x9cR\x13\xd1\
+\xf7\x0c2:\xd6\x87\xfb|\xc32\xaf.\xc0\xde\xfcN\
+Z9b\xa2\x1b\x92\xa2\x82c\x9e\x9a\xcdl\xb4,\xd5\
+\xf1\xe4\x13Y\xc1\xea\xe3\xad&\x03d\xdc\x5c\x5c\xfc\xb8\
+\xd7\xac\xe5\x0bAF\xf6\xeb\xe2\xbcf\xa2\xd3!\xb8\xcd\
+f,\x8d\xcf\xec\xaf\xa4\xf0\xe2\xb2\x01*\xca\x00\x9b\x11\
+\xee\xe2\xb4RlN\xd2\xa1\xab\xe6~\x13Z\xee\xc4\x97\
+gT4@\x99\xb5V\x17e\x99!I\x03\x14\x89\xf9\
+\xa3\xb7\xaa\xf7\x91T\xfcY]0\x8e-\xa5\xb5)\x04\
+8\xbe$\xee\x06\xea\xb9\xf7\x91\xdb\x1c\x00\xac\xb7\x07\xce\
+\x8a\xb1#_\xed\x12s\x89\x134v\xf4\x98P\xcbi\
+\xcfT\xccG-3\x89F\x07\xb1\x0a^\x9d\xf5.\x1b\
+t2\x17Lf\x22\xe7\xb6(\x88\x0bV\x95\x82a[\
+\x03E+\
+\x00\x00\x05\xa3\
+(\
+\xb5/\xfd`\x83\x18\xcd,\x00\x06)y&\xf0\x92\xb8\
+\x01(e\xb0\xb2\xc0f\xdf!\xd6\x98$S4d\xf0\
+\xfcL\x15w\xc1[\x04\xa0\x1f\xf8\xa9\xba\xfc\xb08<\
+v.4n\x00s\x00k\x00r\xbe\xb6Y\x086d\
+\xac\xb1\x83\x98\x8b\xd4\xaf\xae\xf1M\xfd\xbaA,R\xd3\
+(+\x95\xea\x1d_\x93\x8a\xe2\xad \xec5\xfb \xc8\
+\x94\xab\x05\xbbE\x14\xcc*\x80\xe3\xf8\xb5\x94\x1c\xe6\xeb\
+\xbc'\x88\xc6\xe2\xdc$\xe5zDpn\xbf\xed[\xc9\
+61\x92\x9cM\xb48\x8c\x82\xec\x9cFk\x9f\x19\x8b\
+D>\x22\x18\x0d\x80\xc3\x1c\x9c\xed\x94F\xd3\x09\x12\xf1\
+p\x5c\x15&\x5c\x09\x8a\x94\xe3\x8c]W\xaa\x9f\xf2\xc2\
+@%*\x88\x9c\x07!\x9a<\x92$=\x17\x01\x9d(\
+\x97\x9c\xe6r\x89\x1e\xcb\xe4\x14A\x0d4\x13i\xd2$\
+\x8bT1\xa0\x00TrN\x0c\x04\x04l\xe2\xe5\xe1\xba\
+F\x09\xd5\x7f\x82&\x5c\x8b\x19<\xbb\x1b]19\xd9\
+\xa9\xffO\x8a\xc5Y\xfd\xdf\xd3\xb6\xd8\x0fM\xfb\xba/\
+\xac\xab\xdd\x15\xf2\x01jC\x16H\xa4\x84\x09<\x9f\x0e\
+[J-\xd6h[5\xb6\x1b\x1c\x12\x82\x8f\x07\xbd\x95\
+\x18\x0euu\x13\xc7\xda\x87\xf8\xa6\xferJ\xa0 \x90\
+8\xbe\xcd\xcf\xb2#{C\xaf\xfda\xb7i\xca\xab\x1d\
+\x14\xdb\x1dc\x9bV\xe8\xc9\xea\xccB\x8e\xa0\xbcg\xc7\
+\xf0\x9b\x8d\xf4\xb9\xdaA\xce\x80\xac\x12\x1a\xad\x17d\xe3\
+*\xaa;\xbcI\x0fV\xce\xd7\xb7\xb8\xec>\xe7\xd8b\
+O\x1fv\x07;l\xe8\xb0}\x1c/\xf9\xdb\xb5\x8c\xe1\
+\xebt\x1f~\x03\xf2jWp\xebO\xd9i\xc5\x01\x04\
+\x19Z\xd3\xf7\x1f7\xe8\xeb\x82{\x9c\x89\x9e\x8clJ\
+\xa1J\xbct\xd6P\x9c\x87kM\xd0\xa4/A\x0b5\
+2\xe6\xd6}\x7f-u\x9dp\x18\xa4\xf8)\xf4\x9b}\
+\xd8\xdcZ\xc2\xc3\xf1\xd1b\xc8\xbck\xd5\x9c3\x8e\xbc\
+\xe4l\xce>WW\xe4\x8b\xc9\xc6\xd9\xee\x00\xd9\x92\xf3\
+\xc58c\x7f\x9c\xec\x83@\xb2o\x9a\x0f\xe4\x08m\x02\
+\x81\xaa\xa8A\x1a\xa2\x99\x11I\x92$\xc3\x18A\x08\x83\
+ IR)\xa9\x07rx\x1cJ\x81\x0c\x0a#\x14\xc2\
+\x08#\x8a\x10L$\x89H\x10%\x05iAZ\x0c\xf9\
+D\xb0\xd0\xc7\xf5q7vC1\xc8Y\xa9\xc3K\x1d\
+O\xe3\xedHk5-{,+\xc3z\xc5\xb1IJ\
+88\xd2EH#\xe1\xa9\xb7m\xbfC\xda\x9d\xff\xdd\
+\x0d\x03\xa1\xac\xca\xd8F\x1f\xc4\xd5d\x9d\xc6\xa6\xfb\xab\
+#\x14\x94\x18\x066\x12i|Z\xfc\xf5\x22U\xb1\x02\
+\x95\x11\x94\xf69\x81\x1d!g\xe2\x160\xe3\x07\x9cf\
+\x86\x10~\x8c?Z\xeb*\xe8(\xd9\x9b\xe0\xcbQ\xe5\
+\xb0\x9f\x0b\xed{\xde\xf3\xd9=\x98\xf9\x9cuB\xc3x\
+\xc4\xe8k-u\xf0G\xdfl\x13X\x10\xa6Td\xeb\
+\xd2\x82\xa4~k\x19 fg\xabU)I\xf2\x88e\
+<\xa2\xa4#q\xc3\xbb\x7f\x8dt\x82F\x0b\xcb|\x9e\
+\xba\xc1\xaa~\x92\xba\x0f\xba\xa56\xc7A\xd9\x01\x14\xe9\
+\x09s\xb7@\xec\xb8@\xa3<\xf2\x99t\x1a\x9c\xcb\xd2\
+\x0e7\xba1<\x1ee\xbc}\xea`\xb32\xddW\x90\
+#\x844h\xac\x82\x1e\x17[u\x9b\xbb\xff^\xfcB\
+\xfeAj\x8f\xd0<k\x90\x9b\x13\xd3\x07\x8f\xfc\x03.\
+\xcf0l\xa5F\xc6\xd4\xc9\x02\x15G<'q\xf7\x0b\
+p\xa9\xddEaaM \xcaq\xc6{\x5cA\xe3\x0e\
+\x84\x9e\x1da\xbf(\xfb$/\xfcR\xc0x\x00\xcd\xf0\
+\x0e\xa5\x10\xf4\x93\xff\x80j\xb7\xba\x8c7\x07Q/*\
+k\x10\x1e\x85(?\x18\x99\xe8\x1c6\xf8Q\xe3HM\
+\xf2\xb6y\xbb\xc1'dDm\xa8c\x14a\x17\xff\xc7\
+U\x86\x1f\x7f\xa0\x0c\xac73\xbeI\x87[\xe3\x8d\xce\
+\x0c]rw`\xf16\xf3\xd4\x18\xb85\xb3\xaf\x10A\
+\xb4\x5c\xd2\xfeR\xfc\x19F\xcc\x8a!\x83\xd1\x8a'\x00\
+\xda\xdc\x09\x01\x1d\x07#Y\xa4\xd4\x83a\x01?|*\
+\xc4(\x96rH)}C1\xda\xb8#\x0a\xfc\x17\xa5\
+\x8b\x5c\x06t\x11\xc4\xc3\x8ej!@\xe7\x04\xcb\x09Z\
+\xa4S\xec\x86L\xa5*F\xdb\xc0\x5c\xea&p\xcbk\
+X\xc0\xbfG\x06\xe7\xb4\xfb5\xfa\x13\x9a\xfbb\x96(\
+\xdf\xf3cB2\x9b\x8eV\xd5\x92\x8e9k\x941\xfd\
+\x94\x1e\xf0P\x9b\x8c\x9e :\xd0\x0c\xf8\xbc`2\x17\
+<\xc7\x98\xc6n\xc1\x05\xf0\x9f\x0a1UKC\xa2\xd4\
+\xe7\xf6>\xb5\xbbTg\x8b[\x15vv\xa3\xdb\xca9\
+\x08g\xba\xaf\xbe\xcb\x09o\xca\xb0Y%\xf1D\x96\xbf\
+\xd8\x7f]\xf51\x02C\x8a\xcb\x06\xa8\xd0\x0a}M\x81\
+\x91ya<H\x16\xc8\x8fU#\xf8\x9aVa\xa0\x0c\
+rQ\xec\x08\xd9A\x92\x1fEF\x9b}\x9an\x02\x92\
+\xbe>\xcc0\x15\x8b2TZa\x84\xcc\xc8\xdd\x0b\x08\
+(\x8e$\xdd\x00!\xfbzx\xf9D\xcc\x17y#|\
+\x99\xd5\x93\x0f\x1e\x86\xf2d\x9e\x1a&\x1a\xe8\xe8\x13\xb9\
+\xbf\xa1oW\xfa\x01\xea\xbf\x94\xb0\x10W\x03\xe1\xf0<\
+\x22C\x0e\x0d\x93BBc\x9e\x00\xe8\xda\x9d\xa1\x02\xeb\
+\xa0\xd8\x017b\x02+k\x0dH=Z\x04\xc3\xc9\x00\
+b-x\xbc\x02\xe4\x12X\xde\x8e\xdcz;\xd9:\xa4\
+?f\xd5Y\x0d'ES\x82\x85\xe9\xf6\xc6\xd8\xeeT\
+\xe0\xe3j1\xd9\xcd\xb4\xefq\x95\xa7\x82\xb1\xa2\x7f\xa5\
+ \xacgV\xc8\x0b\xdb\x1e\x92\x0dv\x86=\x08\xd6\xc8\
+\xb1\xe4\x9f#P]\x1f\xb8zt\x9d\x15\xa5\x91\x88a\
+\x5c\xa1\x9d6\x87\xedK\x9f\x1e;\xbc\x9c\xb3\xc9\x9f\xb4\
+[S<E\x89\xf8\xe9\xcf\x86\x1dC\x98\xb0\xb2\xaf\xfd\
+\xd9S>\x93\xcd\xef\xcc0\x92\xcf\xf6C\xc8\xb1\xe1\xe0\
+\xbe7\x01\xd1\x19\xa5\x0d\x9a\x1c\x90t8\xa6\xf4\x18\xdc\
+\xcc\x8e\xd5\xa2\x01E3\xc0a\x82\x1fm\xc7\xb9\xf6\x00\
+gG\xb2\x16\x5c\xae>\x8c]\xe2\x1c\xc6\x96\xcfg\xd7\
+l[m\xd7\xbd\xe3\xc1JW\xf1\x1b\xd1\x1c\xaa\xdd\xba\
+U\x05\
 \x00\x00\x02\x86\
 <\
 svg xmlns=\x22http:\
@@ -1935,94 +1930,94 @@ qt_resource_name = b"\
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00(\x00\x01\x00\x00\x00\x01\x00\x00\x0a1\
-\x00\x00\x01\x9f\x84\xf8\x19\xeb\
+\x00\x00\x00(\x00\x04\x00\x00\x00\x01\x00\x00\x09\xe8\
+\x00\x00\x01\x9f\x94\xb730\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00)\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9fko\x966\
-\x00\x00\x03\x10\x00\x00\x00\x00\x00\x01\x00\x00P\xfc\
-\x00\x00\x01\x9d\x0b\x09*\x14\
-\x00\x00\x01\xca\x00\x00\x00\x00\x00\x01\x00\x008\xf9\
-\x00\x00\x01\x99Wh\xe0\x1e\
-\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x000\xab\
-\x00\x00\x01\x9e\xd5e\xe9[\
-\x00\x00\x04\x00\x00\x00\x00\x00\x00\x01\x00\x00e\xb9\
-\x00\x00\x01\x99=\x8c'Q\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00&\x81\
-\x00\x00\x01\x98 WLM\
-\x00\x00\x01n\x00\x00\x00\x00\x00\x01\x00\x002k\
-\x00\x00\x01\x99q\x17J\x86\
-\x00\x00\x02,\x00\x00\x00\x00\x00\x01\x00\x00>\xa2\
-\x00\x00\x01\x9a\xa7 c\xad\
-\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x00_\x96\
-\x00\x00\x01\x99=\x8c'P\
-\x00\x00\x018\x00\x00\x00\x00\x00\x01\x00\x00(;\
-\x00\x00\x01\x9b\xda\xda/\x16\
-\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x007E\
-\x00\x00\x01\x9a=6\xc3y\
-\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x00C\x97\
-\x00\x00\x01\x99edM\xdc\
-\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00\x12~\
-\x00\x00\x01\x98et\xba\x18\
-\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x1bY\
-\x00\x00\x01\x97\xf3\xcf\x83\xda\
-\x00\x00\x03^\x00\x00\x00\x00\x00\x01\x00\x00U\xac\
-\x00\x00\x01\x97\xf3\xced\x94\
-\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00H\xe9\
-\x00\x00\x01\x9b\x92\xdd\xf3g\
-\x00\x00\x02\xc8\x00\x00\x00\x00\x00\x01\x00\x00J\xb4\
-\x00\x00\x01\x99q\x17\xcd\x9f\
-\x00\x00\x02\xfc\x00\x00\x00\x00\x00\x01\x00\x00Oh\
-\x00\x00\x01\x9a9W\xe0\xf1\
-\x00\x00\x02J\x00\x00\x00\x00\x00\x01\x00\x00@\x9b\
-\x00\x00\x01\x98 W\xb5p\
-\x00\x00\x03p\x00\x00\x00\x00\x00\x01\x00\x00Y&\
-\x00\x00\x01\x9a\xa1\xc5\xcf\x10\
-\x00\x00\x03\xd4\x00\x00\x00\x00\x00\x01\x00\x00`\xf3\
-\x00\x00\x01\x9b\x96\xd6\xea$\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x19\x88\
-\x00\x00\x01\x9a\x06\x16T\xec\
-\x00\x00\x02\x14\x00\x00\x00\x00\x00\x01\x00\x00<\xb9\
-\x00\x00\x01\x9c'g9-\
-\x00\x00\x03\xa6\x00\x00\x00\x00\x00\x01\x00\x00]\xc1\
-\x00\x00\x01\x9f\x1bTD@\
-\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00$o\
-\x00\x00\x01\x9b\x96\xd6\xea$\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00cw\
-\x00\x00\x01\x9a\x06\x16T\xed\
-\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x17\xd4\
-\x00\x00\x01\x9a\x06\x16T\xed\
-\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00G\xd4\
-\x00\x00\x01\x99=\x8c'P\
-\x00\x00\x00j\x00\x00\x00\x00\x00\x01\x00\x00\x14\x04\
-\x00\x00\x01\x9d>C`(\
-\x00\x00\x01\x9e\x00\x00\x00\x00\x00\x01\x00\x005\xb0\
-\x00\x00\x01\x9b\xa7LR.\
-\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xf4\
-\x00\x00\x01\x9a=\xf5\x5c\xb6\
-\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x00M\x89\
-\x00\x00\x01\x9f\x1bTD@\
-\x00\x00\x03*\x00\x00\x00\x00\x00\x01\x00\x00R\x93\
-\x00\x00\x01\x9f\x12\xa1\xb8\xca\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x15\xbe\
-\x00\x00\x01\x9a\x06\x16T\xed\
-\x00\x00\x01\x82\x00\x00\x00\x00\x00\x01\x00\x004\x0b\
-\x00\x00\x01\x99q*\x94\xc3\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00;0\
-\x00\x00\x01\x9a9W\xe0\xf2\
-\x00\x00\x03\x8a\x00\x00\x00\x00\x00\x01\x00\x00[\xe7\
-\x00\x00\x01\x9a Kgj\
-\x00\x00\x03B\x00\x00\x00\x00\x00\x01\x00\x00S\xe6\
-\x00\x00\x01\x9a LR\x8e\
-\x00\x00\x01\xe2\x00\x00\x00\x00\x00\x01\x00\x009\xf1\
-\x00\x00\x01\x98P\x7f\x9aI\
-\x00\x00\x02f\x00\x00\x00\x00\x00\x01\x00\x00B@\
-\x00\x00\x01\x9f\x12\xa1\xb8\xca\
-\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x22\xad\
-\x00\x00\x01\x9a=\xdf>E\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00 z\
-\x00\x00\x01\x9a\x06\x16T\xec\
+\x00\x00\x00\x10\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1U\xb2\x92\xde\
+\x00\x00\x03\x10\x00\x00\x00\x00\x00\x01\x00\x00P\x97\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\xca\x00\x00\x00\x00\x00\x01\x00\x008\x94\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x000F\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x04\x00\x00\x00\x00\x00\x00\x01\x00\x00eT\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00&\x1c\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01n\x00\x00\x00\x00\x00\x01\x00\x002\x06\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02,\x00\x00\x00\x00\x00\x01\x00\x00>=\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x00_1\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x018\x00\x00\x00\x00\x00\x01\x00\x00'\xd6\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x006\xe0\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x00C2\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00\x12\x19\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xf4\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03^\x00\x00\x00\x00\x00\x01\x00\x00UG\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00H\x84\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\xc8\x00\x00\x00\x00\x00\x01\x00\x00JO\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\xfc\x00\x00\x00\x00\x00\x01\x00\x00O\x03\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02J\x00\x00\x00\x00\x00\x01\x00\x00@6\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03p\x00\x00\x00\x00\x00\x01\x00\x00X\xc1\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03\xd4\x00\x00\x00\x00\x00\x01\x00\x00`\x8e\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x19#\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\x14\x00\x00\x00\x00\x00\x01\x00\x00<T\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03\xa6\x00\x00\x00\x00\x00\x01\x00\x00]\x5c\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00$\x0a\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00c\x12\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x17o\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00Go\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00j\x00\x00\x00\x00\x00\x01\x00\x00\x13\x9f\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\x9e\x00\x00\x00\x00\x00\x01\x00\x005K\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x8f\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x00M$\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03*\x00\x00\x00\x00\x00\x01\x00\x00R.\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x15Y\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\x82\x00\x00\x00\x00\x00\x01\x00\x003\xa6\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00:\xcb\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03\x8a\x00\x00\x00\x00\x00\x01\x00\x00[\x82\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x03B\x00\x00\x00\x00\x00\x01\x00\x00S\x81\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x01\xe2\x00\x00\x00\x00\x00\x01\x00\x009\x8c\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x02f\x00\x00\x00\x00\x00\x01\x00\x00A\xdb\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x22H\
+\x00\x00\x01\x9f\x94\xb730\
+\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00 \x15\
+\x00\x00\x01\x9f\x94\xb730\
 "
 
 def qInitResources():
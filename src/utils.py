@@ -1,8 +1,9 @@
 import re
 import os
-import csv
 import json
 import gzip
+import random
+import functools
 
 __all__ = [
 	'AttrDict',
@@ -11,8 +12,12 @@ __all__ = [
 	'dict_to_str',
 	'str_to_dict',
 	'get_gxf_format',
+	'get_vcf_samples',
 	'GXFParser',
 	'color_rgb_valid',
+	'get_circos_chrom_colors',
+	'make_default_colors',
+	'make_random_colors',
 ]
 
 class AttrDict(dict):
@@ -25,12 +30,21 @@ class AttrDict(dict):
 	def __setattr__(self, attr, val):
 		self[attr] = val
 
-def save_circos_data(workdir, filename, data):
-	outfile = os.path.join(workdir, filename)
+def save_circos_data(outfile, *datas, chunk=100000):
+	#datas are iterables of formatted lines, buffer and write in blocks
+	with open(outfile, 'w', encoding='utf-8') as fw:
+		for data in datas:
+			lines = []
+
+			for line in data:
+				lines.append(line)
 
-	with open(outfile, 'a', newline='', encoding='utf-8') as fw:
-		writer = csv.writer(fw, delimiter=' ', quoting=csv.QUOTE_NONE)
-		writer.writerows(data)
+				if len(lines) >= chunk:
+					fw.write(''.join(lines))
+					lines = []
+
+			if lines:
+				fw.write(''.join(lines))
 
 def save_snail_data(workdir, filename, data):
 	outfile = os.path.join(workdir, filename)
@@ -73,6 +87,25 @@ def get_gxf_format(gxf):
 
 	return gxformat
 
+def get_vcf_samples(vcf):
+	if vcf.endswith('.gz'):
+		fp = gzip.open(vcf, 'rt')
+	else:
+		fp = open(vcf)
+
+	samples = []
+
+	with fp:
+		for line in fp:
+			if line.startswith('#CHROM'):
+				samples = line.strip().split('\t')[9:]
+				break
+
+			elif line[0] != '#':
+				break
+
+	return samples
+
 class GXFRecord:
 	def __init__(self, raw, attrs={}):
 		self.raw = raw
@@ -173,3 +206,45 @@ def color_rgb_valid(rgb):
 	return all(0 <= v <= 255 for v in map(int, match.groups()))
 
 
+
+@functools.lru_cache(maxsize=None)
+def get_circos_chrom_colors(color_file):
+	colors = {}
+
+	with open(str(color_file)) as fh:
+		for line in fh:
+			if line.startswith('chr'):
+				cols = line.strip().split('=')
+
+				if ',' in cols[1]:
+					colors[cols[0].strip().lower()] = cols[1].strip()
+
+	return colors
+
+def make_default_colors(rows, circos_colors):
+	#rows is a list of (id, chrid, label)
+	colors = []
+
+	for i, (rowid, chrid, label) in enumerate(rows, 1):
+		if label.lower() in circos_colors:
+			color = circos_colors[label.lower()]
+
+		elif chrid.lower() in circos_colors:
+			color = circos_colors[chrid.lower()]
+
+		else:
+			color = circos_colors.get('chr{}'.format(i), circos_colors['chrun'])
+
+		colors.append((color, rowid))
+
+	return colors
+
+def make_random_colors(rows):
+	colors = []
+
+	for row in rows:
+		rgb = random.getrandbits(24)
+		color = "{},{},{}".format(rgb >> 16, (rgb >> 8) & 255, rgb & 255)
+		colors.append((color, row[0]))
+
+	return colors
@@ -1,3 +1,4 @@
+import os
 import math
 
 from PySide6.QtSvg import *
@@ -12,6 +13,7 @@ from config import *
 from models import *
 from workers import *
 from backend import *
+from compute import *
 
 __all__ = [
 	'CirchartSpacerWidget',
@@ -23,6 +25,7 @@ __all__ = [
 	'CirchartCheckTableWidget',
 	'CirchartGraphicsViewWidget',
 	'CirchartGenomeWindowSize',
+	'CirchartThreadsSpin',
 	'CirchartAttributeFilters',
 	'CirchartCircosColorTable',
 	'CirchartBrowseWidget',
@@ -269,6 +272,81 @@ class CirchartFileBrowseDialog(QDialog):
 		if dlg.exec() == QDialog.Accepted:
 			return dlg.file_browse.get_path()
 
+class CirchartDataStatisticsDialog(QDialog):
+	def __init__(self, parent=None, catalog=None):
+		super().__init__(parent)
+		self.setWindowTitle("Data Statistics")
+		self.catalog = catalog
+
+		self._init_widget()
+		self._init_layout()
+
+	def sizeHint(self):
+		return QSize(500, 350)
+
+	def _init_widget(self):
+		self.tree = QTreeWidget(self)
+		self.tree.setHeaderLabels(['Field', 'Min', 'Max', 'Mean', 'Histogram'])
+		self.tree.setRootIsDecorated(False)
+
+		stats = self.catalog.stats
+
+		for field, vals in stats.get('fields', {}).items():
+			item = QTreeWidgetItem([
+				field,
+				"{:g}".format(vals['min']),
+				"{:g}".format(vals['max']),
+				"{:.4g}".format(vals['mean']),
+				' '.join(map(str, vals['hist']))
+			])
+			self.tree.addTopLevelItem(item)
+
+		for i in range(4):
+			self.tree.resizeColumnToContents(i)
+
+		self.info = QLabel(self)
+		self.info.setWordWrap(True)
+
+		infos = ["<b>Rows:</b> {}".format(self.catalog.rows)]
+
+		chroms = stats.get('chroms', [])
+		if chroms:
+			infos.append("<b>Chromosomes ({}):</b> {}".format(len(chroms), ', '.join(chroms[:50])))
+
+		features = stats.get('features', [])
+		if features:
+			infos.append("<b>Features ({}):</b> {}".format(len(features), ', '.join(features)))
+
+		self.info.setText('<br>'.join(infos))
+
+		self.btn_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+		self.btn_box.accepted.connect(self.accept)
+
+	def _init_layout(self):
+		self.main_layout = QVBoxLayout()
+		self.main_layout.addWidget(self.info)
+		self.main_layout.addWidget(self.tree)
+		self.main_layout.addWidget(self.btn_box)
+		self.setLayout(self.main_layout)
+
+	@classmethod
+	def show_statistics(cls, parent, data_type, data_id):
+		table = "{}_{}".format(data_type, data_id)
+		catalog = SqlControl.get_data_catalog(table)
+
+		if not catalog:
+			SqlControl.update_data_catalog(data_type, data_id)
+			catalog = SqlControl.get_data_catalog(table)
+
+		elif catalog.stats.get('stale'):
+			catalog = SqlControl.refresh_data_stats(table)
+
+		if not catalog:
+			return QMessageBox.warning(parent, "Warning", "No statistics for this data")
+
+		dlg = cls(parent, catalog)
+		dlg.exec()
+
 class CirchartDataTreeWidget(CirchartIOTreeWidget):
 	show_data = Signal(str, int)
 	data_removed = Signal(str)
@@ -291,11 +369,14 @@ class CirchartDataTreeWidget(CirchartIOTreeWidget):
 		rename_action.triggered.connect(self.rename_data)
 		delete_action = QAction("Delete")
 		delete_action.triggered.connect(self.delete_data)
+		stats_action = QAction("Statistics")
+		stats_action.triggered.connect(self.show_statistics)
 
 		menu = QMenu(self)
 		menu.addAction(rename_action)
 		menu.addAction(delete_action)
 		menu.addSeparator()
+		menu.addAction(stats_action)
 		menu.addAction(path_action)
 
 		menu.exec(self.mapToGlobal(pos))
@@ -329,6 +410,16 @@ class CirchartDataTreeWidget(CirchartIOTreeWidget):
 					meta_data['path'] = new_path
 					SqlControl.update_data_meta(did, meta_data)
 
+	def show_statistics(self):
+		index = self.currentIndex()
+
+		if not index.isValid():
+			return
+
+		data_id = self._model.get_id(index)
+		data_type = index.siblingAtColumn(1).data()
+		CirchartDataStatisticsDialog.show_statistics(self, data_type, data_id)
+
 	def delete_data(self):
 		index = self.currentIndex()
 
@@ -346,6 +437,16 @@ class CirchartDataTreeWidget(CirchartIOTreeWidget):
 		self._model.remove_row(index)
 		table = "{}_{}".format(data_type, data_id)
 		SqlBase.drop_table(table)
+		SqlControl.remove_data_catalog(table)
+		CirchartDataTableModel.clear_table_ids(table)
+		CirchartCircosPlotWorker.remove_exported_data(table)
+
+		if data_type == 'genome':
+			SqlControl.remove_basecounts(data_id)
+
+		elif data_type == 'annotation':
+			SqlControl.remove_gene_index(data_id)
+
 		self.data_removed.emit(table)
 
 class CirchartPlotTreeWidget(CirchartIOTreeWidget):
@@ -848,31 +949,104 @@ class CirchartGenomeWindowSize(QWidget):
 		self.fixed_radio.setChecked(True)
 		self.slide_radio = QRadioButton("Sliding window", self)
 		self.slide_radio.toggled.connect(self._on_slide_checked)
+		self.auto_radio = QRadioButton("Auto window", self)
+		self.auto_radio.toggled.connect(self._on_auto_checked)
+
+		#auto window is derived from karyotype length and track radius
+		self.genome_size = 0
+		self.chrom_num = 0
+
+		self.radius_spin = QDoubleSpinBox(self)
+		self.radius_spin.setRange(0.01, 2)
+		self.radius_spin.setSingleStep(0.05)
+		self.radius_spin.setValue(0.9)
+		self.radius_spin.setAlignment(Qt.AlignCenter)
+		self.radius_spin.valueChanged.connect(self._update_auto_window)
+
+		self.density_spin = QDoubleSpinBox(self)
+		self.density_spin.setRange(0.1, 20)
+		self.density_spin.setSingleStep(0.5)
+		self.density_spin.setValue(2)
+		self.density_spin.setAlignment(Qt.AlignCenter)
+		self.density_spin.valueChanged.connect(self._update_auto_window)
+
+		self.radius_label = QLabel("Track radius", self)
+		self.density_label = QLabel("Points per pixel", self)
+		self.auto_label = QLabel(self)
 
 		layout = QGridLayout()
 		layout.setColumnStretch(0, 1)
 		layout.setColumnStretch(2, 1)
 		layout.setContentsMargins(0, 0, 0, 0)
-		layout.addWidget(self.fixed_radio, 0, 0, 1, 2)
-		layout.addWidget(self.slide_radio, 0, 2, 1, 2)
+		layout.addWidget(self.fixed_radio, 0, 0)
+		layout.addWidget(self.slide_radio, 0, 1, 1, 2)
+		layout.addWidget(self.auto_radio, 0, 3)
 		layout.addWidget(self.win_label, 1, 0)
 		layout.addWidget(self.step_label, 1, 2)
 		layout.addWidget(self.win_spin, 2, 0)
 		layout.addWidget(self.win_unit, 2, 1)
 		layout.addWidget(self.step_spin, 2, 2)
 		layout.addWidget(self.step_unit, 2, 3)
+		layout.addWidget(self.radius_label, 3, 0)
+		layout.addWidget(self.density_label, 3, 2)
+		layout.addWidget(self.radius_spin, 4, 0, 1, 2)
+		layout.addWidget(self.density_spin, 4, 2, 1, 2)
+		layout.addWidget(self.auto_label, 5, 0, 1, 4)
 		self.setLayout(layout)
 
+		self._on_auto_checked(False)
+
 	def _on_slide_checked(self, checked):
 		self.step_label.setVisible(checked)
 		self.step_spin.setVisible(checked)
 		self.step_unit.setVisible(checked)
 
+	def _on_auto_checked(self, checked):
+		for w in [self.win_label, self.win_spin, self.win_unit]:
+			w.setVisible(not checked)
+
+		for w in [self.radius_label, self.radius_spin, self.density_label,
+			self.density_spin, self.auto_label]:
+			w.setVisible(checked)
+
+		self._update_auto_window()
+
+	def set_karyotype(self, index):
+		if index is None:
+			self.genome_size, self.chrom_num = 0, 0
+		else:
+			self.genome_size, self.chrom_num = SqlControl.get_karyotype_size(index)
+
+		self._update_auto_window()
+
+	def bind_karyotype(self, select):
+		select.currentIndexChanged.connect(lambda i: self.set_karyotype(select.currentData()))
+		self.set_karyotype(select.currentData())
+
+	def get_auto_window(self):
+		if not self.genome_size:
+			return None
+
+		return calc_auto_window(self.genome_size, self.chrom_num,
+			self.radius_spin.value(), self.density_spin.value())
+
+	def _update_auto_window(self):
+		window = self.get_auto_window()
+
+		if window is None:
+			self.auto_label.setText("Select a karyotype to calculate window size")
+		else:
+			self.auto_label.setText("Window size {:,} bp, about {:,} windows".format(
+				window, -(-self.genome_size // window)))
+
 	def get_values(self):
 		scales = [1, 1000, 1000000]
 
 		window_size = self.win_spin.value() * scales[self.win_unit.currentIndex()]
 
+		if self.auto_radio.isChecked():
+			window_size = self.get_auto_window() or window_size
+
 		if self.slide_radio.isChecked():
 			step_size = self.step_spin.value() * scales[self.step_unit.currentIndex()]
 		else:
@@ -883,6 +1057,14 @@ class CirchartGenomeWindowSize(QWidget):
 			'step': step_size
 		}
 
+class CirchartThreadsSpin(QSpinBox):
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.setMinimum(1)
+		self.setMaximum(os.cpu_count() or 1)
+		self.setValue(self.maximum())
+		self.setAlignment(Qt.AlignCenter)
+
 class CirchartCustomColorTable(QTableView):
 	def __init__(self, parent=None):
 		super().__init__(parent)
@@ -49,6 +49,11 @@ class CirchartMainWindow(QMainWindow):
 
 		self.project_file = None
 
+		#only one task runs at a time, plots are rendered in parallel
+		#when no task is running
+		self.task_pending = None
+		self.task_running = False
+
 		self.set_window_title()
 		self.setWindowIcon(QIcon(':/icons/logo.svg'))
 
@@ -63,6 +68,13 @@ class CirchartMainWindow(QMainWindow):
 		self.plot_tree.show_plot.connect(self.show_plot_image)
 		self.plot_tree.clicked.connect(self.show_plot_view)
 
+		self.render_queue = CirchartRenderQueue(self)
+		self.render_queue.error.connect(self.show_error_message)
+		self.render_queue.warning.connect(self.show_warning_message)
+		self.render_queue.success.connect(self.plot_tree.update_tree)
+		self.render_queue.result.connect(self.show_rendered_plot)
+		self.render_queue.changed.connect(self.on_render_changed)
+
 		self.stack_widget = QStackedWidget(self)
 		self.stack_widget.addWidget(self.plot_view)
 		self.stack_widget.addWidget(self.data_table)
@@ -287,10 +299,26 @@ class CirchartMainWindow(QMainWindow):
 			triggered = self.do_prepare_gcskew_data
 		)
 
+		self.prepare_comp_act = QAction("&Prepare Sequence Composition Data", self,
+			triggered = self.do_prepare_composition_data
+		)
+
+		self.prepare_gap_act = QAction("&Prepare Assembly Gap Data", self,
+			triggered = self.do_prepare_gap_data
+		)
+
 		self.prepare_pdata_act = QAction("&Prepare Density Data", self,
 			triggered = self.do_prepare_density_data
 		)
 
+		self.prepare_variant_act = QAction("&Prepare Variant Data", self,
+			triggered = self.do_prepare_variant_data
+		)
+
+		self.prepare_depth_act = QAction("&Prepare Depth Data", self,
+			triggered = self.do_prepare_depth_data
+		)
+
 		self.prepare_ldata_act = QAction("&Prepare Link Data", self,
 			triggered = self.do_prepare_link_data
 		)
@@ -420,7 +448,11 @@ class CirchartMainWindow(QMainWindow):
 		self.prepare_menu.addAction(self.prepare_band_act)
 		self.prepare_menu.addAction(self.prepare_gc_act)
 		self.prepare_menu.addAction(self.prepare_skew_act)
+		self.prepare_menu.addAction(self.prepare_comp_act)
+		self.prepare_menu.addAction(self.prepare_gap_act)
 		self.prepare_menu.addAction(self.prepare_pdata_act)
+		self.prepare_menu.addAction(self.prepare_variant_act)
+		self.prepare_menu.addAction(self.prepare_depth_act)
 		self.prepare_menu.addAction(self.prepare_ldata_act)
 		self.prepare_menu.addAction(self.prepare_tdata_act)
 
@@ -473,7 +505,11 @@ class CirchartMainWindow(QMainWindow):
 		prepare_menu.addAction(self.prepare_band_act)
 		prepare_menu.addAction(self.prepare_gc_act)
 		prepare_menu.addAction(self.prepare_skew_act)
+		prepare_menu.addAction(self.prepare_comp_act)
+		prepare_menu.addAction(self.prepare_gap_act)
 		prepare_menu.addAction(self.prepare_pdata_act)
+		prepare_menu.addAction(self.prepare_variant_act)
+		prepare_menu.addAction(self.prepare_depth_act)
 		prepare_menu.addAction(self.prepare_ldata_act)
 		prepare_menu.addAction(self.prepare_tdata_act)
 		prepare_action = QAction(QIcon(':/icons/data.svg'), "Prepare Data", self)
@@ -581,6 +617,43 @@ class CirchartMainWindow(QMainWindow):
 		self.data_tree.update_tree()
 		self.plot_tree.update_tree()
 		self.set_window_title(pfile)
+		self.resume_unfinished_jobs()
+
+	def resume_unfinished_jobs(self):
+		jobs = []
+		for job in JobJournal.get_journals(SqlBase.file):
+			worker = restore_job_worker(job)
+
+			#journal was left before its job was recorded
+			if worker is None:
+				JobJournal(job).remove()
+			else:
+				jobs.append(worker)
+
+		if not jobs:
+			return
+
+		ret = QMessageBox.question(self, "Confirmation",
+			"Found {} unfinished import or preparation job(s) in this project. "
+			"Would you like to resume from the last checkpoint?".format(len(jobs))
+		)
+
+		if ret == QMessageBox.Yes:
+			self.resume_jobs(jobs)
+		else:
+			for worker in jobs:
+				JobJournal(worker.job).remove()
+
+	def resume_jobs(self, workers):
+		if not workers:
+			return
+
+		worker = workers[0]
+		worker.signals.success.connect(self.data_tree.update_tree)
+		worker.signals.finished.connect(
+			lambda: QTimer.singleShot(0, lambda: self.resume_jobs(workers[1:]))
+		)
+		self.submit_new_worker(worker)
 
 	def do_close_project(self):
 		pass
@@ -639,15 +712,43 @@ class CirchartMainWindow(QMainWindow):
 		self.submit_new_worker(worker)
 
 	def submit_new_worker(self, worker):
-		if self.wait_spinner.running:
+		if self.task_running:
 			return QMessageBox.warning(self, "Warning", "A task is already running")
 
 		worker.signals.error.connect(self.show_error_message)
 		worker.signals.warning.connect(self.show_warning_message)
-		worker.signals.started.connect(self.wait_spinner.start)
-		worker.signals.finished.connect(self.wait_spinner.stop)
-		worker.signals.toggle.connect(self.wait_action.setVisible)
-		QThreadPool.globalInstance().start(worker)
+		worker.signals.finished.connect(self.finish_task)
+		self.task_pending = worker
+		self.task_running = True
+
+		#wait for running renders to finish
+		self.render_queue.pause()
+
+		if not self.render_queue.running:
+			self.start_task()
+
+		self.update_spinner()
+
+	def start_task(self):
+		worker, self.task_pending = self.task_pending, None
+
+		if worker is not None:
+			QThreadPool.globalInstance().start(worker)
+
+	def finish_task(self):
+		self.task_running = False
+		self.render_queue.resume()
+
+	def on_render_changed(self):
+		if not self.render_queue.running:
+			self.start_task()
+
+		self.update_spinner()
+
+	def update_spinner(self):
+		busy = self.task_running or bool(self.render_queue.running)
+		self.wait_spinner.toggle(busy)
+		self.wait_action.setVisible(busy)
 
 	def do_import_genome_annotation(self):
 		afile, _ = QFileDialog.getOpenFileName(self, "Select Genome Annotation File",
@@ -962,6 +1063,22 @@ class CirchartMainWindow(QMainWindow):
 			worker.signals.success.connect(self.data_tree.update_tree)
 			self.submit_new_worker(worker)
 
+	def do_prepare_composition_data(self):
+		params = CirchartCompositionPrepareDialog.prepare(self)
+
+		if params:
+			worker = CirchartCompositionPrepareWorker(params)
+			worker.signals.success.connect(self.data_tree.update_tree)
+			self.submit_new_worker(worker)
+
+	def do_prepare_gap_data(self):
+		params = CirchartGapPrepareDialog.prepare(self)
+
+		if params:
+			worker = CirchartGapPrepareWorker(params)
+			worker.signals.success.connect(self.data_tree.update_tree)
+			self.submit_new_worker(worker)
+
 	def do_prepare_density_data(self):
 		params = CirchartDensityPrepareDialog.prepare(self)
 
@@ -970,6 +1087,22 @@ class CirchartMainWindow(QMainWindow):
 			worker.signals.success.connect(self.data_tree.update_tree)
 			self.submit_new_worker(worker)
 
+	def do_prepare_variant_data(self):
+		params = CirchartVariantPrepareDialog.prepare(self)
+
+		if params:
+			worker = CirchartVariantPrepareWorker(params)
+			worker.signals.success.connect(self.data_tree.update_tree)
+			self.submit_new_worker(worker)
+
+	def do_prepare_depth_data(self):
+		params = CirchartDepthPrepareDialog.prepare(self)
+
+		if params:
+			worker = CirchartDepthPrepareWorker(params)
+			worker.signals.success.connect(self.data_tree.update_tree)
+			self.submit_new_worker(worker)
+
 	def do_prepare_link_data(self):
 		params = CirchartLinkPrepareDialog.prepare(self)
 
@@ -992,15 +1125,18 @@ class CirchartMainWindow(QMainWindow):
 
 	def draw_circos_plot(self, params):
 		worker = CirchartCircosPlotWorker(params)
-		worker.signals.success.connect(self.plot_tree.update_tree)
-		worker.signals.result.connect(self.show_svg_plot)
-		self.submit_new_worker(worker)
+		self.render_queue.submit(worker)
 
 	def draw_snail_plot(self, params):
 		worker = CirchartSnailPlotWorker(params)
-		worker.signals.success.connect(self.plot_tree.update_tree)
-		worker.signals.result.connect(self.show_svg_plot)
-		self.submit_new_worker(worker)
+		self.render_queue.submit(worker)
+
+	def show_rendered_plot(self, plot_id):
+		#only show the plot that is currently edited
+		widget = self.param_stack.currentWidget()
+
+		if widget.plot_id == plot_id:
+			self.show_svg_plot(plot_id)
 
 	def do_create_circos_plot(self):
 		params = CirchartCreateCircosPlotDialog.create_plot(self)
@@ -1088,7 +1224,9 @@ class CirchartMainWindow(QMainWindow):
 	def show_plot_image(self, ptype, pid):
 		worker = CirchartSvgRenderWorker({'plotid': pid})
 		worker.signals.result.connect(self.plot_view.change_render)
-		self.submit_new_worker(worker)
+
+		#only the last clicked plot is loaded
+		self.render_queue.submit(worker, 'view')
 
 		#self.plot_view.show_plot(pid)
 
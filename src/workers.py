@@ -1,5 +1,10 @@
 import os
 import csv
+import glob
+import uuid
+import shutil
+import hashlib
+import itertools
 import time
 import traceback
 import multiprocessing
@@ -12,9 +17,11 @@ from config import *
 from utils import *
 from confile import *
 from process import *
+from compute import *
 from backend import *
 
 __all__ = [
+	'restore_job_worker',
 	'CirchartImportGenomeWorker',
 	'CirchartImportAnnotationWorker',
 	'CirchartImportBandsWorker',
@@ -27,9 +34,13 @@ __all__ = [
 	'CirchartImportMummerWorker',
 	'CirchartImportJcviWorker',
 	'CirchartBandPrepareWorker',
+	'CirchartCompositionPrepareWorker',
 	'CirchartGCContentPrepareWorker',
 	'CirchartGCSkewPrepareWorker',
 	'CirchartDensityPrepareWorker',
+	'CirchartDepthPrepareWorker',
+	'CirchartVariantPrepareWorker',
+	'CirchartGapPrepareWorker',
 	'CirchartLinkPrepareWorker',
 	'CirchartTextPrepareWorker',
 	'CirchartCircosPlotWorker',
@@ -39,6 +50,7 @@ __all__ = [
 	'CirchartSnailPlotWorker',
 	'CirchartSvgRenderWorker',
 	'CirchartDataExtractWorker',
+	'CirchartRenderQueue',
 ]
 
 class CirchartWorkerSignals(QObject):
@@ -54,6 +66,11 @@ class CirchartWorkerSignals(QObject):
 	finished = Signal()
 
 class CirchartBaseWorker(QRunnable):
+	#workers run in parallel and share the single project connection,
+	#preprocess and postprocess hold this lock, database accesses in
+	#process must take it as well
+	db_lock = QRecursiveMutex()
+
 	def __init__(self, params={}):
 		super().__init__()
 		self.params = AttrDict(params)
@@ -65,6 +82,9 @@ class CirchartBaseWorker(QRunnable):
 	def process(self):
 		pass
 
+	def postprocess(self):
+		pass
+
 	def cleanup(self):
 		pass
 
@@ -72,8 +92,15 @@ class CirchartBaseWorker(QRunnable):
 		try:
 			self.signals.toggle.emit(True)
 			self.signals.started.emit()
-			self.preprocess()
+
+			with QMutexLocker(self.db_lock):
+				self.preprocess()
+
 			self.process()
+
+			with QMutexLocker(self.db_lock):
+				self.postprocess()
+
 			self.signals.stopped.emit()
 			self.signals.success.emit()
 
@@ -92,8 +119,11 @@ class CirchartBaseWorker(QRunnable):
 	def on_error_occurred(self, error):
 		self.signals.error.emit(str(error))
 
-	def make_tempdir(self):
-		self.tempdir = QTemporaryDir()
+	def make_tempdir(self, root=None):
+		if root:
+			self.tempdir = QTemporaryDir(os.path.join(root, 'temp-XXXXXX'))
+		else:
+			self.tempdir = QTemporaryDir()
 
 		if APP_DEBUG:
 			self.tempdir.setAutoRemove(False)
@@ -108,17 +138,140 @@ class CirchartBaseWorker(QRunnable):
 
 class CirchartProcessWorker(CirchartBaseWorker):
 	processor = None
+	data_type = None
+	data_index = None
+
+	#resumable jobs save results and checkpoints of finished chunks into a
+	#job journal, an interrupted job can be restarted from the last checkpoint
+	resumable = False
 
-	def __init__(self, params):
+	def __init__(self, params, job=None):
 		super().__init__(params)
 		self.queue = multiprocessing.Queue()
+		#journal file of unfinished job
+		self.job = job
+		self.journal = None
+		self.job_params = dict_to_str(params)
+		self.failed = False
 
 	def save_result(self, res):
 		pass
 
+	def save_cache(self, res):
+		pass
+
+	def add_index_data(self, index, rows):
+		#results of recorded job are kept in journal until it finishes
+		if self.journal is None:
+			SqlControl.add_index_data(self.data_type, index, rows)
+		else:
+			self.journal.add_index_data(self.data_type, index, rows)
+
+	def get_datas(self):
+		return [[None, self.data_index]]
+
+	def restore_datas(self):
+		self.data_index = self.restore_job()[0][1]
+
+	def restore_job(self):
+		self.journal = JobJournal(self.job)
+		datas = self.journal.get_job().datas
+		moved = []
+
+		#datas are lost if project was not saved after the job started
+		for data in datas:
+			key, index, name, meta = data
+			table = '{}_{}'.format(self.data_type, index)
+			res = SqlControl.get_data_by_id(index)
+
+			if res and res.type == self.data_type and SqlBase.has_table(table):
+				SqlControl.truncate_index_data(table)
+				continue
+
+			data[1] = SqlControl.add_data(name, self.data_type, meta)
+			SqlControl.create_index_table(self.data_type, data[1])
+			moved.append((index, data[1]))
+
+		#rename journal tables to new indexes in two steps to avoid clashes
+		for index, _ in moved:
+			self.journal.rename_index_table(self.data_type, index, 'r{}'.format(index))
+
+		for index, new in moved:
+			self.journal.rename_index_table(self.data_type, 'r{}'.format(index), new)
+
+		self.journal.update_datas(datas)
+		self.journal.save()
+		return [data[:2] for data in datas]
+
+	def get_marks(self):
+		#last row id of each result table in journal
+		return [
+			self.journal.get_last_rowid('{}_{}'.format(self.data_type, index))
+			for _, index in self.get_datas()
+		]
+
+	def start_job(self):
+		self.params.checkpoints = []
+		self.params.state = None
+
+		if self.journal is not None:
+			#remove rows written by the unfinished chunk
+			chunks, marks, state = self.journal.get_checkpoints()
+
+			for i, (_, index) in enumerate(self.get_datas()):
+				table = '{}_{}'.format(self.data_type, index)
+				self.journal.truncate_index_data(table, marks[i] if marks else 0)
+
+			self.journal.save()
+			self.params.checkpoints = chunks
+			self.params.state = state
+
+		#jobs of unsaved project can not be recorded
+		elif not SqlBase.in_memory:
+			self.journal = JobJournal.create(SqlBase.file)
+			self.job = self.journal.file
+
+			datas = []
+			for key, index in self.get_datas():
+				res = SqlControl.get_data_by_id(index)
+				datas.append([key, index, res.name, res.meta])
+				self.journal.create_index_table(self.data_type, index)
+
+			self.journal.set_job(self.__class__.__name__, self.job_params, datas)
+			self.journal.save()
+
+	def save_checkpoint(self, res):
+		if self.journal is None:
+			return
+
+		chunk, state = res
+		self.journal.add_checkpoint(chunk, self.get_marks(), state)
+		self.journal.save()
+
+	def finish_job(self):
+		#keep journal of failed job for resuming
+		if self.failed:
+			self.journal.close()
+			return
+
+		for _, index in self.get_datas():
+			rows = self.journal.get_index_data(self.data_type, index)
+			SqlControl.add_index_data(self.data_type, index, rows)
+
+		self.journal.remove()
+
+	def postprocess(self):
+		if self.journal is not None:
+			self.finish_job()
+
+		for _, index in self.get_datas():
+			if index is not None:
+				SqlControl.update_data_catalog(self.data_type, index)
+
 	def response(self, res):
 		match res['action']:
 			case 'error':
+				self.failed = True
 				self.signals.error.emit(res['message'])
 
 			case 'warning':
@@ -130,18 +283,30 @@ class CirchartProcessWorker(CirchartBaseWorker):
 			case 'result':
 				self.save_result(res['message'])
 
+			case 'cache':
+				self.save_cache(res['message'])
+
+			case 'checkpoint':
+				self.save_checkpoint(res['message'])
+
 			case 'finished':
 			#	self.signals.finished.emit()
 				self.queue.close()
 
 	def process(self):
+		if self.resumable:
+			with QMutexLocker(self.db_lock):
+				self.start_job()
+
 		self.runner = self.processor(self.queue, self.params)
 		self.runner.start()
 
 		while True:
 			try:
 				res = self.queue.get()
-				self.response(res)
+
+				with QMutexLocker(self.db_lock):
+					self.response(res)
 
 			except ValueError:
 				break
@@ -150,6 +315,9 @@ class CirchartImportBaseWorker(CirchartProcessWorker):
 	data_type = None
 
 	def preprocess(self):
+		if self.job is not None:
+			return self.restore_datas()
+
 		qf = QFileInfo(self.params['path'])
 		name = qf.completeBaseName()
 		meta = dict_to_str(self.params)
@@ -157,10 +325,11 @@ class CirchartImportBaseWorker(CirchartProcessWorker):
 		SqlControl.create_index_table(self.data_type, self.data_index)
 
 	def save_result(self, res):
-		SqlControl.add_index_data(self.data_type, self.data_index, res)
+		self.add_index_data(self.data_index, res)
 
 class CirchartImportGenomeWorker(CirchartImportBaseWorker):
 	processor = CirchartImportFastaProcess
+	resumable = True
 	data_type = 'genome'
 
 class CirchartImportAnnotationWorker(CirchartImportBaseWorker):
@@ -189,6 +358,7 @@ class CirchartImportJcviWorker(CirchartImportBaseWorker):
 
 class CirchartImportBandsWorker(CirchartImportBaseWorker):
 	processor = CirchartImportBandsProcess
+	resumable = True
 	data_type = 'bands'
 
 class CirchartImportVariationsWorker(CirchartImportBaseWorker):
@@ -201,6 +371,7 @@ class CirchartImportRegionsWorker(CirchartImportBaseWorker):
 
 class CirchartImportDataWorker(CirchartImportBaseWorker):
 	processor = CirchartImportDataProcess
+	resumable = True
 
 	def preprocess(self):
 		self.params['colors'] = {c.name: c.color for c in SqlControl.get_custom_colors()}
@@ -217,15 +388,25 @@ class CirchartPrepareWorker(CirchartProcessWorker):
 		objs = SqlControl.get_data_objects('karyotype', self.params.karyotype)
 
 		self.params.axes = {
-			obj.label: (obj.name, obj.end)
+			obj.label: (obj.chrid, obj.end)
 			for obj in objs if obj.type == 'chr'
 		}
 
-		self.data_index = SqlControl.add_data(self.params.dataname, self.data_type)
-		SqlControl.create_index_table(self.data_type, self.data_index)
+		if self.job is None:
+			self.create_datas()
+		else:
+			self.restore_datas()
+
+	def create_datas(self):
+		self.data_index = self.create_data(self.params.dataname)
+
+	def create_data(self, name):
+		index = SqlControl.add_data(name, self.data_type)
+		SqlControl.create_index_table(self.data_type, index)
+		return index
 
 	def save_result(self, res):
-		SqlControl.add_index_data(self.data_type, self.data_index, res)
+		self.add_index_data(self.data_index, res)
 
 class CirchartBandPrepareWorker(CirchartPrepareWorker):
 	processor = CirchartBandPrepareProcess
@@ -237,20 +418,90 @@ class CirchartBandPrepareWorker(CirchartPrepareWorker):
 		objs = SqlControl.get_data_content('bands', self.params.bands)
 		self.params.bands = list(objs)
 
-class CirchartGCContentPrepareWorker(CirchartPrepareWorker):
-	processor = CirchartGCContentPrepareProcess
+#save results into several datasets, process sends (key, rows)
+class CirchartMultiPrepareWorker(CirchartPrepareWorker):
+	def get_datanames(self):
+		return {}
+
+	def create_datas(self):
+		self.data_indexes = {
+			key: self.create_data(name)
+			for key, name in self.get_datanames().items()
+		}
+
+	def save_result(self, res):
+		key, rows = res
+		self.add_index_data(self.data_indexes[key], rows)
+
+	def get_datas(self):
+		return [[key, index] for key, index in self.data_indexes.items()]
+
+	def restore_datas(self):
+		#tuple keys are turned into lists in saved job
+		self.data_indexes = {
+			tuple(key) if isinstance(key, list) else key: index
+			for key, index in self.restore_job()
+		}
+
+class CirchartCompositionPrepareWorker(CirchartMultiPrepareWorker):
+	processor = CirchartCompositionPrepareProcess
+	resumable = True
+	metrics = None
 
 	def preprocess(self):
+		if self.metrics:
+			self.params.metrics = self.metrics
+
 		super().preprocess()
 
+		self.genome_id = self.params.genome
+		self.params.basecounts = SqlControl.get_basecounts(self.genome_id, BASECOUNT_BLOCK)
+
 		gmeta = SqlControl.get_data_meta(self.params.genome)
 		self.params['genome'] = gmeta['path']
 
-class CirchartGCSkewPrepareWorker(CirchartGCContentPrepareWorker):
-	processor = CirchartGCSkewPrepareProcess
+	def get_datanames(self):
+		#each metric is saved into its own plot data
+		metrics = self.params.metrics
+
+		if len(metrics) == 1:
+			return {metrics[0]: self.params.dataname}
+
+		return {
+			metric: "{}_{}".format(self.params.dataname, metric)
+			for metric in metrics
+		}
 
-class CirchartDensityPrepareWorker(CirchartPrepareWorker):
+	def save_cache(self, res):
+		chrom, length, counts = res
+		SqlControl.add_basecounts(self.genome_id, chrom, BASECOUNT_BLOCK, length, counts)
+
+class CirchartGCContentPrepareWorker(CirchartCompositionPrepareWorker):
+	metrics = ['gc']
+
+class CirchartGCSkewPrepareWorker(CirchartCompositionPrepareWorker):
+	metrics = ['gcskew']
+
+class CirchartGapPrepareWorker(CirchartPrepareWorker):
+	processor = CirchartGapPrepareProcess
+	resumable = True
+
+	def __init__(self, params, job=None):
+		super().__init__(params, job)
+
+		#gap regions are saved as loci data for highlights
+		if self.params.mode == 'loci':
+			self.data_type = 'locidata'
+
+	def preprocess(self):
+		super().preprocess()
+
+		gmeta = SqlControl.get_data_meta(self.params.genome)
+		self.params['genome'] = gmeta['path']
+
+class CirchartDensityPrepareWorker(CirchartMultiPrepareWorker):
 	processor = CirchartDensityPrepareProcess
+	resumable = True
 
 	def preprocess(self):
 		super().preprocess()
@@ -259,8 +510,58 @@ class CirchartDensityPrepareWorker(CirchartPrepareWorker):
 		self.params['annotfile'] = ameta['path']
 		self.params['annotformat'] = ameta.get('format', None)
 
+	def get_datanames(self):
+		#each feature track is saved into its own plot data
+		tracks = self.params.tracks
+
+		if len(tracks) == 1:
+			return {0: self.params.dataname}
+
+		names = {}
+		for i, track in enumerate(tracks):
+			name = "{}_{}".format(self.params.dataname, track['feature'])
+
+			if name in names.values():
+				name = "{}_{}".format(name, i+1)
+
+			names[i] = name
+
+		return names
+
+class CirchartVariantPrepareWorker(CirchartMultiPrepareWorker):
+	processor = CirchartVariantPrepareProcess
+	resumable = True
+
+	def preprocess(self):
+		vmeta = SqlControl.get_data_meta(self.params.variants)
+		self.params['vcffile'] = vmeta['path']
+
+		if 'het' not in self.params.metrics:
+			self.params['samples'] = []
+
+		super().preprocess()
+
+	def get_datanames(self):
+		#each metric and sample heterozygosity is saved into its own plot data
+		keys = [m for m in self.params.metrics if m != 'het']
+		names = {k: "{}_{}".format(self.params.dataname, k) for k in keys}
+
+		samples = get_vcf_samples(self.params.vcffile)
+		for s in self.params.samples:
+			names['het', s] = "{}_het_{}".format(self.params.dataname, samples[s])
+
+		if len(names) == 1:
+			return {k: self.params.dataname for k in names}
+
+		return names
+
+class CirchartDepthPrepareWorker(CirchartPrepareWorker):
+	processor = CirchartDepthPrepareProcess
+	resumable = True
+
 class CirchartLinkPrepareWorker(CirchartProcessWorker):
 	processor = CirchartLinkPrepareProcess
+	resumable = True
 	data_type = 'linkdata'
 
 	def preprocess(self):
@@ -282,15 +583,35 @@ class CirchartLinkPrepareWorker(CirchartProcessWorker):
 			rows = SqlControl.get_data_content('karyotype', self.params[k]['karyotype'])
 			self.params[k]['karyotype'] = {row[3]: row[2] for row in rows}
 
-			ameta = SqlControl.get_data_meta(self.params[k]['annotation'])
-			self.params[k]['annotation'] = ameta['path']
-			self.params[k]['annoformat'] = ameta['format']
+			sp = self.params[k]
+			sp['annotid'] = sp['annotation']
 
-		self.data_index = SqlControl.add_data(self.params.dataname, self.data_type)
-		SqlControl.create_index_table(self.data_type, self.data_index)
+			if SqlControl.has_gene_index(sp['annotid'], sp['feature'], sp['attribute']):
+				sp['genes'] = SqlControl.get_gene_index(sp['annotid'], sp['feature'], sp['attribute'])
+			else:
+				sp['genes'] = None
+
+			ameta = SqlControl.get_data_meta(sp['annotation'])
+			sp['annotation'] = ameta['path']
+			sp['annoformat'] = ameta['format']
+
+		if self.job is None:
+			self.data_index = SqlControl.add_data(self.params.dataname, self.data_type)
+			SqlControl.create_index_table(self.data_type, self.data_index)
+		else:
+			self.restore_datas()
+
+	def save_result(self, res):
+		self.add_index_data(self.data_index, res)
+
+	def save_cache(self, res):
+		k, genes = res
+		sp = self.params[k]
+		SqlControl.add_gene_index(sp['annotid'], sp['feature'], sp['attribute'], genes)
 
 class CirchartTextPrepareWorker(CirchartPrepareWorker):
 	processor = CirchartTextPrepareProcess
+	resumable = True
 	data_type = 'textdata'
 
 	def preprocess(self):
@@ -303,75 +624,324 @@ class CirchartTextPrepareWorker(CirchartPrepareWorker):
 class CirchartCircosPlotWorker(CirchartBaseWorker):
 	processor = CirchartCircosPlotProcess
 
-	def preprocess(self):
-		workdir = self.make_tempdir()
+	#workspaces are cleaned once a session, unused ones expire in days
+	cleaned_roots = set()
+	workspace_age = 30
 
-		self.params['colors'] = {c.name: c.color  for c in SqlControl.get_custom_colors()}
+	def get_track_tag(self, ptype):
+		if ptype == 'link':
+			return 'linkdata'
 
-		kmapping = {}
-		for index in self.params['general']['global']['karyotype']:
-			outfile = "karyotype{}.txt".format(index)
-			data = SqlControl.get_data_content('karyotype', index)
+		elif ptype in ['text', 'stacked']:
+			return 'textdata'
+
+		elif ptype in ['tile', 'connector', 'highlight']:
+			return 'locidata'
+
+		else:
+			return 'plotdata'
+
+	def get_band_indexes(self):
+		if self.params['ideogram']['main']['show_bands'] != 'yes':
+			return []
+
+		bds = self.params['ideogram']['main']['band_data']
+
+		if not bds:
+			return []
 
-			rows = []
-			for row in data:
-				kmapping[row[2]] = index
-				rows.append(row)
+		if isinstance(bds, int):
+			bds = [bds]
 
-			save_circos_data(workdir, outfile, rows)
+		return bds
 
-		if self.params['ideogram']['main']['show_bands'] == 'yes':
-			bds = self.params['ideogram']['main']['band_data']
+	def get_track_indexes(self, track):
+		index = self.params[track]['main']['data']
 
-			if bds:
-				if isinstance(bds, int):
-					bds = [bds]
+		if isinstance(index, int):
+			return [index]
 
-				for b in bds:
-					bdata = SqlControl.get_data_content('banddata', b)
+		return index
 
-					rows = []
-					for row in bdata:
-						rows.append(row)
+	def get_track_decimate(self, track):
+		#downsample plot track to the pixel resolution of its arc
+		ps = self.params[track]['main']
 
-					ci = rows[0][1]
+		if ps.get('decimate') != 'yes' or ps['type'] not in ['line', 'scatter', 'histogram']:
+			return None
+
+		size = 0
+		count = 0
+		for index in self.params['general']['global']['karyotype']:
+			s, c = SqlControl.get_karyotype_size(index)
+			size += s
+			count += c
 
-					if ci in kmapping:
-						ki = kmapping[ci]
-						outfile = "karyotype{}.txt".format(ki)
-						save_circos_data(workdir, outfile, rows)
+		if not count:
+			return None
+
+		if 'r0r1' in ps:
+			r0, r1 = ps['r0r1']
+		else:
+			r0, r1 = ps['r0'], ps['r1']
+
+		r0 = float(str(r0).split('r')[0])
+		r1 = float(str(r1).split('r')[0])
+		ideogram = self.params['ideogram']['main']
+		radius = ideogram['radius'] * max(r0, r1)
+		width = calc_pixel_width(size, count, radius, ideogram['spacing'])
+
+		#number of glyphs can be stacked in radial direction of track
+		height = abs(r1 - r0) * ideogram['radius'] * CIRCOS_IMAGE_RADIUS
+		cap = max(int(height / max(ps.get('glyph_size', 1), 1)), 1)
+
+		return ps['type'], width, cap
+
+	def get_render_key(self, config):
+		#hash of config and version stamps of all referenced data,
+		#data without catalog can not be stamped and is never cached
+		tables = ['karyotype_{}'.format(i)
+			for i in self.params['general']['global']['karyotype']]
+		tables.extend('banddata_{}'.format(i) for i in self.get_band_indexes())
 
 		for k in self.params:
 			if k.startswith('track'):
-				ptype = self.params[k]['main']['type']
-				index = self.params[k]['main']['data']
+				tag = self.get_track_tag(self.params[k]['main']['type'])
+				tables.extend('{}_{}'.format(tag, i) for i in self.get_track_indexes(k))
 
-				if isinstance(index, int):
-					outfile = "data{}.txt".format(index)
-					kids = [index]
-				else:
-					outfile = "data{}.txt".format('-'.join(map(str, index)))
-					kids = index
+		hasher = hashlib.sha1(config.encode())
+		hasher.update(dict_to_str(self.params['colors']).encode())
 
-				if ptype == 'link':
-					tag = 'linkdata'
+		for table in tables:
+			catalog = SqlControl.get_data_catalog(table)
 
-				elif ptype in ['text', 'stacked']:
-					tag = 'textdata'
+			if not catalog:
+				return None
 
-				elif ptype in ['tile', 'connector', 'highlight']:
-					tag = 'locidata'
+			hasher.update("{}:{}".format(table, catalog.version).encode())
 
-				else:
-					tag = 'plotdata'
+		return hasher.hexdigest()
 
-				for kid in kids:
-					data = SqlControl.get_data_content(tag, kid)
-					save_circos_data(workdir, outfile, data)
+	@staticmethod
+	def get_workspace_root():
+		#workspaces can be put on tmpfs by setting Workspace/tmpfs
+		settings = QSettings()
+		tmpfs = settings.value('Workspace/tmpfs', False, type=bool)
+
+		if tmpfs and os.path.isdir('/dev/shm'):
+			return os.path.join('/dev/shm', APP_NAME)
+
+		root = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+		return os.path.join(root, 'workspace')
+
+	def get_workspace(self):
+		#persistent directory of current project to keep exported data
+		root = self.get_workspace_root()
+		project = SqlControl.get_option('workspace')
+
+		if not project:
+			project = uuid.uuid4().hex
+			SqlControl.set_option('workspace', project)
+
+		workspace = os.path.join(root, project)
+		os.makedirs(workspace, exist_ok=True)
+
+		#mtime of workspace marks when it was last used
+		os.utime(workspace)
+
+		if root not in self.cleaned_roots:
+			self.cleaned_roots.add(root)
+			self.clean_workspaces(root, workspace)
+
+		return workspace
+
+	def clean_workspaces(self, root, workspace):
+		#remove temporary dirs left by interrupted renders, then remove
+		#workspaces of other projects unused for workspace_age days or
+		#least recently used until all fit in Workspace/limit MB
+		settings = QSettings()
+		limit = settings.value('Workspace/limit', 1024, type=int) * 1024 * 1024
+		now = time.time()
+
+		for tempdir in glob.glob(os.path.join(workspace, 'temp-*')):
+			if os.path.getmtime(tempdir) < now - 86400:
+				shutil.rmtree(tempdir, ignore_errors=True)
+
+		total = 0
+		others = []
+		for entry in os.scandir(root):
+			if not entry.is_dir():
+				continue
+
+			size = sum(
+				os.path.getsize(os.path.join(folder, f))
+				for folder, _, files in os.walk(entry.path)
+				for f in files
+			)
+			total += size
+
+			if entry.path != workspace:
+				others.append((entry.stat().st_mtime, size, entry.path))
+
+		for mtime, size, path in sorted(others):
+			if mtime >= now - self.workspace_age * 86400 and total <= limit:
+				break
+
+			shutil.rmtree(path, ignore_errors=True)
+			total -= size
+
+	@classmethod
+	def remove_exported_data(cls, table):
+		#exported files of a deleted table must never be linked again
+		files = SqlControl.remove_workspace_files(table)
+		project = SqlControl.get_option('workspace')
+
+		if not project:
+			return
+
+		workspace = os.path.join(cls.get_workspace_root(), project)
+
+		for file in files:
+			path = os.path.join(workspace, file)
+
+			if os.path.isfile(path):
+				os.remove(path)
+
+	def get_data_lines(self, parts, decimate=None):
+		if decimate is None:
+			return [SqlControl.get_circos_lines(t, i) for t, i in parts]
+
+		return [self.get_decimated_lines(t, i, decimate) for t, i in parts]
+
+	def get_decimated_lines(self, tag, index, decimate):
+		ptype, width, cap = decimate
+		rows = SqlControl.get_sorted_content(tag, index)
+
+		for _, group in itertools.groupby(rows, key=lambda r: r[0]):
+			for row in decimate_track_rows(list(group), ptype, width, cap):
+				yield "{} {} {} {} {}\n".format(*('' if c is None else c for c in row))
+
+	def export_data(self, workspace, workdir, outfile, parts, decimate=None):
+		#data file is addressed by versions of its tables, it is only
+		#rewritten when one of the tables was changed
+		target = os.path.join(workdir, outfile)
+		tables = ['{}_{}'.format(t, i) for t, i in parts]
+		stamps = []
+
+		for table in tables:
+			catalog = SqlControl.get_data_catalog(table)
+
+			if not catalog:
+				stamps = None
+				break
+
+			stamps.append(str(catalog.version))
+
+		if stamps is None:
+			save_circos_data(target, *self.get_data_lines(parts, decimate))
+			return
+
+		name = '+'.join(tables)
+		stamp = ','.join(stamps)
+
+		#decimated data also depends on the pixel resolution
+		if decimate:
+			name = "{}@{}".format(name, decimate[0])
+			stamp = "{}:{}:{}".format(stamp, decimate[1], decimate[2])
+
+		exported = SqlControl.get_workspace_file(name)
+
+		if exported and exported[0] == stamp:
+			source = os.path.join(workspace, exported[1])
+
+			if os.path.isfile(source):
+				self.link_data(source, target)
+				return
+
+		#remove the outdated files of these tables
+		for old in glob.glob(os.path.join(workspace, glob.escape(name) + '.*.txt')):
+			os.remove(old)
+
+		file = "{}.{}.txt".format(name, uuid.uuid4().hex)
+		source = os.path.join(workspace, file)
+		save_circos_data(source, *self.get_data_lines(parts, decimate))
+		SqlControl.set_workspace_file(name, stamp, file)
+		self.link_data(source, target)
+
+	def link_data(self, source, target):
+		try:
+			os.link(source, target)
+		except OSError:
+			shutil.copyfile(source, target)
+
+	def preprocess(self):
+		#data are exported holding the lock, so parallel renders also
+		#never write the same files in project workspace
+		self.params['colors'] = {c.name: c.color  for c in SqlControl.get_custom_colors()}
 
-		confile = os.path.join(workdir, 'plot.conf')
 		configer = CirchartCircosConfile(self.params)
-		configer.save_to_file(confile)
+		config = configer.to_string()
+
+		self.cached_svg = None
+		self.render_key = self.get_render_key(config)
+
+		if self.render_key:
+			self.cached_svg = SqlControl.get_render_cache(self.render_key)
+
+			if self.cached_svg is not None:
+				return
+
+		workdir = self.export_datas()
+		confile = os.path.join(workdir, 'plot.conf')
+
+		with open(confile, 'w') as fw:
+			fw.write(config)
+
+	def export_datas(self):
+		workspace = self.get_workspace()
+		workdir = self.make_tempdir(workspace)
+
+		kmapping = {}
+		kparts = {}
+		for index in self.params['general']['global']['karyotype']:
+			catalog = SqlControl.get_data_catalog("karyotype_{}".format(index))
+
+			if catalog and 'chroms' in catalog.stats:
+				chroms = catalog.stats['chroms']
+			else:
+				chroms = SqlControl.get_data_column('karyotype', index, 'chrid')
+
+			for chrid in chroms:
+				kmapping[chrid] = index
+
+			kparts[index] = [('karyotype', index)]
+
+		#bands are appended to the karyotype file they belong to
+		for b in self.get_band_indexes():
+			ci = SqlControl.get_data_first('banddata', b, 'parent')
+
+			if ci in kmapping:
+				kparts[kmapping[ci]].append(('banddata', b))
+
+		for index, parts in kparts.items():
+			outfile = "karyotype{}.txt".format(index)
+			self.export_data(workspace, workdir, outfile, parts)
+
+		for k in self.params:
+			if k.startswith('track'):
+				ptype = self.params[k]['main']['type']
+				kids = self.get_track_indexes(k)
+				outfile = "data{}.txt".format('-'.join(map(str, kids)))
+				tag = self.get_track_tag(ptype)
+				parts = [(tag, kid) for kid in kids]
+				decimate = self.get_track_decimate(k)
+
+				if decimate:
+					outfile = "data{}.{}.txt".format('-'.join(map(str, kids)), ptype)
+
+				self.export_data(workspace, workdir, outfile, parts, decimate)
+
+		return workdir
 
 	def process_error(self):
 		error_data = self.runner.readAllStandardError()
@@ -390,8 +960,51 @@ class CirchartCircosPlotWorker(CirchartBaseWorker):
 			print(out_str)
 
 	def process(self):
+		#identical plot was rendered before
+		if self.cached_svg is not None:
+			self.save_svg(self.cached_svg)
+			return
+
+		workdir = self.tempdir.path()
+		status = CirchartCircosDaemon.render(workdir)
+
+		#render server is not available, run circos directly
+		if status is None:
+			self.run_circos(workdir)
+		else:
+			self.read_logs(workdir, status)
+			self.save_result()
+
+	def read_log(self, workdir, name):
+		log_file = os.path.join(workdir, name)
+
+		if not os.path.isfile(log_file):
+			return ''
+
+		with open(log_file) as fh:
+			return fh.read()
+
+	def read_logs(self, workdir, status=0):
+		error_str = self.read_log(workdir, 'circos.err')
+		output_str = self.read_log(workdir, 'circos.out')
+
+		#circos reports most fatal errors on stdout
+		if status and not os.path.isfile(os.path.join(workdir, 'circos.svg')):
+			error_str = "Circos exited with status {}\n{}{}".format(
+				status, error_str, output_str)
+
+		if error_str:
+			self.signals.error.emit(error_str)
+
+			if APP_DEBUG:
+				print(error_str)
+
+		if APP_DEBUG:
+			print(output_str)
+
+	def run_circos(self, workdir):
 		parent = QObject()
-		self.runner = self.processor(parent, self.tempdir.path())
+		self.runner = self.processor(parent, workdir)
 		loop = QEventLoop()
 		self.runner.finished.connect(loop.quit)
 		self.runner.finished.connect(self.save_result)
@@ -411,11 +1024,20 @@ class CirchartCircosPlotWorker(CirchartBaseWorker):
 			#font_str = "Arial, Helvetica Neue, Helvetica, sans-serif"
 			#content = content.replace('CMUBright-Roman', font_str)
 
-			params = dict_to_str(self.params)
-			plotid = self.params['general']['global']['plot_id']
+			if self.render_key:
+				with QMutexLocker(self.db_lock):
+					SqlControl.add_render_cache(self.render_key, content)
+
+			self.save_svg(content)
+
+	def save_svg(self, content):
+		params = dict_to_str(self.params)
+		plotid = self.params['general']['global']['plot_id']
+
+		with QMutexLocker(self.db_lock):
 			SqlControl.update_plot(params, content, plotid)
 
-			self.signals.result.emit(plotid)
+		self.signals.result.emit(plotid)
 
 class CirchartSnailPlotWorker(CirchartProcessWorker):
 	processor = CirchartSnailPlotProcess
@@ -425,7 +1047,7 @@ class CirchartSnailPlotWorker(CirchartProcessWorker):
 		index = self.params['general']['global']['genome']
 		dname = self.params['plot']['main']['dataset_name']
 
-		data = SqlControl.get_data_content('genome', index)
+		data = list(SqlControl.get_data_content('genome', index))
 
 		ids = []
 		gcs = []
@@ -590,23 +1212,24 @@ class CirchartSnailPlotWorker(CirchartProcessWorker):
 			params = dict_to_str(self.params)
 			plotid = self.params['general']['global']['plot_id']
 			SqlControl.update_plot(params, content, plotid)
-
 			self.signals.result.emit(plotid)
 		
 class CirchartProjectSaveWorker(CirchartBaseWorker):
 	def process(self):
 		self.signals.message.emit("Saving project to {}".format(self.params['sfile']))
 		progress = 0
-		SqlBase.save()
 
-		with SqlBase.save_to_file(self.params['sfile']) as backup:
-			while not backup.done:
-				backup.step(10)
-				p = int((backup.pagecount - backup.remaining) / backup.pagecount * 100)
+		with QMutexLocker(self.db_lock):
+			SqlBase.save()
 
-				if p > progress:
-					self.signals.progress.emit(p)
-					progress = p
+			with SqlBase.save_to_file(self.params['sfile']) as backup:
+				while not backup.done:
+					backup.step(10)
+					p = int((backup.pagecount - backup.remaining) / backup.pagecount * 100)
+
+					if p > progress:
+						self.signals.progress.emit(p)
+						progress = p
 
 		self.signals.message.emit("Successfully saved project to {}".format(self.params['sfile']))
 
@@ -617,8 +1240,6 @@ class CirchartDataSaveWorker(CirchartBaseWorker):
 		sql = SqlQuery(self.params['table'])\
 			.select()
 
-		rows = SqlBase.get_rows(sql)
-
 		sep = '\t'
 		if self.params['efile'].endswith('.csv'):
 			sep = ','
@@ -626,8 +1247,9 @@ class CirchartDataSaveWorker(CirchartBaseWorker):
 		with open(self.params['efile'], 'w') as fw:
 			writer = csv.writer(fw, delimiter=sep)
 
-			for row in rows:
-				writer.writerow(row[1:])
+			with QMutexLocker(self.db_lock):
+				for row in SqlBase.get_rows(sql):
+					writer.writerow(row[1:])
 
 		self.signals.message.emit("Successfully saved data to {}".format(self.params['efile']))
 
@@ -730,7 +1352,8 @@ class CirchartSvgRenderWorker(CirchartBaseWorker):
 		QThread.msleep(10)
 		plotid = self.params['plotid']
 
-		svg_str = SqlControl.get_svg(plotid)
+		with QMutexLocker(self.db_lock):
+			svg_str = SqlControl.get_svg(plotid)
 		svg_data = QByteArray(svg_str.encode())
 		svg_render = QSvgRenderer()
 		svg_render.load(svg_data)
@@ -767,5 +1390,89 @@ class CirchartDataExtractWorker(CirchartProcessWorker):
 		if self.params.outtype.endswith('file'):
 			self.open_handle.close()
 
+def restore_job_worker(job):
+	#recreate the worker of an unfinished job from its journal
+	journal = JobJournal(job)
+	res = journal.get_job()
+	journal.close()
+
+	if res is None:
+		return
+
+	worker = globals()[res.worker]
+	return worker(str_to_dict(res.params), job)
+
+class CirchartRenderQueue(QObject):
+	#run plot workers with a limited number of threads, circos renders run
+	#in parallel while database accesses are serialized by db_lock, each
+	#key has at most one worker running and one pending, a new update
+	#replaces the pending worker of the same key
+	error = Signal(str)
+	warning = Signal(str)
+	result = Signal(object)
+	success = Signal()
+	changed = Signal()
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.pool = QThreadPool(self)
+		self.pending = {}
+		self.running = {}
+		self.paused = False
+
+	def get_limit(self):
+		settings = QSettings()
+		limit = settings.value('Render/concurrency', 0, type=int)
 
+		if limit <= 0:
+			limit = min(4, QThread.idealThreadCount())
+
+		return max(1, limit)
+
+	def submit(self, worker, key=None):
+		#renders are keyed on plot id, other plot workers use their own
+		#key and handle their results themselves
+		if key is None:
+			key = worker.params['general']['global']['plot_id']
+			worker.signals.result.connect(self.result)
+			worker.signals.success.connect(self.success)
+
+		self.pending[key] = worker
+		self.schedule()
+
+	def pause(self):
+		self.paused = True
+
+	def resume(self):
+		self.paused = False
+		self.schedule()
+
+	def schedule(self):
+		limit = self.get_limit()
+		self.pool.setMaxThreadCount(limit)
+
+		for key in list(self.pending):
+			if self.paused or len(self.running) >= limit:
+				break
+
+			if key in self.running:
+				continue
+
+			worker = self.pending.pop(key)
+			worker.signals.error.connect(self.error)
+			worker.signals.warning.connect(self.warning)
+			worker.signals.finished.connect(self.on_finished)
+			self.running[key] = worker
+			self.pool.start(worker)
+
+		self.changed.emit()
+
+	def on_finished(self):
+		signals = self.sender()
+
+		for key in self.running:
+			if self.running[key].signals is signals:
+				self.running.pop(key)
+				break
 
+		self.schedule()
@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QCoreApplication
+
+from config import *
+from backend import *
+from workers import *
+
+app = QCoreApplication.instance() or QCoreApplication([])
+
+@unittest.skipUnless((CIRCOS_PATH / 'etc').exists(), "circos is not available")
+class CatalogStatsTest(unittest.TestCase):
+	def setUp(self):
+		SqlBase.connect(':memory:')
+
+		fd, self.path = tempfile.mkstemp(suffix='.txt')
+		with os.fdopen(fd, 'w') as fh:
+			fh.write("chrom\tstart\tend\tvalue\n")
+			fh.write("chr1\t0\t100\t1.5\n")
+			fh.write("chr1\t100\t200\tNA\n")
+			fh.write("chr2\t0\t100\t3.5\n")
+
+	def tearDown(self):
+		os.remove(self.path)
+
+	def test_import_with_header_and_na(self):
+		worker = CirchartImportDataWorker({
+			'path': self.path,
+			'format': 'txt',
+			'type': 'plotdata',
+			'column': 4
+		})
+		worker.run()
+
+		self.assertFalse(worker.failed)
+
+		catalog = SqlControl.get_data_catalog('plotdata_{}'.format(worker.data_index))
+		self.assertEqual(catalog.rows, 4)
+
+		fields = catalog.stats['fields']
+		self.assertEqual(fields['value']['min'], 1.5)
+		self.assertEqual(fields['value']['max'], 3.5)
+		self.assertEqual(sum(fields['value']['hist']), 2)
+		self.assertEqual(fields['start']['max'], 100)
+		self.assertEqual(sum(fields['start']['hist']), 3)
+
+if __name__ == '__main__':
+	unittest.main()